@@ -168,3 +168,15 @@ CSRF_TRUSTED_ORIGINS = env_list(
     "CSRF_TRUSTED_ORIGINS",
     "http://localhost:5173,http://127.0.0.1:5173",
 )
+
+# ML runs
+# Wall-clock budget (seconds) of a single experiment run; 0 disables it.
+ML_EXPERIMENT_TIME_BUDGET = float(os.getenv("ML_EXPERIMENT_TIME_BUDGET", "600"))
+# Kill svm / logistic fits at the budget by running them in a forked child (RunConfig.hard_timeout).
+# Off by default: the child's copy of the fitted model costs memory, and such fits are only
+# checked against the budget once they finish. Random forests stop between growth steps either way.
+ML_EXPERIMENT_HARD_TIMEOUT = env_bool("ML_EXPERIMENT_HARD_TIMEOUT", False)
+
+# Directory fitted models are saved to (one artifact directory per run, see ml_core/artifacts.py);
+# unset disables saving.
+ML_ARTIFACT_DIR = os.getenv("ML_ARTIFACT_DIR") or None
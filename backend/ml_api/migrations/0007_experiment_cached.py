@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-17 01:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ml_api', '0006_alter_experiment_task'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experiment',
+            name='cached',
+            field=models.BooleanField(default=False),
+        ),
+    ]
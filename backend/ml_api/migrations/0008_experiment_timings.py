@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-17 02:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ml_api', '0007_experiment_cached'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experiment',
+            name='timings',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-17 03:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ml_api', '0008_experiment_timings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experiment',
+            name='memory',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
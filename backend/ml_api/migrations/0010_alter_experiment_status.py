@@ -0,0 +1,18 @@
+# Generated by Django 6.0.3 on 2026-10-17 03:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ml_api', '0009_experiment_memory'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='experiment',
+            name='status',
+            field=models.CharField(choices=[('running', 'Running'), ('finished', 'Finished'), ('failed', 'Failed'), ('timed_out', 'Timed out')], default='finished', max_length=20),
+        ),
+    ]
@@ -105,7 +105,14 @@ class Experiment(models.Model):
 
     # Results coming from run_experiment(...)
     metrics = models.JSONField(default=dict)
+    # Arrays are stored compressed (ml_core/common/encoding.py); the detail serializer decodes them
     predictions = models.JSONField(null=True, blank=True)
+    # True when the result was served from ml_core's result cache instead of a new training run
+    cached = models.BooleanField(default=False)
+    # Seconds per run stage (load, build, fit, predict, predict_proba, evaluate, total)
+    timings = models.JSONField(null=True, blank=True)
+    # Per-stage memory use in bytes (RSS deltas / peaks, traced heap peaks in precise mode)
+    memory = models.JSONField(null=True, blank=True)
 
     # Later: training_log, visualizations, etc.
     # training_log = models.JSONField(null=True, blank=True)
@@ -118,10 +125,11 @@ class Experiment(models.Model):
             ("running", "Running"),
             ("finished", "Finished"),
             ("failed", "Failed"),
+            ("timed_out", "Timed out"),
         ],
     )
 
-    # Optional path to a saved model artifact (for future /predict endpoints)
+    # Directory of the saved model artifact (see ml_core/artifacts.py); shared by cache hits of the same run
     model_path = models.CharField(max_length=512, null=True, blank=True)
 
     def __str__(self) -> str:
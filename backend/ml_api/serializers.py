@@ -1,6 +1,9 @@
+from django.utils.text import slugify
 from rest_framework import serializers
 
 from ml_api.models import Dataset, Algorithm, Experiment, AlgorithmVariant
+from ml_core.common.encoding import decode_predictions
+from ml_core.serving import DEFAULT_SCORE_CHUNK, INPUT_FORMATS, OUTPUT_FORMATS
 from django.contrib.auth.models import User
 
 
@@ -43,6 +46,38 @@ class DatasetSerializer(serializers.ModelSerializer):
         ]
 
 
+class DatasetUploadSerializer(serializers.Serializer):
+    """
+    Input payload for uploading a user CSV dataset.
+
+    The file must have a header row; the target column defaults to the last one
+    and the task is inferred from the target when not given.
+    """
+
+    file = serializers.FileField()
+    name = serializers.CharField(max_length=100)
+    code = serializers.RegexField(
+        r"^[A-Za-z0-9_][A-Za-z0-9_-]*$",
+        max_length=50,
+        required=False,
+        help_text="Dataset identifier; derived from the name when omitted.",
+    )
+    target_column = serializers.CharField(max_length=100, required=False)
+    task = serializers.ChoiceField(
+        choices=["binary_classification", "multiclass_classification", "regression"],
+        required=False,
+    )
+
+    def validate(self, attrs):
+        code = attrs.get("code") or slugify(attrs["name"]).replace("-", "_")
+        if not code:
+            raise serializers.ValidationError({"code": "Could not derive a code from the name."})
+        if Dataset.objects.filter(code=code).exists():
+            raise serializers.ValidationError({"code": f"Dataset {code!r} already exists."})
+        attrs["code"] = code
+        return attrs
+
+
 class AlgorithmVariantSerializer(serializers.ModelSerializer):
     """
     Serializer for specific variants of algorithms and hyperparameters associated with it.
@@ -130,6 +165,7 @@ class ExperimentListSerializer(serializers.ModelSerializer):
             "task",
             "created_at",
             "status",
+            "cached",
             "hyperparameters",
             "metrics",
         ]
@@ -148,6 +184,7 @@ class ExperimentDetailSerializer(serializers.ModelSerializer):
 
     dataset = DatasetSerializer(read_only=True)
     algorithm_variant = AlgorithmVariantSerializer(read_only=True)
+    predictions = serializers.SerializerMethodField()
 
     class Meta:
         model = Experiment
@@ -165,11 +202,25 @@ class ExperimentDetailSerializer(serializers.ModelSerializer):
             "include_predictions",
             "include_probabilities",
             # results
+            "cached",
             "metrics",
             "predictions",
+            "timings",
+            "memory",
         ]
 
 
+    def get_predictions(self, obj):
+        """
+        Predictions are stored compressed (see ml_core/common/encoding.py) and decoded into
+        lists here, unless the client asks for the stored form with ?predictions=compact.
+        """
+        request = self.context.get("request")
+        if request is not None and request.query_params.get("predictions") == "compact":
+            return obj.predictions
+        return decode_predictions(obj.predictions)
+
+
 class ExperimentCreateSerializer(serializers.Serializer):
     """
     Input payload for creating a new experiment.
@@ -194,6 +245,9 @@ class ExperimentCreateSerializer(serializers.Serializer):
     include_predictions = serializers.BooleanField(required=False, default=True)
     include_probabilities = serializers.BooleanField(required=False, default=False)
 
+    # Set on the response: whether the result came from the result cache
+    cached = serializers.BooleanField(read_only=True)
+
     def validate(self, attrs):
         dataset = attrs["dataset"]
         variant = attrs["algorithm_variant"]
@@ -208,3 +262,37 @@ class ExperimentCreateSerializer(serializers.Serializer):
             )
 
         return attrs
+
+
+class PredictSerializer(serializers.Serializer):
+    """
+    Input payload for scoring feature rows with an experiment's saved model.
+
+    Each row is a list of feature values in training order, or an object keyed by feature name.
+    """
+
+    rows = serializers.ListField(
+        child=serializers.JSONField(),
+        min_length=1,
+        max_length=10_000,
+    )
+    include_probabilities = serializers.BooleanField(required=False, default=True)
+
+
+class ScoreSerializer(serializers.Serializer):
+    """
+    Input payload for batch-scoring an uploaded file with an experiment's saved model.
+
+    The input format defaults to the file extension (".npy" or CSV otherwise).
+    """
+
+    file = serializers.FileField()
+    input_format = serializers.ChoiceField(choices=list(INPUT_FORMATS), required=False)
+    output_format = serializers.ChoiceField(choices=list(OUTPUT_FORMATS), required=False, default="ndjson")
+    chunk_size = serializers.IntegerField(required=False, default=DEFAULT_SCORE_CHUNK, min_value=1, max_value=100_000)
+    include_probabilities = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs):
+        if "input_format" not in attrs:
+            attrs["input_format"] = "npy" if attrs["file"].name.lower().endswith(".npy") else "csv"
+        return attrs
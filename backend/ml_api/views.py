@@ -1,22 +1,37 @@
+import io
+from itertools import chain
+
 from rest_framework.viewsets import ReadOnlyModelViewSet, ModelViewSet
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.exceptions import ValidationError
-from rest_framework import generics
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework import generics, status
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.contrib.auth.models import User
 
 from ml_api.models import Dataset, Algorithm, Experiment, AlgorithmVariant
 from ml_api.serializers import (
     UserSerializer,
     DatasetSerializer,
+    DatasetUploadSerializer,
     AlgorithmSerializer,
     AlgorithmVariantSerializer,
     AlgorithmVariantCompactSerializer,
     ExperimentListSerializer,
     ExperimentDetailSerializer,
     ExperimentCreateSerializer,
+    PredictSerializer,
+    ScoreSerializer,
 )
 
 from ml_core.runner import RunConfig, run_experiment
+from ml_core.common.cancellation import RunTimeout
+from ml_core.common.types import TaskType
+from ml_core.data_handlers.ingest import ingest_csv
+from ml_core.serving import format_csv, format_ndjson, predict as predict_rows, score_stream
 
 
 class CreateUserView(generics.CreateAPIView):
@@ -47,6 +62,51 @@ class DatasetViewSet(ReadOnlyModelViewSet):
             qs = qs.filter(task=task)
         return qs
 
+    @action(
+        detail=False,
+        methods=["post"],
+        permission_classes=[IsAuthenticated],
+        parser_classes=[MultiPartParser],
+    )
+    def upload(self, request):
+        """
+        Upload a CSV file as a new dataset: POST /api/datasets/upload/ (multipart).
+
+        The file is streamed into the ml_core dataset store chunk by chunk and then
+        registered here, so experiments can use it like the built-in datasets.
+        """
+        serializer = DatasetUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        task = data.get("task")
+        stream = io.TextIOWrapper(data["file"].file, encoding="utf-8-sig", newline="")
+        try:
+            meta = ingest_csv(
+                stream,
+                dataset_id=data["code"],
+                name=data["name"],
+                target_column=data.get("target_column"),
+                task=TaskType(task) if task else None,
+            )
+        except ValueError as e:
+            raise ValidationError({"detail": str(e)})
+        finally:
+            stream.detach()
+
+        dataset = Dataset.objects.create(
+            code=meta.id,
+            name=meta.name,
+            task=meta.task.value,
+            n_samples=meta.n_samples,
+            n_features=meta.n_features,
+            n_classes=meta.n_classes,
+            class_labels=meta.class_labels,
+            feature_names=meta.feature_names,
+            target_name=meta.target_name,
+        )
+        return Response(DatasetSerializer(dataset).data, status=status.HTTP_201_CREATED)
+
 
 class AlgorithmViewSet(ReadOnlyModelViewSet):
     """
@@ -109,11 +169,15 @@ class ExperimentViewSet(ModelViewSet):
         """
         Limit experiments to the current user and order by creation time.
         """
-        return (
+        qs = (
             Experiment.objects.filter(user=self.request.user)
             .select_related("dataset", "algorithm_variant", "algorithm_variant__algorithm")
             .order_by("-created_at")
         )
+        if self.action == "list":
+            # The list view never shows predictions; don't load the (largest) column.
+            qs = qs.defer("predictions")
+        return qs
 
     def get_serializer_class(self):
         """
@@ -125,6 +189,10 @@ class ExperimentViewSet(ModelViewSet):
             return ExperimentDetailSerializer
         if self.action == "create":
             return ExperimentCreateSerializer
+        if self.action == "predict":
+            return PredictSerializer
+        if self.action == "score":
+            return ScoreSerializer
         return ExperimentDetailSerializer
 
     def perform_create(self, serializer):
@@ -168,10 +236,22 @@ class ExperimentViewSet(ModelViewSet):
             random_state=random_state,
             include_predictions=include_predictions,
             include_probabilities=include_probabilities,
+            use_cache=True,
+            time_budget=settings.ML_EXPERIMENT_TIME_BUDGET or None,
+            hard_timeout=settings.ML_EXPERIMENT_HARD_TIMEOUT,
+            artifact_dir=settings.ML_ARTIFACT_DIR,
+            compact_predictions=True,
+            warm_start=True,
         )
 
         try:
             result = run_experiment(config)
+        except RunTimeout as e:
+            experiment.status = "timed_out"
+            experiment.timings = e.partial.get("timings")
+            experiment.memory = e.partial.get("memory")
+            experiment.save(update_fields=["status", "timings", "memory"])
+            raise ValidationError({"detail": str(e)})
         except ValueError as e:
             experiment.status = "failed"
             experiment.save(update_fields=["status"])
@@ -184,11 +264,70 @@ class ExperimentViewSet(ModelViewSet):
         # 3. Persist results
         experiment.metrics = result.get("metrics", {})
         experiment.predictions = result.get("predictions")
+        experiment.cached = result.get("cached", False)
+        experiment.timings = result.get("timings")
+        experiment.memory = result.get("memory")
+        experiment.model_path = (result.get("artifact") or {}).get("path")
         experiment.status = "finished"
         experiment.save()
 
         # 4. Return full detail representation
         serializer.instance = experiment
 
+    @action(detail=True, methods=["post"])
+    def predict(self, request, pk=None):
+        """
+        Score feature rows with the experiment's saved model: POST /api/experiments/<id>/predict/.
 
+        Models are kept deserialized in a per-process LRU cache (ml_core.serving),
+        so only the first request for a model reads it from disk.
+        """
+        experiment = self.get_object()
+        if not experiment.model_path:
+            raise ValidationError({"detail": "This experiment has no saved model."})
 
+        serializer = PredictSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            result = predict_rows(experiment.model_path, data["rows"], data["include_probabilities"])
+        except ValueError as e:
+            raise ValidationError({"detail": str(e)})
+        return Response(result)
+
+    @action(detail=True, methods=["post"], parser_classes=[MultiPartParser])
+    def score(self, request, pk=None):
+        """
+        Batch-score an uploaded CSV or .npy file with the experiment's saved model:
+        POST /api/experiments/<id>/score/ (multipart).
+
+        The file is read and scored chunk by chunk and the predictions are streamed back
+        as NDJSON or CSV, so memory use does not grow with the file. Input errors in the
+        first chunk (header, columns, shape) give a 400; later ones cut the stream short.
+        """
+        experiment = self.get_object()
+        if not experiment.model_path:
+            raise ValidationError({"detail": "This experiment has no saved model."})
+
+        serializer = ScoreSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        scored = score_stream(
+            experiment.model_path,
+            data["file"].file,
+            input_format=data["input_format"],
+            chunk_size=data["chunk_size"],
+            include_probabilities=data["include_probabilities"],
+        )
+        if data["output_format"] == "csv":
+            body, content_type = format_csv(scored), "text/csv"
+        else:
+            body, content_type = format_ndjson(scored), "application/x-ndjson"
+
+        try:
+            first = next(body, "")
+        except ValueError as e:
+            raise ValidationError({"detail": str(e)})
+        return StreamingHttpResponse(chain([first], body), content_type=content_type)
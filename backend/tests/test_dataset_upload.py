@@ -0,0 +1,53 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from ml_api.models import Dataset
+
+
+CSV = b"a,b,label\n1.0,2.0,yes\n2.0,1.0,no\n3.0,0.5,yes\n0.5,3.0,no\n"
+
+
+@pytest.fixture
+def dataset_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_dataset_upload_requires_auth(api_client, dataset_store):
+    upload = SimpleUploadedFile("data.csv", CSV, content_type="text/csv")
+    res = api_client.post("/api/datasets/upload/", {"file": upload, "name": "Mine"}, format="multipart")
+    assert res.status_code == 401
+
+
+@pytest.mark.django_db
+def test_dataset_upload_creates_dataset(auth_client, dataset_store):
+    upload = SimpleUploadedFile("data.csv", CSV, content_type="text/csv")
+
+    res = auth_client.post(
+        "/api/datasets/upload/",
+        {"file": upload, "name": "My Data"},
+        format="multipart",
+    )
+
+    assert res.status_code == 201
+    body = res.json()
+    assert body["code"] == "my_data"
+    assert body["task"] == "binary_classification"
+    assert body["n_samples"] == 4
+    assert body["n_features"] == 2
+    assert body["class_labels"] == ["no", "yes"]
+
+    assert Dataset.objects.filter(code="my_data").exists()
+    assert (dataset_store / "my_data" / "X.npy").is_file()
+
+
+@pytest.mark.django_db
+def test_dataset_upload_invalid_csv_returns_400(auth_client, dataset_store):
+    upload = SimpleUploadedFile("data.csv", b"a,label\n1,yes\n2\n", content_type="text/csv")
+
+    res = auth_client.post("/api/datasets/upload/", {"file": upload, "name": "Broken"}, format="multipart")
+
+    assert res.status_code == 400
+    assert "fields" in res.json()["detail"]
+    assert not Dataset.objects.filter(code="broken").exists()
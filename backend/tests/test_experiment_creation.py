@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch
 
 from ml_api.models import Experiment
+from ml_core.common.cancellation import RunTimeout
 
 
 @pytest.mark.django_db
@@ -36,6 +37,8 @@ def test_create_experiment_success(auth_client, user, dataset_iris, algo_svm, va
     runner_result = {
         "metrics": {"accuracy": 0.93},
         "predictions": {"y_true": [0, 1], "y_pred": [0, 1]},
+        "timings": {"load": 0.01, "fit": 0.2, "total": 0.25},
+        "memory": {"mode": "sampled", "rss_peak": 1000, "stages": {"fit": {"rss_delta": 10}}},
     }
 
     payload = {
@@ -63,6 +66,8 @@ def test_create_experiment_success(auth_client, user, dataset_iris, algo_svm, va
     assert exp.status == "finished"
     assert exp.metrics == runner_result["metrics"]
     assert exp.predictions == runner_result["predictions"]
+    assert exp.timings == runner_result["timings"]
+    assert exp.memory == runner_result["memory"]
 
     assert exp.test_size == payload["test_size"]
     assert exp.random_state == payload["random_state"]
@@ -70,6 +75,40 @@ def test_create_experiment_success(auth_client, user, dataset_iris, algo_svm, va
     assert exp.include_probabilities == payload["include_probabilities"]
 
 
+@pytest.mark.django_db
+def test_create_experiment_marks_cached_results(auth_client, user, dataset_iris, algo_svm, variant_svc):
+    """
+    Results served from ml_core's result cache are flagged on the Experiment and in the response.
+    """
+    runner_result = {"metrics": {"accuracy": 0.93}, "predictions": None, "cached": True}
+    payload = {"dataset": dataset_iris.id, "algorithm_variant": variant_svc.id}
+
+    with patch("ml_api.views.run_experiment", return_value=runner_result) as mocked_runner:
+        res = auth_client.post("/api/experiments/", payload, format="json")
+
+    assert res.status_code == 201
+    assert res.json()["cached"] is True
+    assert mocked_runner.call_args.args[0].use_cache is True
+    assert Experiment.objects.get(user=user).cached is True
+
+
+@pytest.mark.django_db
+def test_create_experiment_records_model_path(auth_client, user, dataset_iris, algo_svm, variant_svc, settings):
+    """
+    The saved model artifact's path is stored on the experiment.
+    """
+    settings.ML_ARTIFACT_DIR = "/tmp/artifacts"
+    runner_result = {"metrics": {}, "artifact": {"id": "abc", "path": "/tmp/artifacts/abc", "format": "joblib"}}
+    payload = {"dataset": dataset_iris.id, "algorithm_variant": variant_svc.id}
+
+    with patch("ml_api.views.run_experiment", return_value=runner_result) as mocked_runner:
+        res = auth_client.post("/api/experiments/", payload, format="json")
+
+    assert res.status_code == 201
+    assert mocked_runner.call_args.args[0].artifact_dir == "/tmp/artifacts"
+    assert Experiment.objects.get(user=user).model_path == "/tmp/artifacts/abc"
+
+
 @pytest.mark.django_db
 def test_create_experiment_error(auth_client, user, dataset_iris, algo_svm, variant_svc):
     """
@@ -105,6 +144,27 @@ def test_create_experiment_error(auth_client, user, dataset_iris, algo_svm, vari
     assert exp.predictions is None
 
 
+@pytest.mark.django_db
+def test_create_experiment_timeout(auth_client, user, dataset_iris, algo_svm, variant_svc):
+    """
+    A run over its time budget ends with status=timed_out and keeps the partial timings.
+    """
+    payload = {"dataset": dataset_iris.id, "algorithm_variant": variant_svc.id}
+    error = RunTimeout("Run exceeded its time budget of 1s during fit.", {"stage": "fit", "timings": {"load": 0.1}})
+
+    with patch("ml_api.views.run_experiment", side_effect=error) as mocked_runner:
+        res = auth_client.post("/api/experiments/", payload, format="json")
+
+    assert res.status_code == 400
+    assert "time budget" in res.json()["detail"]
+    assert mocked_runner.call_args.args[0].time_budget > 0
+    assert mocked_runner.call_args.args[0].hard_timeout is False  # no forked fits unless opted in
+
+    exp = Experiment.objects.get(user=user)
+    assert exp.status == "timed_out"
+    assert exp.timings == {"load": 0.1}
+
+
 @pytest.mark.django_db
 def test_experiments_create_invalid_fk_ids_returns_400(auth_client):
     """
@@ -130,3 +190,21 @@ def test_experiments_create_invalid_fk_ids_returns_400(auth_client):
         assert isinstance(data["dataset"], list) and len(data["dataset"]) > 0
     if "algorithm_variant" in data:
         assert isinstance(data["algorithm_variant"], list) and len(data["algorithm_variant"]) > 0
+
+
+@pytest.mark.django_db
+def test_experiment_create_stores_compact_predictions(auth_client, user, dataset_iris, variant_svc):
+    payload = {"dataset": dataset_iris.id, "algorithm_variant": variant_svc.id}
+    with patch("ml_api.views.run_experiment", return_value={"metrics": {}}) as mocked_runner:
+        auth_client.post("/api/experiments/", payload, format="json")
+
+    assert mocked_runner.call_args.args[0].compact_predictions is True
+
+
+@pytest.mark.django_db
+def test_experiment_create_continues_smaller_budget_fits(auth_client, user, dataset_iris, variant_svc):
+    payload = {"dataset": dataset_iris.id, "algorithm_variant": variant_svc.id}
+    with patch("ml_api.views.run_experiment", return_value={"metrics": {}}) as mocked_runner:
+        auth_client.post("/api/experiments/", payload, format="json")
+
+    assert mocked_runner.call_args.args[0].warm_start is True
@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 from ml_api.models import Experiment
+from ml_core.common.encoding import encode_array
 
 def test_experiment_detail_access_for_owner(auth_client, auth_client2, user, dataset_diabetes, make_experiment):
     exp_user1 = make_experiment(user=user, dataset=dataset_diabetes, metrics={"accuracy": 0.9})
@@ -25,3 +27,16 @@ def test_experiment_detail_delete_only_owner(auth_client, auth_client2, user, da
     assert res.status_code == 204
     assert not Experiment.objects.filter(id=exp_user1.id).exists()
 
+
+
+@pytest.mark.django_db
+def test_experiment_detail_decodes_compact_predictions(auth_client, user, dataset_diabetes, make_experiment):
+    stored = {"y_true": encode_array(np.array([1.5, 2.0])), "y_pred": encode_array(np.array([1.0, 2.5]))}
+    exp = make_experiment(user=user, dataset=dataset_diabetes, predictions=stored)
+
+    res = auth_client.get(f"/api/experiments/{exp.id}/")
+    res_compact = auth_client.get(f"/api/experiments/{exp.id}/?predictions=compact")
+
+    assert res.json()["predictions"] == {"y_true": [1.5, 2.0], "y_pred": [1.0, 2.5]}
+    assert res_compact.json()["predictions"] == stored
+
@@ -0,0 +1,108 @@
+import io
+import json
+
+import numpy as np
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from ml_core.runner import RunConfig, run_experiment
+
+
+@pytest.fixture
+def iris_artifact(tmp_path):
+    result = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", artifact_dir=str(tmp_path)))
+    return result["artifact"]["path"]
+
+
+@pytest.mark.django_db
+def test_predict_scores_rows_with_the_saved_model(auth_client, user, dataset_iris, make_experiment, iris_artifact):
+    exp = make_experiment(user=user, dataset=dataset_iris)
+    exp.model_path = iris_artifact
+    exp.save()
+
+    res = auth_client.post(
+        f"/api/experiments/{exp.id}/predict/",
+        {"rows": [[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 5.2, 2.3]], "include_probabilities": False},
+        format="json",
+    )
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["predictions"] == [0, 2]
+    assert body["labels"] == ["setosa", "virginica"]
+    assert "probabilities" not in body
+
+
+@pytest.mark.django_db
+def test_predict_rejects_bad_rows(auth_client, user, dataset_iris, make_experiment, iris_artifact):
+    exp = make_experiment(user=user, dataset=dataset_iris)
+    exp.model_path = iris_artifact
+    exp.save()
+
+    res = auth_client.post(f"/api/experiments/{exp.id}/predict/", {"rows": [[1.0, 2.0]]}, format="json")
+
+    assert res.status_code == 400
+    assert "4 features" in res.json()["detail"]
+
+
+@pytest.mark.django_db
+def test_predict_requires_a_saved_model(auth_client, user, dataset_iris, make_experiment):
+    exp = make_experiment(user=user, dataset=dataset_iris)
+
+    res = auth_client.post(f"/api/experiments/{exp.id}/predict/", {"rows": [[1, 2, 3, 4]]}, format="json")
+
+    assert res.status_code == 400
+    assert "no saved model" in res.json()["detail"]
+
+
+@pytest.mark.django_db
+def test_predict_only_for_owner(auth_client2, user, dataset_iris, make_experiment, iris_artifact):
+    exp = make_experiment(user=user, dataset=dataset_iris)
+    exp.model_path = iris_artifact
+    exp.save()
+
+    res = auth_client2.post(f"/api/experiments/{exp.id}/predict/", {"rows": [[1, 2, 3, 4]]}, format="json")
+
+    assert res.status_code == 404
+
+
+def _score(client, exp, content, name="rows.csv", **fields):
+    upload = SimpleUploadedFile(name, content)
+    return client.post(f"/api/experiments/{exp.id}/score/", {"file": upload, **fields}, format="multipart")
+
+
+@pytest.mark.django_db
+def test_score_streams_ndjson(auth_client, user, dataset_iris, make_experiment, iris_artifact):
+    exp = make_experiment(user=user, dataset=dataset_iris, model_path=iris_artifact)
+    csv_rows = b"sepal length (cm),sepal width (cm),petal length (cm),petal width (cm)\n" + b"5.1,3.5,1.4,0.2\n" * 5
+
+    res = _score(auth_client, exp, csv_rows, chunk_size=2)
+
+    assert res.status_code == 200
+    assert res["Content-Type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in b"".join(res.streaming_content).splitlines()]
+    assert [r["row"] for r in records] == [0, 1, 2, 3, 4]
+    assert all(r["label"] == "setosa" and "probabilities" not in r for r in records)
+
+
+@pytest.mark.django_db
+def test_score_npy_as_csv(auth_client, user, dataset_iris, make_experiment, iris_artifact):
+    exp = make_experiment(user=user, dataset=dataset_iris, model_path=iris_artifact)
+    buffer = io.BytesIO()
+    np.save(buffer, np.array([[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 5.2, 2.3]]))
+
+    res = _score(auth_client, exp, buffer.getvalue(), name="rows.npy", output_format="csv")
+
+    assert res.status_code == 200
+    lines = b"".join(res.streaming_content).decode().splitlines()
+    assert lines == ["row,prediction,label", "0,0,setosa", "1,2,virginica"]
+
+
+@pytest.mark.django_db
+def test_score_rejects_mismatched_input(auth_client, user, dataset_iris, make_experiment, iris_artifact):
+    exp = make_experiment(user=user, dataset=dataset_iris, model_path=iris_artifact)
+
+    res = _score(auth_client, exp, b"a,b\n1,2\n")
+
+    assert res.status_code == 400
+    assert "feature columns" in res.json()["detail"]
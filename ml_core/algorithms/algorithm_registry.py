@@ -23,6 +23,10 @@ class AlgorithmVariant:
     factory: ModelFactory
     hyperparams: List[HyperparameterSpec]
 
+    # Hyperparameter that scales training cost roughly linearly (trees, epochs), if any.
+    # Multi-fidelity tuners (tuning/halving.py) train cheap configs by lowering it.
+    budget_param: Optional[str] = None
+
     def supports(self, task: TaskType) -> bool:
         return task in self.supported_tasks
 
@@ -61,12 +61,14 @@ RF_DEFINITION = AlgorithmDefinition(
             supported_tasks=[TaskType.BINARY, TaskType.MULTICLASS],
             factory=rf_classifier_factory,
             hyperparams=rf_base_specs() + rf_classification_specs(),
+            budget_param="n_estimators",
         ),
         AlgorithmVariant(
             code="rf_regressor",
             supported_tasks=[TaskType.REGRESSION],
             factory=rf_regressor_factory,
             hyperparams=rf_base_specs() + rf_regression_specs(),
+            budget_param="n_estimators",
         ),
     ],
 )
@@ -83,12 +85,14 @@ XGB_DEFINITION = AlgorithmDefinition(
             supported_tasks=[TaskType.BINARY, TaskType.MULTICLASS],
             factory=xgb_classifier_factory,
             hyperparams=xgb_base_specs(),
+            budget_param="n_estimators",
         ),
         AlgorithmVariant(
             code="xgb_regressor",
             supported_tasks=[TaskType.REGRESSION],
             factory=xgb_regressor_factory,
             hyperparams=xgb_base_specs(),
+            budget_param="n_estimators",
         ),
     ],
 )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import math
+from typing import Any, Callable, Dict, List, Optional
 
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 
@@ -16,6 +17,39 @@ def rf_regressor_factory(params: Dict[str, Any]):
     return RandomForestRegressor(**(params or {}))
 
 
+FOREST_TYPES = (RandomForestClassifier, RandomForestRegressor)
+
+# Number of warm-start steps a forest is grown in when its progress is reported.
+PROGRESS_STEPS = 10
+
+
+def fit_forest(model, X, y, on_trees: Optional[Callable[[int], Any]] = None, n_steps: int = PROGRESS_STEPS):
+    """
+    Fit a random forest, calling `on_trees(n_built)` as it grows.
+
+    The forest is grown with warm_start in `n_steps` increments of n_estimators. sklearn
+    draws the seeds of the added trees as a single fit would, so with a fixed random_state
+    the result is the same forest. Without `on_trees` this is a plain `model.fit`.
+    """
+    if on_trees is None:
+        return model.fit(X, y)
+
+    total = model.n_estimators
+    # A warm-started forest only grows the trees it is missing.
+    built = len(model.estimators_) if model.warm_start and hasattr(model, "estimators_") else 0
+    step = max(1, math.ceil((total - built) / n_steps))
+    warm_start = model.warm_start
+    model.set_params(warm_start=True)
+    try:
+        for n in range(built + step, total + step, step):
+            model.set_params(n_estimators=min(n, total))
+            model.fit(X, y)
+            on_trees(len(model.estimators_))
+    finally:
+        model.set_params(warm_start=warm_start, n_estimators=total)
+    return model
+
+
 def rf_base_specs() -> List[HyperparameterSpec]:
     """
     Specs shared by RF classifier and regressor.
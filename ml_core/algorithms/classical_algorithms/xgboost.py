@@ -1,13 +1,28 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from xgboost import XGBClassifier, XGBRegressor
+from xgboost.callback import TrainingCallback
 
 from ml_core.common.types import ParamType
 from ml_core.common.hyperparameters import HyperparameterSpec
 
 
+class IterationCallback(TrainingCallback):
+    """
+    Calls `fn(iteration)` after every boosting round; a truthy return value stops training
+    (the model keeps the rounds built so far).
+    """
+
+    def __init__(self, fn: Callable[[int], Any]) -> None:
+        super().__init__()
+        self.fn = fn
+
+    def after_iteration(self, model, epoch: int, evals_log) -> bool:
+        return bool(self.fn(epoch))
+
+
 def xgb_classifier_factory(params: Dict[str, Any]):
     """
     XGBClassifier for classification tasks.
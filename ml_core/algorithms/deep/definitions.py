@@ -20,12 +20,14 @@ MLP_DEFINITION = AlgorithmDefinition(
             supported_tasks=[TaskType.BINARY, TaskType.MULTICLASS],
             factory=mlp_classifier_factory,
             hyperparams=mlp_specs(),
+            budget_param="max_epochs",
         ),
         AlgorithmVariant(
             code="mlp_regressor",
             supported_tasks=[TaskType.REGRESSION],
             factory=mlp_regressor_factory,
             hyperparams=mlp_specs(),
+            budget_param="max_epochs",
         ),
     ],
 )
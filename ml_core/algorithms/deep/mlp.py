@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple, Dict, Any
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Dict, Any
 
 import numpy as np
 import torch
@@ -61,6 +61,35 @@ class _MLP(nn.Module):
         return self.net(x)
 
 
+# `make_batches(epoch)` returns an iterable of (X, y) chunks covering the training data once.
+BatchFactory = Callable[[int], Iterable[Tuple[np.ndarray, np.ndarray]]]
+
+
+def _sgd_epoch(
+    model: nn.Module,
+    optimizer: torch.optim.Optimizer,
+    criterion: nn.Module,
+    loader: DataLoader,
+    on_batch_end: Optional[Callable[[], None]] = None,
+) -> float:
+    """
+    One pass of mini-batch SGD over `loader`. Returns the summed (not averaged) loss.
+
+    `on_batch_end` runs after every optimizer step; raising from it aborts training.
+    """
+    epoch_loss = 0.0
+    for xb, yb in loader:
+        optimizer.zero_grad()
+        out = model(xb)
+        loss = criterion(out, yb)
+        loss.backward()
+        optimizer.step()
+        epoch_loss += loss.item() * xb.size(0)
+        if on_batch_end is not None:
+            on_batch_end()
+    return epoch_loss
+
+
 @dataclass
 class _TrainingConfig:
     lr: float = 1e-3
@@ -78,6 +107,8 @@ class MLPClassifier:
     - Number of input features is inferred from X on first fit.
     - Number of classes is inferred from y on first fit.
     - For binary classification, it still uses K=2 classes with softmax.
+    - With `warm_start=True`, a refit continues from the current weights and optimizer
+      state up to `max_epochs` epochs in total (like sklearn's n_estimators).
     """
 
     def __init__(
@@ -92,6 +123,7 @@ class MLPClassifier:
         device: Optional[str] = None,
         random_state: Optional[int] = None,
         verbose: bool = False,
+        warm_start: bool = False,
     ) -> None:
         self.hidden_dims = hidden_dims
         self.activation = activation
@@ -108,6 +140,14 @@ class MLPClassifier:
         self._n_features: Optional[int] = None
         self._n_classes: Optional[int] = None
         self._random_state = random_state
+        self.warm_start = warm_start
+        self._optimizer: Optional[torch.optim.Optimizer] = None
+
+        # Training hooks: `on_batch_end()` after every mini-batch step (raise to cancel),
+        # `on_epoch_end(epoch, avg_loss)` after every epoch.
+        self.on_batch_end: Optional[Callable[[], None]] = None
+        self.on_epoch_end: Optional[Callable[[int, float], None]] = None
+        self.loss_history_: List[float] = []
 
         if random_state is not None:
             torch.manual_seed(random_state)
@@ -124,7 +164,7 @@ class MLPClassifier:
         self._n_features = input_dim
         self._n_classes = n_classes
 
-    def fit(self, X: np.ndarray, y: np.ndarray) -> "MLPClassifier":
+    def _check_Xy(self, X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         X = np.asarray(X, dtype=np.float32)
         y = np.asarray(y, dtype=np.int64)
 
@@ -134,58 +174,132 @@ class MLPClassifier:
             raise ValueError(f"y must be 1D (n_samples,), got shape {y.shape}")
         if X.shape[0] != y.shape[0]:
             raise ValueError("X and y must have the same number of samples.")
+        return X, y
 
-        n_samples, n_features = X.shape
-        classes = np.unique(y)
-        n_classes = int(classes.max()) + 1  # assume labels are 0..K-1
-
+    def _ensure_model(self, n_features: int, n_classes: int) -> _MLP:
         if self._model is None:
             self._build_model(n_features, n_classes)
-        else:
-            if self._n_features != n_features:
-                raise ValueError(
-                    f"Model was built for {self._n_features} features, "
-                    f"but got X with {n_features} features."
-                )
-
+        elif self._n_features != n_features:
+            raise ValueError(
+                f"Model was built for {self._n_features} features, "
+                f"but got X with {n_features} features."
+            )
         assert self._model is not None  # for type checkers
-        model = self._model
-        model.train()
+        return self._model
 
+    def _make_loader(self, X: np.ndarray, y: np.ndarray) -> DataLoader:
         X_tensor = torch.from_numpy(X).to(self._device)
         y_tensor = torch.from_numpy(y).to(self._device)
-
-        dataset = TensorDataset(X_tensor, y_tensor)
-        loader = DataLoader(
-            dataset,
+        return DataLoader(
+            TensorDataset(X_tensor, y_tensor),
             batch_size=self.cfg.batch_size,
             shuffle=True,
             drop_last=False,
         )
 
-        criterion = nn.CrossEntropyLoss()
-        optimizer = torch.optim.Adam(
+    def _make_optimizer(self, model: _MLP) -> torch.optim.Optimizer:
+        return torch.optim.Adam(
             model.parameters(),
             lr=self.cfg.lr,
             weight_decay=self.cfg.weight_decay,
         )
 
-        for epoch in range(self.cfg.max_epochs):
-            epoch_loss = 0.0
-            for xb, yb in loader:
-                optimizer.zero_grad()
-                logits = model(xb)
-                loss = criterion(logits, yb)
-                loss.backward()
-                optimizer.step()
-                epoch_loss += loss.item() * xb.size(0)
+    def _optimizer_for(self, model: _MLP) -> torch.optim.Optimizer:
+        # With warm_start the optimizer (Adam moments) carries over from the previous fit.
+        if not (self.warm_start and self._optimizer is not None):
+            self._optimizer = self._make_optimizer(model)
+        return self._optimizer
+
+    def _first_epoch(self) -> int:
+        # With warm_start, max_epochs counts the epochs of earlier fits too.
+        return len(self.loss_history_) if self.warm_start else 0
+
+    def _end_epoch(self, epoch: int, avg_loss: float) -> None:
+        self.loss_history_.append(avg_loss)
+        if self.cfg.verbose:
+            print(f"[MLPClassifier] Epoch {epoch+1}/{self.cfg.max_epochs} - loss={avg_loss:.4f}")
+        if self.on_epoch_end is not None:
+            self.on_epoch_end(epoch, avg_loss)
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "MLPClassifier":
+        X, y = self._check_Xy(X, y)
 
-            if self.cfg.verbose:
-                avg_loss = epoch_loss / n_samples
-                print(f"[MLPClassifier] Epoch {epoch+1}/{self.cfg.max_epochs} - loss={avg_loss:.4f}")
+        n_samples, n_features = X.shape
+        classes = np.unique(y)
+        n_classes = int(classes.max()) + 1  # assume labels are 0..K-1
+
+        model = self._ensure_model(n_features, n_classes)
+        model.train()
+
+        loader = self._make_loader(X, y)
+        criterion = nn.CrossEntropyLoss()
+        optimizer = self._optimizer_for(model)
+
+        for epoch in range(self._first_epoch(), self.cfg.max_epochs):
+            epoch_loss = _sgd_epoch(model, optimizer, criterion, loader, self.on_batch_end)
+            self._end_epoch(epoch, epoch_loss / n_samples)
 
         return self
 
+    def fit_batches(self, make_batches: BatchFactory, n_classes: int) -> "MLPClassifier":
+        """
+        Out-of-core training: each epoch streams the chunks returned by `make_batches(epoch)`
+        and trains on them in mini-batches of `batch_size`, so only one chunk is in memory.
+
+        `n_classes` must be given up front because no single chunk is guaranteed to contain every class.
+        """
+        criterion = nn.CrossEntropyLoss()
+        optimizer: Optional[torch.optim.Optimizer] = None
+
+        for epoch in range(self._first_epoch(), self.cfg.max_epochs):
+            epoch_loss, n_samples = 0.0, 0
+            for X, y in make_batches(epoch):
+                X, y = self._check_Xy(X, y)
+                model = self._ensure_model(X.shape[1], n_classes)
+                model.train()
+                if optimizer is None:
+                    optimizer = self._optimizer_for(model)
+                epoch_loss += _sgd_epoch(
+                    model, optimizer, criterion, self._make_loader(X, y), self.on_batch_end
+                )
+                n_samples += X.shape[0]
+
+            if n_samples == 0:
+                raise ValueError("make_batches produced no training data.")
+            self._end_epoch(epoch, epoch_loss / n_samples)
+
+        return self
+
+    def get_state(self) -> Tuple[Dict[str, Any], Dict[str, torch.Tensor]]:
+        """
+        (architecture, state_dict) of the fitted network, enough to rebuild it with `from_state`.
+        Tensors are moved to the CPU.
+        """
+        if self._model is None:
+            raise RuntimeError("Model is not fitted yet. Call `fit` first.")
+        architecture = {
+            "hidden_dims": list(self.hidden_dims),
+            "activation": self.activation,
+            "dropout": self.dropout,
+            "n_features": self._n_features,
+            "n_classes": self._n_classes,
+        }
+        return architecture, {k: v.detach().cpu() for k, v in self._model.state_dict().items()}
+
+    @classmethod
+    def from_state(
+        cls,
+        architecture: Dict[str, Any],
+        state_dict: Dict[str, torch.Tensor],
+        device: Optional[str] = None,
+    ) -> "MLPClassifier":
+        arch = dict(architecture)
+        n_features, n_classes = arch.pop("n_features"), arch.pop("n_classes")
+        model = cls(device=device, **arch)
+        model._build_model(n_features, n_classes)
+        model._model.load_state_dict(state_dict)
+        return model
+
     def _predict_logits(self, X: np.ndarray) -> torch.Tensor:
         if self._model is None:
             raise RuntimeError("Model is not fitted yet. Call `fit` first.")
@@ -224,6 +338,8 @@ class MLPRegressor:
     - Uses MSELoss.
     - Number of input features is inferred from X on first fit.
     - Output is a single scalar per sample.
+    - With `warm_start=True`, a refit continues from the current weights and optimizer
+      state up to `max_epochs` epochs in total (like sklearn's n_estimators).
     """
 
     def __init__(
@@ -238,6 +354,7 @@ class MLPRegressor:
         device: Optional[str] = None,
         random_state: Optional[int] = None,
         verbose: bool = False,
+        warm_start: bool = False,
     ) -> None:
         self.hidden_dims = hidden_dims
         self.activation = activation
@@ -253,6 +370,14 @@ class MLPRegressor:
         self._model: Optional[_MLP] = None
         self._n_features: Optional[int] = None
         self._random_state = random_state
+        self.warm_start = warm_start
+        self._optimizer: Optional[torch.optim.Optimizer] = None
+
+        # Training hooks: `on_batch_end()` after every mini-batch step (raise to cancel),
+        # `on_epoch_end(epoch, avg_loss)` after every epoch.
+        self.on_batch_end: Optional[Callable[[], None]] = None
+        self.on_epoch_end: Optional[Callable[[int, float], None]] = None
+        self.loss_history_: List[float] = []
 
         if random_state is not None:
             torch.manual_seed(random_state)
@@ -268,7 +393,7 @@ class MLPRegressor:
         ).to(self._device)
         self._n_features = input_dim
 
-    def fit(self, X: np.ndarray, y: np.ndarray) -> "MLPRegressor":
+    def _check_Xy(self, X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         X = np.asarray(X, dtype=np.float32)
         y = np.asarray(y, dtype=np.float32)
 
@@ -280,57 +405,126 @@ class MLPRegressor:
             raise ValueError("For regression, y must be (n_samples,) or (n_samples, 1).")
         if X.shape[0] != y.shape[0]:
             raise ValueError("X and y must have the same number of samples.")
+        return X, y.reshape(-1, 1)
 
-        n_samples, n_features = X.shape
-        y = y.reshape(-1, 1)
-
+    def _ensure_model(self, n_features: int) -> _MLP:
         if self._model is None:
             self._build_model(n_features)
-        else:
-            if self._n_features != n_features:
-                raise ValueError(
-                    f"Model was built for {self._n_features} features, "
-                    f"but got X with {n_features} features."
-                )
-
+        elif self._n_features != n_features:
+            raise ValueError(
+                f"Model was built for {self._n_features} features, "
+                f"but got X with {n_features} features."
+            )
         assert self._model is not None
-        model = self._model
-        model.train()
+        return self._model
 
+    def _make_loader(self, X: np.ndarray, y: np.ndarray) -> DataLoader:
         X_tensor = torch.from_numpy(X).to(self._device)
         y_tensor = torch.from_numpy(y).to(self._device)
-
-        dataset = TensorDataset(X_tensor, y_tensor)
-        loader = DataLoader(
-            dataset,
+        return DataLoader(
+            TensorDataset(X_tensor, y_tensor),
             batch_size=self.cfg.batch_size,
             shuffle=True,
             drop_last=False,
         )
 
-        criterion = nn.MSELoss()
-        optimizer = torch.optim.Adam(
+    def _make_optimizer(self, model: _MLP) -> torch.optim.Optimizer:
+        return torch.optim.Adam(
             model.parameters(),
             lr=self.cfg.lr,
             weight_decay=self.cfg.weight_decay,
         )
 
-        for epoch in range(self.cfg.max_epochs):
-            epoch_loss = 0.0
-            for xb, yb in loader:
-                optimizer.zero_grad()
-                pred = model(xb)
-                loss = criterion(pred, yb)
-                loss.backward()
-                optimizer.step()
-                epoch_loss += loss.item() * xb.size(0)
+    def _optimizer_for(self, model: _MLP) -> torch.optim.Optimizer:
+        # With warm_start the optimizer (Adam moments) carries over from the previous fit.
+        if not (self.warm_start and self._optimizer is not None):
+            self._optimizer = self._make_optimizer(model)
+        return self._optimizer
+
+    def _first_epoch(self) -> int:
+        # With warm_start, max_epochs counts the epochs of earlier fits too.
+        return len(self.loss_history_) if self.warm_start else 0
 
-            if self.cfg.verbose:
-                avg_loss = epoch_loss / n_samples
-                print(f"[MLPRegressor] Epoch {epoch+1}/{self.cfg.max_epochs} - loss={avg_loss:.4f}")
+    def _end_epoch(self, epoch: int, avg_loss: float) -> None:
+        self.loss_history_.append(avg_loss)
+        if self.cfg.verbose:
+            print(f"[MLPRegressor] Epoch {epoch+1}/{self.cfg.max_epochs} - loss={avg_loss:.4f}")
+        if self.on_epoch_end is not None:
+            self.on_epoch_end(epoch, avg_loss)
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "MLPRegressor":
+        X, y = self._check_Xy(X, y)
+        n_samples, n_features = X.shape
+
+        model = self._ensure_model(n_features)
+        model.train()
+
+        loader = self._make_loader(X, y)
+        criterion = nn.MSELoss()
+        optimizer = self._optimizer_for(model)
+
+        for epoch in range(self._first_epoch(), self.cfg.max_epochs):
+            epoch_loss = _sgd_epoch(model, optimizer, criterion, loader, self.on_batch_end)
+            self._end_epoch(epoch, epoch_loss / n_samples)
+
+        return self
+
+    def fit_batches(self, make_batches: BatchFactory) -> "MLPRegressor":
+        """
+        Out-of-core training: each epoch streams the chunks returned by `make_batches(epoch)`
+        and trains on them in mini-batches of `batch_size`, so only one chunk is in memory.
+        """
+        criterion = nn.MSELoss()
+        optimizer: Optional[torch.optim.Optimizer] = None
+
+        for epoch in range(self._first_epoch(), self.cfg.max_epochs):
+            epoch_loss, n_samples = 0.0, 0
+            for X, y in make_batches(epoch):
+                X, y = self._check_Xy(X, y)
+                model = self._ensure_model(X.shape[1])
+                model.train()
+                if optimizer is None:
+                    optimizer = self._optimizer_for(model)
+                epoch_loss += _sgd_epoch(
+                    model, optimizer, criterion, self._make_loader(X, y), self.on_batch_end
+                )
+                n_samples += X.shape[0]
+
+            if n_samples == 0:
+                raise ValueError("make_batches produced no training data.")
+            self._end_epoch(epoch, epoch_loss / n_samples)
 
         return self
 
+    def get_state(self) -> Tuple[Dict[str, Any], Dict[str, torch.Tensor]]:
+        """
+        (architecture, state_dict) of the fitted network, enough to rebuild it with `from_state`.
+        Tensors are moved to the CPU.
+        """
+        if self._model is None:
+            raise RuntimeError("Model is not fitted yet. Call `fit` first.")
+        architecture = {
+            "hidden_dims": list(self.hidden_dims),
+            "activation": self.activation,
+            "dropout": self.dropout,
+            "n_features": self._n_features,
+        }
+        return architecture, {k: v.detach().cpu() for k, v in self._model.state_dict().items()}
+
+    @classmethod
+    def from_state(
+        cls,
+        architecture: Dict[str, Any],
+        state_dict: Dict[str, torch.Tensor],
+        device: Optional[str] = None,
+    ) -> "MLPRegressor":
+        arch = dict(architecture)
+        n_features = arch.pop("n_features")
+        model = cls(device=device, **arch)
+        model._build_model(n_features)
+        model._model.load_state_dict(state_dict)
+        return model
+
     def predict(self, X: np.ndarray) -> np.ndarray:
         if self._model is None:
             raise RuntimeError("Model is not fitted yet. Call `fit` first.")
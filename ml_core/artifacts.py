@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+import sklearn
+import torch
+import xgboost
+from xgboost import XGBClassifier, XGBRegressor
+
+from ml_core.algorithms.deep.mlp import MLPClassifier, MLPRegressor
+from ml_core.data_handlers.metadata import DatasetMeta
+
+
+# Bump when the manifest layout or a model file format changes incompatibly.
+ARTIFACT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+# Model file of every artifact format.
+MODEL_FILES = {
+    "torch": "model.pt",        # state_dict of the MLP; the architecture is in the manifest
+    "xgboost": "model.ubj",     # XGBoost's native (UBJSON) format
+    "joblib": "model.joblib",   # any other (sklearn) estimator
+}
+
+# Estimators rebuilt from their native format by class name.
+_NATIVE_CLASSES = {cls.__name__: cls for cls in (MLPClassifier, MLPRegressor, XGBClassifier, XGBRegressor)}
+
+_HASH_BUFFER = 1024 * 1024
+
+
+def file_sha256(path: str | os.PathLike) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BUFFER), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def schema_from_meta(meta: DatasetMeta, dtype: Any) -> Dict[str, Any]:
+    """
+    Feature / target schema a model was trained with: what inference inputs must look like
+    and how its outputs map back to labels.
+    """
+    return {
+        "features": {
+            "n_features": meta.n_features,
+            "names": list(meta.feature_names) if meta.feature_names is not None else None,
+            "dtype": np.dtype(dtype).name,
+            # feature name -> category values by integer code, for text-valued features
+            "categories": dict(meta.feature_categories) if meta.feature_categories else None,
+        },
+        "target": {
+            "name": meta.target_name,
+            "task": meta.task.value,
+            "class_labels": list(meta.class_labels) if meta.class_labels is not None else None,
+        },
+    }
+
+
+def artifact_format(model: Any) -> str:
+    if isinstance(model, (MLPClassifier, MLPRegressor)):
+        return "torch"
+    if isinstance(model, (XGBClassifier, XGBRegressor)):
+        return "xgboost"
+    return "joblib"
+
+
+def _write_model(model: Any, fmt: str, path: Path) -> Dict[str, Any]:
+    # Returns extra manifest entries needed to load the model again.
+    if fmt == "torch":
+        architecture, state_dict = model.get_state()
+        torch.save(state_dict, path)
+        return {"architecture": architecture, "libraries": {"torch": torch.__version__}}
+    if fmt == "xgboost":
+        model.save_model(str(path))
+        return {"libraries": {"xgboost": xgboost.__version__}}
+    joblib.dump(model, path)
+    return {"libraries": {"scikit-learn": sklearn.__version__, "joblib": joblib.__version__}}
+
+
+def save_model(
+    model: Any,
+    root: str | os.PathLike,
+    schema: Dict[str, Any],
+    info: Optional[Dict[str, Any]] = None,
+    artifact_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Save a fitted model as an artifact directory `root/<artifact_id>/`:
+
+    - the model file in its family's format (see MODEL_FILES),
+    - manifest.json with the format, the file's sha256, the feature schema
+      (see `schema_from_meta`), library versions and `info` (algorithm, dataset, ...).
+
+    The directory is built under a temporary name and renamed into place, so readers
+    never see a partial artifact. Returns a summary: id, path, format, sha256, size.
+    """
+    root = Path(root)
+    artifact_id = artifact_id or uuid.uuid4().hex
+    root.mkdir(parents=True, exist_ok=True)
+
+    fmt = artifact_format(model)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{artifact_id}-", dir=root))
+    try:
+        model_file = tmp / MODEL_FILES[fmt]
+        extra = _write_model(model, fmt, model_file)
+        manifest = {
+            **(info or {}),
+            "version": ARTIFACT_VERSION,
+            "id": artifact_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "format": fmt,
+            "estimator": type(model).__name__,
+            "file": model_file.name,
+            "sha256": file_sha256(model_file),
+            "size": model_file.stat().st_size,
+            "schema": schema,
+            **extra,
+        }
+        (tmp / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        final = root / artifact_id
+        os.replace(tmp, final)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    summary = {key: manifest[key] for key in ("id", "format", "sha256", "size")}
+    summary["path"] = str(final)
+    return summary
+
+
+def read_manifest(path: str | os.PathLike) -> Dict[str, Any]:
+    manifest_path = Path(path) / MANIFEST_FILE
+    if not manifest_path.is_file():
+        raise ValueError(f"No model artifact at {path}.")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest.get("version", 0) > ARTIFACT_VERSION:
+        raise ValueError(f"Model artifact version {manifest['version']} is newer than supported ({ARTIFACT_VERSION}).")
+    return manifest
+
+
+def load_model(path: str | os.PathLike, verify: bool = True) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Load an artifact written by `save_model`. Returns (model, manifest).
+
+    With `verify` the model file must match the manifest's sha256 (ValueError otherwise).
+    joblib artifacts are pickles: only load artifacts from a trusted directory.
+    """
+    manifest = read_manifest(path)
+    model_file = Path(path) / manifest["file"]
+    if verify and file_sha256(model_file) != manifest["sha256"]:
+        raise ValueError(f"Checksum mismatch for model artifact {path}.")
+
+    fmt = manifest["format"]
+    if fmt == "joblib":
+        return joblib.load(model_file), manifest
+    cls = _NATIVE_CLASSES[manifest["estimator"]]
+    if fmt == "torch":
+        state_dict = torch.load(model_file, map_location="cpu", weights_only=True)
+        return cls.from_state(manifest["architecture"], state_dict), manifest
+    model = cls()
+    model.load_model(str(model_file))
+    return model, manifest
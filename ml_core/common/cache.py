@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+import numpy as np
+
+
+V = TypeVar("V")
+
+
+def nbytes_of(value: Any) -> int:
+    """
+    Best-effort size estimate (in bytes) of a cached value.
+
+    Counts the buffers of numpy arrays, recursing into tuples, lists and dicts.
+    Memory maps are backed by the OS page cache rather than private memory, so they
+    count as free - as does anything else; the cache is meant for array payloads.
+    """
+    if isinstance(value, np.memmap):
+        return 0
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(nbytes_of(v) for v in value)
+    if isinstance(value, dict):
+        return sum(nbytes_of(v) for v in value.values())
+    return 0
+
+
+def freeze_arrays(value: Any) -> Any:
+    """
+    Mark every numpy array inside `value` as read-only (in place) and return `value`.
+
+    Cached arrays are shared between callers, so nobody may mutate them.
+    """
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            freeze_arrays(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            freeze_arrays(v)
+    return value
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class LRUCache(Generic[V]):
+    """
+    Bounded, thread-safe LRU cache.
+
+    - `max_entries` limits the number of entries,
+    - `max_bytes` limits the total size reported by `sizeof` (numpy buffers by default),
+    - both limits are optional; the least recently used entries are evicted first.
+
+    A single value larger than `max_bytes` is never stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 128,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[V], int] = nbytes_of,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, tuple[V, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self._stats.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        size = int(self._sizeof(value))
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = (value, size)
+            self._stats.bytes += size
+            self._evict()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        """
+        Return the cached value for `key`, calling `loader()` on a miss.
+
+        The loader runs outside the lock, so two threads missing on the same key
+        at the same time may both load; the last one wins, which is harmless.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)  # type: ignore[arg-type]
+        if value is not sentinel:
+            return value  # type: ignore[return-value]
+        value = loader()
+        self.put(key, value)
+        return value
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            if key not in self._data:
+                return default
+            value, _ = self._data[key]
+            self._remove(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(self._data),
+                bytes=self._stats.bytes,
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        _, size = self._data.pop(key)
+        self._stats.bytes -= size
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._stats.bytes > self.max_bytes)
+        ):
+            key = next(iter(self._data))
+            self._remove(key)
+            self._stats.evictions += 1
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from ml_core.common.profiling import current_rss, record_external_peaks
+
+try:
+    import resource
+except ImportError:  # not a POSIX system
+    resource = None
+
+
+class RunTimeout(Exception):
+    """
+    A run exceeded its time budget.
+
+    `partial` holds whatever is known about the interrupted run: the stage it was in,
+    elapsed seconds, training progress (epochs / boosting rounds) and stage timings.
+    """
+
+    def __init__(self, message: str, partial: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(message)
+        self.partial: Dict[str, Any] = partial or {}
+
+    def __reduce__(self):
+        # Keep `partial` when the exception crosses a process boundary.
+        return (type(self), (str(self), self.partial))
+
+
+class Deadline:
+    """
+    Wall-clock deadline of a run, shared by the cancellation hooks of its stages.
+
+    Uses time.time(), so the same deadline is meaningful in forked worker processes.
+    """
+
+    def __init__(self, budget: float, expires_at: Optional[float] = None) -> None:
+        if budget <= 0:
+            raise ValueError("time_budget must be > 0 seconds.")
+        self.budget = float(budget)
+        self.expires_at = expires_at if expires_at is not None else time.time() + self.budget
+        self.progress: Dict[str, Any] = {}
+
+    def remaining(self) -> float:
+        return self.expires_at - time.time()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, stage: str) -> None:
+        """
+        Raise RunTimeout if the deadline has passed.
+        """
+        if self.expired():
+            raise self.timeout(stage)
+
+    def timeout(self, stage: str, **extra: Any) -> RunTimeout:
+        partial = {
+            "stage": stage,
+            "time_budget": self.budget,
+            "elapsed": self.budget - self.remaining(),
+            "progress": dict(self.progress),
+            **extra,
+        }
+        return RunTimeout(f"Run exceeded its time budget of {self.budget:g}s during {stage}.", partial)
+
+
+# Messages sent by the fitting child: a progress event, its memory peaks, the fitted model or an exception.
+_EVENT, _MEMORY, _DONE, _FAILED = "event", "memory", "done", "failed"
+
+# `fit(model, X, y, emit)` fits `model` in place, optionally reporting progress through `emit(value)`.
+FitFunction = Callable[[Any, np.ndarray, np.ndarray, Callable[[Any], None]], Any]
+
+
+def _plain_fit(model: Any, X: np.ndarray, y: np.ndarray, emit: Callable[[Any], None]) -> Any:
+    return model.fit(X, y)
+
+
+def _peak_rss() -> Optional[int]:
+    # Peak RSS of this process in bytes; a forked child's count starts from its own pages.
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KiB elsewhere
+
+
+def _fit_child(conn, fit: FitFunction, model: Any, X: np.ndarray, y: np.ndarray) -> None:
+    try:
+        rss_start = current_rss()
+        heap_start = None
+        if tracemalloc.is_tracing():  # inherited from a "precise" parent
+            tracemalloc.reset_peak()
+            heap_start = tracemalloc.get_traced_memory()[0]
+        fit(model, X, y, lambda value: conn.send((_EVENT, value)))
+
+        peaks: Dict[str, int] = {}
+        rss_peak = _peak_rss()
+        if rss_start is not None and rss_peak is not None:
+            peaks["rss_peak_delta"] = max(0, rss_peak - rss_start)
+        if heap_start is not None:
+            peaks["heap_peak"] = max(0, tracemalloc.get_traced_memory()[1] - heap_start)
+        conn.send((_MEMORY, peaks))
+        conn.send((_DONE, model))
+    except BaseException as e:  # report anything, including MemoryError
+        conn.send((_FAILED, e))
+    finally:
+        conn.close()
+
+
+def fit_in_subprocess(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    deadline: Deadline,
+    fit: FitFunction = _plain_fit,
+    on_event: Optional[Callable[[Any], None]] = None,
+) -> Any:
+    """
+    Fit `model` in a forked child process and return the fitted model.
+
+    Fallback for estimators without cancellation hooks (sklearn): when the deadline
+    passes, the child is killed and RunTimeout is raised. The fitted model is pickled
+    back to the parent, which costs time for very large ensembles.
+
+    Values the child passes to `emit` (see FitFunction) are sent back through the pipe
+    and handed to `on_event` in the parent; raising from it kills the child. The child's
+    memory peaks are added to the memory stage running in the parent (see profiling.py).
+    """
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+    recv, send = ctx.Pipe(duplex=False)
+    child = ctx.Process(target=_fit_child, args=(send, fit, model, X, y), daemon=True)
+    child.start()
+    send.close()
+    try:
+        while True:
+            if not recv.poll(max(0.0, deadline.remaining())):
+                raise deadline.timeout("fit", killed=True)
+            try:
+                kind, payload = recv.recv()
+            except EOFError:
+                raise RuntimeError(f"Training process died unexpectedly (exit code {child.exitcode}).") from None
+            if kind == _EVENT:
+                if on_event is not None:
+                    on_event(payload)
+            elif kind == _MEMORY:
+                record_external_peaks(payload)
+            elif kind == _FAILED:
+                raise payload
+            else:
+                return payload
+    finally:
+        recv.close()
+        if child.is_alive():
+            child.kill()
+        child.join()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import base64
+import zlib
+from typing import Any, Dict
+
+import numpy as np
+
+
+# Marker of an encoded array; also names the codec so it can change later.
+ENCODING = "zlib+base64"
+
+_INT_DTYPES = [np.dtype(t).newbyteorder("<") for t in ("i1", "u1", "i2", "u2", "i4", "u4", "i8", "u8")]
+
+
+def smallest_dtype(a: np.ndarray, allow_float32: bool = False) -> np.dtype:
+    """
+    Smallest little-endian dtype that holds every value of `a` exactly.
+
+    - bool and integer arrays shrink to the narrowest int that holds their range,
+    - floats stay floats (whole-valued ones too, so they decode as floats): float64, or
+      float32 when `allow_float32` accepts the rounding (or the values are exact in float32).
+    """
+    if a.dtype == np.bool_:
+        return np.dtype("u1")
+    if a.dtype.kind in "iu":
+        if a.size == 0:
+            return np.dtype("<i1")
+        lo, hi = int(a.min()), int(a.max())
+        return next(t for t in _INT_DTYPES if np.iinfo(t).min <= lo and hi <= np.iinfo(t).max)
+    if a.dtype.kind != "f":
+        raise ValueError(f"Cannot encode an array of dtype {a.dtype}.")
+    if allow_float32 or a.dtype.itemsize <= 4 or np.array_equal(a.astype(np.float32), a, equal_nan=True):
+        return np.dtype("<f4")
+    return np.dtype("<f8")
+
+
+def encode_array(a: Any, allow_float32: bool = False) -> Dict[str, Any]:
+    """
+    Compact JSON-ready form of a numeric array: its values in the smallest suitable
+    little-endian dtype (see `smallest_dtype`), zlib-compressed and base64-encoded,
+    next to the dtype and shape needed to decode it.
+    """
+    a = np.asarray(a)
+    dtype = smallest_dtype(a, allow_float32)
+    raw = np.ascontiguousarray(a, dtype=dtype).tobytes()
+    return {
+        "encoding": ENCODING,
+        "dtype": dtype.str,
+        "shape": list(a.shape),
+        "data": base64.b64encode(zlib.compress(raw, 6)).decode("ascii"),
+    }
+
+
+def is_encoded(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("encoding") == ENCODING
+
+
+def decode_array(value: Dict[str, Any]) -> np.ndarray:
+    """
+    Inverse of `encode_array`. The result is read-only.
+    """
+    if not is_encoded(value):
+        raise ValueError("Not an encoded array.")
+    raw = zlib.decompress(base64.b64decode(value["data"]))
+    return np.frombuffer(raw, dtype=np.dtype(value["dtype"])).reshape(value["shape"])
+
+
+def decode_predictions(predictions: Dict[str, Any] | None) -> Dict[str, Any] | None:
+    """
+    Plain-list form of a predictions dict: encoded arrays are decoded, everything else kept.
+    """
+    if predictions is None:
+        return None
+    return {
+        key: decode_array(value).tolist() if is_encoded(value) else value
+        for key, value in predictions.items()
+    }
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+def default_workers(n_tasks: int) -> int:
+    """
+    Number of worker processes for `n_tasks` independent tasks.
+
+    Capped by the CPU count and by the ML_CORE_MAX_WORKERS environment variable.
+    """
+    limit = int(os.getenv("ML_CORE_MAX_WORKERS", "0")) or os.cpu_count() or 1
+    return max(1, min(n_tasks, limit))
+
+
+def _mp_context():
+    # Forked workers inherit the parent's dataset caches copy-on-write, so loaded
+    # datasets are shared instead of reloaded. Stored datasets are memory maps and
+    # are shared through the page cache under any start method.
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+def _init_worker() -> None:
+    # One BLAS / OpenMP / torch thread per process; the pool provides the parallelism.
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(1)
+    if "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(1)
+
+
+def process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Process pool used for parallel runs (cross-validation folds, batches of experiments).
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or default_workers(os.cpu_count() or 1),
+        mp_context=_mp_context(),
+        initializer=_init_worker,
+    )
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional
+
+
+# Memory profiling modes for StageTimer / RunConfig.memory_profile.
+MEMORY_MODES = ("sampled", "precise")
+
+# How often the sampler thread reads the process RSS while a stage runs.
+RSS_SAMPLE_INTERVAL = 0.01
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):  # not a POSIX system
+    _PAGE_SIZE = None
+
+
+def current_rss() -> Optional[int]:
+    """
+    Resident set size of this process in bytes, or None where /proc is unavailable.
+    """
+    if _PAGE_SIZE is None:
+        return None
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class _RSSSampler:
+    """
+    Background thread tracking the peak RSS between `reset()` calls.
+
+    Forking a process with running threads is unsafe, and the pools and fit subprocesses
+    of a run fork while its stages are being sampled. Live samplers are therefore paused
+    for the duration of every fork of this process (see `_pause_samplers`).
+    """
+
+    def __init__(self) -> None:
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        with _SAMPLERS_LOCK:
+            self._start()
+            _SAMPLERS.add(self)
+
+    def _start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+
+    def _halt(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def reset(self, value: int) -> None:
+        self.peak = value
+
+    def _run(self) -> None:
+        while not self._stop.wait(RSS_SAMPLE_INTERVAL):
+            rss = current_rss()
+            if rss is not None and rss > self.peak:
+                self.peak = rss
+
+    def stop(self) -> None:
+        with _SAMPLERS_LOCK:
+            _SAMPLERS.discard(self)
+            self._halt()
+
+
+# Samplers with a running thread; the lock is held from just before a fork until just after it.
+_SAMPLERS: "weakref.WeakSet[_RSSSampler]" = weakref.WeakSet()
+_SAMPLERS_LOCK = threading.Lock()
+
+
+def _pause_samplers() -> None:
+    _SAMPLERS_LOCK.acquire()
+    for sampler in list(_SAMPLERS):
+        sampler._halt()
+
+
+def _resume_samplers() -> None:
+    for sampler in list(_SAMPLERS):
+        sampler._start()
+    _SAMPLERS_LOCK.release()
+
+
+def _reset_after_fork() -> None:
+    # The child has none of the parent's threads; its own runs start new samplers.
+    global _SAMPLERS_LOCK
+    _SAMPLERS.clear()
+    _SAMPLERS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_pause_samplers,
+        after_in_parent=_resume_samplers,
+        after_in_child=_reset_after_fork,
+    )
+
+
+# The memory stage running on each thread, with the peaks reported for it by other processes.
+_ACTIVE = threading.local()
+
+
+def record_external_peaks(stats: Dict[str, int]) -> None:
+    """
+    Fold the memory peaks of work done for the current stage in another process (a forked
+    fit, see common/cancellation.py) into the stage running on this thread, if any.
+
+    `stats` holds the child's rss_peak_delta and, when tracing, heap_peak above its start.
+    """
+    external = getattr(_ACTIVE, "external", None)
+    if external is None:
+        return
+    for key, value in stats.items():
+        external[key] = max(external.get(key, 0), int(value))
+
+
+class MemoryTracker:
+    """
+    Per-stage memory accounting.
+
+    - "sampled": RSS before/after each stage plus the peak seen by a sampler thread
+      every 10 ms; the overhead is one /proc read per sample,
+    - "precise": additionally the peak traced Python heap (tracemalloc, which also sees
+      numpy buffers) above the stage's starting heap; noticeably slows allocation-heavy code.
+
+    Per stage (bytes): rss_delta (after - before), rss_peak_delta (peak - before) and,
+    in precise mode, heap_peak. A stage entered repeatedly sums its rss_delta and keeps
+    the largest peaks. Peaks of forked children reported through `record_external_peaks`
+    count as if they had happened in this process, on top of its RSS at the stage start.
+    """
+
+    def __init__(self, mode: str) -> None:
+        if mode not in MEMORY_MODES:
+            raise ValueError(f"Unknown memory profile mode: {mode!r}. Available: {', '.join(MEMORY_MODES)}")
+        self.mode = mode
+        self.stages: Dict[str, Dict[str, int]] = {}
+        self.rss_peak = 0
+        self._sampler: Optional[_RSSSampler] = None
+        self._owns_tracemalloc = False
+
+    def _start(self) -> None:
+        if self._sampler is None and current_rss() is not None:
+            self._sampler = _RSSSampler()
+        if self.mode == "precise" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self._start()
+        rss_before = current_rss()
+        if self._sampler is not None and rss_before is not None:
+            self._sampler.reset(rss_before)
+        heap_before = 0
+        if self.mode == "precise":
+            tracemalloc.reset_peak()
+            heap_before = tracemalloc.get_traced_memory()[0]
+        outer = getattr(_ACTIVE, "external", None)
+        external: Dict[str, int] = {}
+        _ACTIVE.external = external
+        try:
+            yield
+        finally:
+            _ACTIVE.external = outer
+            stats: Dict[str, int] = {}
+            if self.mode == "precise":
+                stats["heap_peak"] = max(
+                    tracemalloc.get_traced_memory()[1] - heap_before, external.get("heap_peak", 0), 0
+                )
+            rss_after = current_rss()
+            if rss_before is not None and rss_after is not None:
+                peak = max(
+                    self._sampler.peak if self._sampler else 0,
+                    rss_after,
+                    rss_before + external.get("rss_peak_delta", 0),
+                )
+                self.rss_peak = max(self.rss_peak, peak)
+                stats["rss_delta"] = rss_after - rss_before
+                stats["rss_peak_delta"] = peak - rss_before
+            self.merge({name: stats})
+
+    def merge(self, stages: Dict[str, Dict[str, int]], sum_deltas: bool = True) -> None:
+        """
+        Fold stage statistics (e.g. from a pool worker) into this tracker.
+        """
+        for name, stats in stages.items():
+            current = self.stages.setdefault(name, {})
+            for key, value in stats.items():
+                if key == "rss_delta" and sum_deltas:
+                    current[key] = current.get(key, 0) + value
+                else:
+                    current[key] = max(current.get(key, value), value)
+
+    def close(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "rss_peak": self.rss_peak or None, "stages": self.stages}
+
+
+class StageTimer:
+    """
+    Records wall-clock time (time.perf_counter) spent in named stages of a run,
+    and optionally their memory use (`memory` = "sampled" / "precise", see MemoryTracker).
+
+    Re-entering a stage adds to its total, so per-batch or per-fold work accumulates.
+    `to_dict()` also reports "total": the time since the timer was created.
+    Call `close()` when done, to stop the memory sampler.
+    """
+
+    def __init__(self, memory: Optional[str] = None) -> None:
+        self._created = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+        self.memory = MemoryTracker(memory) if memory else None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        with self.memory.stage(name) if self.memory is not None else nullcontext():
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def add(self, timings: Dict[str, float]) -> None:
+        """
+        Accumulate stage times measured elsewhere (e.g. in a pool worker); "total" is skipped.
+        """
+        for name, seconds in timings.items():
+            if name != "total":
+                self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, float]:
+        return {**self.timings, "total": time.perf_counter() - self._created}
+
+    def memory_dict(self) -> Optional[Dict[str, Any]]:
+        return self.memory.to_dict() if self.memory is not None else None
+
+    def close(self) -> None:
+        if self.memory is not None:
+            self.memory.close()
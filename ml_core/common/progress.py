@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# Minimum number of seconds between two forwarded events of a run (see ProgressReporter).
+DEFAULT_PROGRESS_INTERVAL = 0.5
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class ProgressReporter:
+    """
+    Throttled forwarder of training progress events to a callback.
+
+    Every event is a JSON-ready dict:
+
+    - "unit"    - what is being counted: "epoch" (mlp), "round" (xgboost), "trees" (random forest)
+      or "fold" (cross-validation),
+    - "step"    - units completed so far, "total" - units planned (or None),
+    - "elapsed" - seconds since the reporter was created,
+    - extra values of the unit, e.g. "loss" for epochs.
+
+    Events closer than `min_interval` seconds to the previously forwarded one are dropped,
+    so the training loop pays one clock read per step. The last step and non-finite
+    values (a diverging loss) are always forwarded. Raising from the callback aborts the run.
+    """
+
+    def __init__(self, callback: ProgressCallback, min_interval: float = DEFAULT_PROGRESS_INTERVAL) -> None:
+        if min_interval < 0:
+            raise ValueError("progress_interval must be >= 0 seconds.")
+        self.callback = callback
+        self.min_interval = float(min_interval)
+        self._start = time.monotonic()
+        self._last: Optional[float] = None
+
+    def emit(self, unit: str, step: int, total: Optional[int] = None, **values: Any) -> bool:
+        """
+        Forward an event unless it is throttled. Returns whether it was forwarded.
+        """
+        now = time.monotonic()
+        due = (
+            self._last is None
+            or now - self._last >= self.min_interval
+            or (total is not None and step >= total)
+            or any(isinstance(v, float) and not math.isfinite(v) for v in values.values())
+        )
+        if not due:
+            return False
+        self._last = now
+        self.callback({"unit": unit, "step": int(step), "total": total, "elapsed": now - self._start, **values})
+        return True
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import weakref
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+# Rows are hashed in blocks of about this many bytes, so memory maps are streamed.
+_BLOCK_BYTES = 8 * 1024 * 1024
+
+DIGEST_SIZE = 16
+
+# id(array) -> (weak reference, fingerprint). Arrays are hashed once per object;
+# an entry goes away together with its array.
+_memo: Dict[int, Tuple[weakref.ref, str]] = {}
+_memo_lock = threading.Lock()
+
+
+def _hasher():
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def _hash_array(a: np.ndarray) -> str:
+    h = _hasher()
+    h.update(f"{a.dtype.str}{a.shape}".encode())
+    if a.ndim == 0 or a.size == 0:
+        h.update(np.ascontiguousarray(a).tobytes())
+        return h.hexdigest()
+
+    row_bytes = max(1, a[0].nbytes)
+    block = max(1, _BLOCK_BYTES // row_bytes)
+    for start in range(0, a.shape[0], block):
+        # Hashing in logical (C) order makes the fingerprint independent of the memory
+        # layout: an in-memory C array and a column-major memory map of the same data match.
+        h.update(memoryview(np.ascontiguousarray(a[start:start + block])).cast("B"))
+    return h.hexdigest()
+
+
+def array_fingerprint(a: np.ndarray) -> str:
+    """
+    Content hash (blake2b, hex) of an array's dtype, shape and values.
+
+    The result is memoized per array object, so it is meant for the read-only
+    arrays handed out by `load_data`; mutating a hashed array in place is not detected.
+    """
+    key = id(a)
+    with _memo_lock:
+        entry = _memo.get(key)
+        if entry is not None and entry[0]() is a:
+            return entry[1]
+
+    fingerprint = _hash_array(np.asarray(a))
+    try:
+        ref = weakref.ref(a, lambda _, key=key: _memo.pop(key, None))
+    except TypeError:  # not weak-referenceable: don't memoize
+        return fingerprint
+    with _memo_lock:
+        _memo[key] = (ref, fingerprint)
+    return fingerprint
+
+
+def combine(*parts: Any) -> str:
+    """
+    Fingerprint of a sequence of fingerprints / JSON-serializable values.
+    """
+    h = _hasher()
+    h.update(json.dumps(parts, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def dataset_fingerprint(X: np.ndarray, y: np.ndarray, meta: Dict[str, Any]) -> str:
+    """
+    Identity of a dataset's content: features, target and metadata (labels, names, task).
+    """
+    return combine("dataset", array_fingerprint(X), array_fingerprint(y), meta)
+
+
+def split_fingerprint(data_fingerprint: str, train_index: np.ndarray, test_index: np.ndarray) -> str:
+    """
+    Identity of a train/test split of a dataset: the data plus the exact row partition.
+
+    The index arrays already encode the split parameters (test_size, seed, stratification, folds).
+    """
+    return combine("split", data_fingerprint, array_fingerprint(train_index), array_fingerprint(test_index))
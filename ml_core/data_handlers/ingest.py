@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import csv
+import math
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO
+
+import numpy as np
+
+from ml_core.common.types import TaskType
+from ml_core.data_handlers.load_dataset import DATASET_LOADERS
+from ml_core.data_handlers.metadata import DatasetMeta
+from ml_core.data_handlers.store import (
+    DatasetStore,
+    X_FILE,
+    Y_FILE,
+    get_default_store,
+    write_meta,
+    write_npy_from_columns,
+)
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# An integer target with at most this many distinct values is treated as class labels.
+MAX_INFERRED_CLASSES = 50
+
+# Guard against free-text columns blowing up the category dictionaries.
+MAX_CATEGORIES = 10_000
+
+_MISSING = {"", "na", "nan", "null", "none"}
+
+
+class ColumnKind:
+    INT = "int"
+    FLOAT = "float"
+    CATEGORY = "category"
+
+
+def iter_csv_chunks(
+    stream: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[List[str]]]:
+    """
+    Yield the rows of a CSV text stream in lists of at most `chunk_size` rows.
+
+    Only one chunk is held in memory at a time. The header row is not skipped.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1.")
+    reader = csv.reader(stream)
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _is_missing(value: str) -> bool:
+    return value.strip().lower() in _MISSING
+
+
+def _infer_kind(values: List[str]) -> str:
+    kind = ColumnKind.INT
+    for value in values:
+        if _is_missing(value):
+            continue
+        try:
+            number = float(value)
+        except ValueError:
+            return ColumnKind.CATEGORY
+        if kind == ColumnKind.INT and not (math.isfinite(number) and number.is_integer()):
+            kind = ColumnKind.FLOAT
+    return kind
+
+
+@dataclass
+class _Column:
+    """
+    Incremental encoder of one CSV column into float64 values.
+
+    The kind (int/float/category) is inferred from the first chunk. Numeric columns
+    may be promoted from int to float later; a non-numeric value in a numeric column
+    is an error, because earlier chunks are already written.
+    """
+    name: str
+    kind: str
+    categories: Dict[str, int] = field(default_factory=dict)
+
+    def encode(self, values: List[str], first_line: int) -> np.ndarray:
+        out = np.empty(len(values), dtype=np.float64)
+        if self.kind == ColumnKind.CATEGORY:
+            for i, value in enumerate(values):
+                code = self.categories.get(value)
+                if code is None:
+                    if len(self.categories) >= MAX_CATEGORIES:
+                        raise ValueError(
+                            f"Column {self.name!r} has more than {MAX_CATEGORIES} distinct values."
+                        )
+                    code = self.categories[value] = len(self.categories)
+                out[i] = code
+            return out
+
+        for i, value in enumerate(values):
+            if _is_missing(value):
+                out[i] = np.nan
+                continue
+            try:
+                number = float(value)
+            except ValueError:
+                raise ValueError(
+                    f"Column {self.name!r} looked numeric, but line {first_line + i} "
+                    f"has value {value!r}."
+                ) from None
+            if self.kind == ColumnKind.INT and not number.is_integer():
+                self.kind = ColumnKind.FLOAT
+            out[i] = number
+        return out
+
+
+def _infer_task(target: _Column, y_codes: Dict[float, int]) -> TaskType:
+    if target.kind == ColumnKind.FLOAT:
+        return TaskType.REGRESSION
+    n_distinct = len(target.categories) if target.kind == ColumnKind.CATEGORY else len(y_codes)
+    if target.kind == ColumnKind.INT and n_distinct > MAX_INFERRED_CLASSES:
+        return TaskType.REGRESSION
+    return TaskType.BINARY if n_distinct == 2 else TaskType.MULTICLASS
+
+
+def ingest_csv(
+    stream: TextIO,
+    dataset_id: str,
+    name: Optional[str] = None,
+    target_column: Optional[str] = None,
+    task: Optional[TaskType] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    store: Optional[DatasetStore] = None,
+) -> DatasetMeta:
+    """
+    Stream a CSV file (with a header row) into the dataset store.
+
+    - rows are parsed in chunks of `chunk_size`, never the whole file at once,
+    - column kinds (int/float/category) are inferred from the first chunk;
+      categorical features are encoded as integer codes (the mapping is kept in
+      `meta.feature_categories`), missing numbers as NaN,
+    - each feature is appended to its own raw column file, then the columns are
+      assembled into a column-major X.npy,
+    - n_samples, n_features and class labels are computed incrementally,
+    - `target_column` defaults to the last column; `task` is inferred when not given.
+
+    Classification targets are re-encoded as 0..K-1 in sorted label order.
+    Returns the DatasetMeta of the registered dataset. Raises ValueError on bad input.
+    """
+    store = store or get_default_store()
+    if store is None:
+        raise ValueError("No dataset store configured. Set ML_CORE_DATA_DIR.")
+    if dataset_id in DATASET_LOADERS or store.exists(dataset_id):
+        raise ValueError(f"Dataset {dataset_id!r} already exists.")
+
+    chunks = iter_csv_chunks(stream, chunk_size)
+    first = next(chunks, None)
+    if not first or len(first) < 2:
+        raise ValueError("CSV must contain a header row and at least one data row.")
+
+    header = [h.strip() for h in first[0]]
+    if len(set(header)) != len(header):
+        raise ValueError("CSV header contains duplicate column names.")
+    if len(header) < 2:
+        raise ValueError("CSV must contain at least one feature column and a target column.")
+
+    target_column = target_column or header[-1]
+    if target_column not in header:
+        raise ValueError(f"Target column {target_column!r} not found in CSV header.")
+    target_pos = header.index(target_column)
+    feature_pos = [i for i in range(len(header)) if i != target_pos]
+
+    first_rows = first[1:]
+    columns = [
+        _Column(name=header[i], kind=_infer_kind([r[i] for r in first_rows if len(r) == len(header)]))
+        for i in range(len(header))
+    ]
+    target = columns[target_pos]
+    if task == TaskType.REGRESSION and target.kind == ColumnKind.CATEGORY:
+        raise ValueError(f"Target column {target_column!r} is not numeric; use a classification task.")
+
+    with store.staging(dataset_id) as tmp:
+        raw_dir = tmp / ".columns"
+        raw_dir.mkdir()
+        column_paths = [raw_dir / f"{j}.bin" for j in range(len(feature_pos))]
+        y_raw_path = raw_dir / "y.bin"
+
+        n_samples = 0
+        # Numeric targets: distinct value -> first-seen code (only needed for classification).
+        y_codes: Dict[float, int] = {}
+        for rows in _chain_rows(first_rows, chunks):
+            rows = [r for r in rows if r]  # skip blank lines
+            # Line numbers in messages count the header as line 1.
+            first_line = n_samples + 2
+            for row_no, row in enumerate(rows):
+                if len(row) != len(header):
+                    raise ValueError(
+                        f"Line {first_line + row_no} has {len(row)} fields, expected {len(header)}."
+                    )
+                if _is_missing(row[target_pos]):
+                    raise ValueError(
+                        f"Target column {target_column!r} is missing on line {first_line + row_no}."
+                    )
+
+            # Files are reopened per chunk, so very wide tables don't exhaust file descriptors.
+            for j, pos in enumerate(feature_pos):
+                with open(column_paths[j], "ab") as f:
+                    columns[pos].encode([r[pos] for r in rows], first_line).tofile(f)
+
+            y_chunk = target.encode([r[target_pos] for r in rows], first_line)
+            if target.kind != ColumnKind.CATEGORY and len(y_codes) <= MAX_INFERRED_CLASSES:
+                for v in np.unique(y_chunk):
+                    y_codes.setdefault(float(v), len(y_codes))
+            with open(y_raw_path, "ab") as f:
+                y_chunk.tofile(f)
+            n_samples += len(rows)
+
+        if n_samples == 0:
+            raise ValueError("CSV must contain a header row and at least one data row.")
+
+        task = task or _infer_task(target, y_codes)
+        if target.kind == ColumnKind.FLOAT and task != TaskType.REGRESSION:
+            raise ValueError(f"Target column {target_column!r} is continuous; use a regression task.")
+
+        write_npy_from_columns(tmp / X_FILE, column_paths, n_samples, np.float64)
+
+        class_labels: Optional[List[str]] = None
+        y_out = np.lib.format.open_memmap(
+            tmp / Y_FILE,
+            mode="w+",
+            dtype=np.float64 if task == TaskType.REGRESSION else np.int64,
+            shape=(n_samples,),
+        )
+        y_raw = np.memmap(y_raw_path, dtype=np.float64, mode="r", shape=(n_samples,))
+        if task == TaskType.REGRESSION:
+            for start in range(0, n_samples, chunk_size):
+                y_out[start:start + chunk_size] = y_raw[start:start + chunk_size]
+        else:
+            class_labels, to_class = _class_encoder(target, y_codes)
+            for start in range(0, n_samples, chunk_size):
+                y_out[start:start + chunk_size] = to_class(y_raw[start:start + chunk_size])
+        y_out.flush()
+        del y_out, y_raw
+
+        for p in column_paths + [y_raw_path]:
+            p.unlink()
+        raw_dir.rmdir()
+
+        if task == TaskType.BINARY and len(class_labels) != 2:
+            raise ValueError(
+                f"Binary classification needs exactly 2 classes, got {len(class_labels)}."
+            )
+
+        # Values by code, so inference inputs can be encoded the same way (see serving.py).
+        feature_categories = {
+            header[pos]: list(columns[pos].categories)
+            for pos in feature_pos
+            if columns[pos].kind == ColumnKind.CATEGORY
+        }
+
+        meta = DatasetMeta(
+            id=dataset_id,
+            name=name or dataset_id,
+            task=task,
+            n_samples=n_samples,
+            n_features=len(feature_pos),
+            n_classes=len(class_labels) if class_labels is not None else None,
+            class_labels=class_labels,
+            feature_names=[header[i] for i in feature_pos],
+            target_name=target_column,
+            feature_categories=feature_categories or None,
+        )
+        write_meta(tmp, meta)
+
+    return meta
+
+
+def _chain_rows(first_rows: List[List[str]], chunks: Iterator[List[List[str]]]) -> Iterator[List[List[str]]]:
+    if first_rows:
+        yield first_rows
+    yield from chunks
+
+
+def _class_encoder(target: _Column, y_codes: Dict[float, int]):
+    """
+    Build sorted class labels and a function mapping raw target values to class indices 0..K-1.
+    """
+    if target.kind == ColumnKind.CATEGORY:
+        labels = sorted(target.categories, key=_natural_key)
+        lut = np.empty(len(labels), dtype=np.int64)
+        for cls, label in enumerate(labels):
+            lut[target.categories[label]] = cls
+        return labels, lambda raw: lut[raw.astype(np.int64)]
+
+    if len(y_codes) > MAX_INFERRED_CLASSES:
+        raise ValueError(
+            f"Target column {target.name!r} has more than {MAX_INFERRED_CLASSES} distinct "
+            "values; use a regression task."
+        )
+    values = np.array(sorted(y_codes), dtype=np.float64)
+    return [str(int(v)) for v in values], lambda raw: np.searchsorted(values, raw)
+
+
+def _natural_key(label: str):
+    return [int(t) if t.isdigit() else t for t in re.split(r"(\d+)", label)]
+
+
+def ingest_csv_file(path: str | Path, dataset_id: str, **kwargs) -> DatasetMeta:
+    """
+    Convenience wrapper around `ingest_csv` for a CSV file on disk.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return ingest_csv(f, dataset_id, **kwargs)
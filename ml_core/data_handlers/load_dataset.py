@@ -1,106 +1,280 @@
-from dataclasses import dataclass
-from typing import Callable, Tuple, List
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import Callable, Iterator, Optional, Sequence, Tuple, List, Union
 import math
+import os
 import numpy as np
 from sklearn.datasets import load_iris, load_wine, load_breast_cancer, load_diabetes
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import KFold, StratifiedKFold, train_test_split
 
+from ml_core.common.cache import LRUCache, freeze_arrays
+from ml_core.data_handlers import fingerprint as fp
 from ml_core.data_handlers.metadata import DatasetMeta, TaskType
+from ml_core.data_handlers.store import DatasetStore, get_default_store
+from ml_core.data_handlers.synthetic import SyntheticSpec, load_synthetic, synthetic_meta
+
+
+def _gather(a: np.ndarray, index: np.ndarray) -> np.ndarray:
+    # np.asarray drops the np.memmap subclass, so the gathered copy is a plain in-memory array.
+    return np.take(np.asarray(a), index, axis=0)
 
 
 @dataclass
 class Dataset:
-    X_train: np.ndarray
-    X_test: np.ndarray
-    y_train: np.ndarray
-    y_test: np.ndarray
+    """
+    Train/test split over a full (X, y) dataset.
+
+    The split itself is kept as compact integer indices into the (shared, read-only)
+    X and y; X_train / X_test / y_train / y_test are gathered lazily, once, on first access.
+    """
+    X: np.ndarray
+    y: np.ndarray
+    train_index: np.ndarray
+    test_index: np.ndarray
     meta: DatasetMeta
 
+    @property
+    def dtype(self) -> np.dtype:
+        return self.X.dtype
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Content hash of X, y and meta; computed once per array and shared by all splits.
+        """
+        return fp.dataset_fingerprint(self.X, self.y, self.meta.to_dict())
+
+    @cached_property
+    def split_fingerprint(self) -> str:
+        """
+        Content hash of the data plus this split's train/test partition.
+        """
+        return fp.split_fingerprint(self.fingerprint, self.train_index, self.test_index)
+
+    @cached_property
+    def X_train(self) -> np.ndarray:
+        return _gather(self.X, self.train_index)
+
+    @cached_property
+    def X_test(self) -> np.ndarray:
+        return _gather(self.X, self.test_index)
+
+    @cached_property
+    def y_train(self) -> np.ndarray:
+        return _gather(self.y, self.train_index)
+
+    @cached_property
+    def y_test(self) -> np.ndarray:
+        return _gather(self.y, self.test_index)
+
+    def iter_train_batches(
+        self,
+        batch_size: int,
+        shuffle: bool = False,
+        random_state: Optional[int] = None,
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield (X, y) batches of the train split, gathered straight from the (memory-mapped) source.
+
+        Only one batch is materialized at a time; X_train is never built.
+        """
+        index = self.train_index
+        if shuffle:
+            index = np.random.default_rng(random_state).permutation(index)
+        return _iter_batches(self.X, self.y, index, batch_size)
+
+    def iter_test_batches(self, batch_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield (X, y) batches of the test split in a fixed order (matching y_test).
+        """
+        return _iter_batches(self.X, self.y, self.test_index, batch_size)
+
+
+def _iter_batches(
+    X: np.ndarray,
+    y: np.ndarray,
+    index: np.ndarray,
+    batch_size: int,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1.")
+    for start in range(0, len(index), batch_size):
+        batch = index[start:start + batch_size]
+        yield _gather(X, batch), _gather(y, batch)
+
+
+# Static metadata declarations.
+#
+# Listing datasets (e.g. `sync_datasets` on every container boot) must not load
+# any samples, so every built-in dataset publishes its DatasetMeta here and the
+# loaders below only produce (X, y). `tests/test_dataset_meta.py` keeps these
+# declarations in sync with the actual data.
+
+IRIS_META = DatasetMeta(
+    id="iris",
+    name="Iris",
+    task=TaskType.MULTICLASS,
+    n_samples=150,
+    n_features=4,
+    n_classes=3,
+    class_labels=["setosa", "versicolor", "virginica"],
+    feature_names=[
+        "sepal length (cm)",
+        "sepal width (cm)",
+        "petal length (cm)",
+        "petal width (cm)",
+    ],
+    target_name="species",
+)
+
+WINE_META = DatasetMeta(
+    id="wine",
+    name="Wine",
+    task=TaskType.MULTICLASS,
+    n_samples=178,
+    n_features=13,
+    n_classes=3,
+    class_labels=["class_0", "class_1", "class_2"],
+    feature_names=[
+        "alcohol",
+        "malic_acid",
+        "ash",
+        "alcalinity_of_ash",
+        "magnesium",
+        "total_phenols",
+        "flavanoids",
+        "nonflavanoid_phenols",
+        "proanthocyanins",
+        "color_intensity",
+        "hue",
+        "od280/od315_of_diluted_wines",
+        "proline",
+    ],
+    target_name="class",
+)
+
+BREAST_CANCER_META = DatasetMeta(
+    id="breast_cancer",
+    name="Breast Cancer",
+    task=TaskType.BINARY,
+    n_samples=569,
+    n_features=30,
+    n_classes=2,
+    class_labels=["malignant", "benign"],
+    feature_names=[
+        "mean radius",
+        "mean texture",
+        "mean perimeter",
+        "mean area",
+        "mean smoothness",
+        "mean compactness",
+        "mean concavity",
+        "mean concave points",
+        "mean symmetry",
+        "mean fractal dimension",
+        "radius error",
+        "texture error",
+        "perimeter error",
+        "area error",
+        "smoothness error",
+        "compactness error",
+        "concavity error",
+        "concave points error",
+        "symmetry error",
+        "fractal dimension error",
+        "worst radius",
+        "worst texture",
+        "worst perimeter",
+        "worst area",
+        "worst smoothness",
+        "worst compactness",
+        "worst concavity",
+        "worst concave points",
+        "worst symmetry",
+        "worst fractal dimension",
+    ],
+    target_name="class",
+)
+
+DIABETES_META = DatasetMeta(
+    id="diabetes",
+    name="Diabetes",
+    task=TaskType.REGRESSION,
+    n_samples=442,
+    n_features=10,
+    n_classes=None,
+    class_labels=None,
+    feature_names=["age", "sex", "bmi", "bp", "s1", "s2", "s3", "s4", "s5", "s6"],
+    target_name="disease_progression",
+)
+
+SINUS_META = DatasetMeta(
+    id="sinus",
+    name="Sinusoid Function",
+    task=TaskType.REGRESSION,
+    n_samples=2000,
+    n_features=1,
+    n_classes=None,
+    class_labels=None,
+    feature_names=None,
+    target_name="Value of sin(x)",
+)
+
+
+# Synthetic datasets used to measure how algorithm variants scale.
+# Larger variants can be streamed into the store with synthetic.write_synthetic.
+SYNTHETIC_CLASSIFICATION_SPEC = SyntheticSpec(
+    kind="classification", n_samples=20_000, n_features=20, n_classes=3, n_informative=8, seed=0,
+)
+SYNTHETIC_REGRESSION_SPEC = SyntheticSpec(
+    kind="regression", n_samples=20_000, n_features=20, n_informative=8, noise=0.5, seed=0,
+)
+SYNTHETIC_SPARSE_SPEC = SyntheticSpec(
+    kind="sparse", n_samples=5_000, n_features=500, density=0.02, noise=0.5, seed=0,
+)
+
+SYNTHETIC_CLASSIFICATION_META = synthetic_meta(
+    SYNTHETIC_CLASSIFICATION_SPEC, "synthetic_classification", "Synthetic Classification"
+)
+SYNTHETIC_REGRESSION_META = synthetic_meta(
+    SYNTHETIC_REGRESSION_SPEC, "synthetic_regression", "Synthetic Regression"
+)
+SYNTHETIC_SPARSE_META = synthetic_meta(
+    SYNTHETIC_SPARSE_SPEC, "synthetic_sparse", "Synthetic Sparse (high-dimensional)"
+)
+
+
 def _load_iris() -> Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]:
     bunch = load_iris()
-    meta = DatasetMeta(
-        id="iris",
-        name="Iris",
-        task=TaskType.MULTICLASS,
-        n_samples=bunch.data.shape[0],
-        n_features=bunch.data.shape[1],
-        n_classes=len(set(bunch.target)),
-        class_labels=[str(n) for n in list(bunch.target_names)],
-        feature_names=list(bunch.feature_names),
-        target_name="species",
-    )
-    return (bunch.data, bunch.target), meta
+    return (bunch.data, bunch.target), IRIS_META
 
 
 def _load_wine() -> Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]:
     bunch = load_wine()
-    meta = DatasetMeta(
-        id="wine",
-        name="Wine",
-        task=TaskType.MULTICLASS,
-        n_samples=bunch.data.shape[0],
-        n_features=bunch.data.shape[1],
-        n_classes=len(set(bunch.target)),
-        class_labels=[str(n) for n in list(bunch.target_names)],
-        feature_names=list(bunch.feature_names),
-        target_name="class",
-    )
-    return (bunch.data, bunch.target), meta
+    return (bunch.data, bunch.target), WINE_META
+
 
 def _load_breast_cancer() -> Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]:
     bunch = load_breast_cancer()
-    meta = DatasetMeta(
-        id="breast_cancer",
-        name="Breast Cancer",
-        task=TaskType.BINARY,
-        n_samples=bunch.data.shape[0],
-        n_features=bunch.data.shape[1],
-        n_classes=len(set(bunch.target)),
-        class_labels=[str(n) for n in list(bunch.target_names)],
-        feature_names=list(bunch.feature_names),
-        target_name="class",
-    )
-    return (bunch.data, bunch.target), meta
+    return (bunch.data, bunch.target), BREAST_CANCER_META
 
 
 def _load_diabetes() -> Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]:
     bunch = load_diabetes()
+    return (bunch.data, bunch.target), DIABETES_META
 
-    X = bunch.data
-    y = bunch.target  
-
-    meta = DatasetMeta(
-        id="diabetes",
-        name="Diabetes",
-        task=TaskType.REGRESSION,          
-        n_samples=X.shape[0],
-        n_features=X.shape[1],
-        n_classes=None,                    
-        class_labels=None,                 
-        feature_names=list(bunch.feature_names),
-        target_name="disease_progression", 
-    )
-
-    return (X, y), meta
 
 def _regression_sin() -> Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]:
-    X = np.linspace(-2*math.pi, 2*math.pi, 2000)
+    X = np.linspace(-2*math.pi, 2*math.pi, SINUS_META.n_samples)
     y = np.sin(X)
     X = X.reshape(-1, 1)
+    return (X, y), SINUS_META
 
-    meta = DatasetMeta(
-        id="sinus",
-        name="Sinusoid Function",
-        task=TaskType.REGRESSION,          
-        n_samples=X.shape[0],
-        n_features=X.shape[1],
-        n_classes=None,                    
-        class_labels=None,                 
-        feature_names=None,
-        target_name="Value of sin(x)", 
-    )
 
-    return (X, y), meta
+def _synthetic_loader(spec: SyntheticSpec, meta: DatasetMeta):
+    def _load() -> Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]:
+        return load_synthetic(spec), meta
+    return _load
 
 
 DATASET_LOADERS: dict[str, Callable[[], Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]]] = {
@@ -109,46 +283,390 @@ DATASET_LOADERS: dict[str, Callable[[], Tuple[Tuple[np.ndarray, np.ndarray], Dat
     "breast_cancer": _load_breast_cancer,
     "diabetes": _load_diabetes,
     "sinus": _regression_sin,
+    "synthetic_classification": _synthetic_loader(SYNTHETIC_CLASSIFICATION_SPEC, SYNTHETIC_CLASSIFICATION_META),
+    "synthetic_regression": _synthetic_loader(SYNTHETIC_REGRESSION_SPEC, SYNTHETIC_REGRESSION_META),
+    "synthetic_sparse": _synthetic_loader(SYNTHETIC_SPARSE_SPEC, SYNTHETIC_SPARSE_META),
 }
 
+DATASET_META: dict[str, DatasetMeta] = {
+    "iris": IRIS_META,
+    "wine": WINE_META,
+    "breast_cancer": BREAST_CANCER_META,
+    "diabetes": DIABETES_META,
+    "sinus": SINUS_META,
+    "synthetic_classification": SYNTHETIC_CLASSIFICATION_META,
+    "synthetic_regression": SYNTHETIC_REGRESSION_META,
+    "synthetic_sparse": SYNTHETIC_SPARSE_META,
+}
 
-def load_data(
-    name: str,
-    test_size: float = 0.3,
-    random_state: int = 42,
-) -> Dataset:
-    try:
-        (X, y), meta = DATASET_LOADERS[name]()
-    except KeyError:
+
+# In-process cache of raw (X, y, meta) tuples, keyed by dataset id.
+# Cached arrays are read-only, so a model's `fit` can never mutate shared data.
+DATASET_CACHE: LRUCache[Tuple[np.ndarray, np.ndarray, DatasetMeta]] = LRUCache(
+    max_entries=int(os.getenv("ML_CORE_DATASET_CACHE_ENTRIES", "16")),
+    max_bytes=int(os.getenv("ML_CORE_DATASET_CACHE_MB", "1024")) * 1024 * 1024,
+)
+
+
+def _load_raw(name: str) -> Tuple[np.ndarray, np.ndarray, DatasetMeta]:
+    """
+    Return the full (X, y, meta) of a dataset, served from DATASET_CACHE when possible.
+
+    Built-ins come from DATASET_LOADERS (through the store when ML_CORE_DATA_DIR is set);
+    any other name is looked up among the datasets ingested into the store.
+    """
+
+    def _load() -> Tuple[np.ndarray, np.ndarray, DatasetMeta]:
+        loader = DATASET_LOADERS.get(name)
+        store = get_default_store()
+        if loader is not None:
+            if store is not None:
+                return freeze_arrays(_load_from_store(store, name, loader))
+            (X, y), meta = loader()
+            return freeze_arrays((np.asarray(X), np.asarray(y), meta))
+        if store is not None and _stored_exists(store, name):
+            return freeze_arrays(store.open(name))
         available = ", ".join(DATASET_LOADERS.keys())
         raise ValueError(
             f"Unsupported dataset name: {name!r}. Available: {available}"
-        ) from None
+        )
+
+    return DATASET_CACHE.get_or_load(name, _load)
+
 
-    if meta.task == TaskType.REGRESSION:
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state
+def _stored_exists(store: DatasetStore, name: str) -> bool:
+    try:
+        return store.exists(name)
+    except ValueError:  # not a valid store name
+        return False
+
+
+def _load_from_store(
+    store: DatasetStore,
+    name: str,
+    loader: Callable[[], Tuple[Tuple[np.ndarray, np.ndarray], DatasetMeta]],
+) -> Tuple[np.ndarray, np.ndarray, DatasetMeta]:
+    """
+    Open a dataset from the on-disk store, materializing it on first use.
+
+    A snapshot whose sidecar no longer matches the static declaration is rebuilt.
+    """
+    expected = DATASET_META.get(name)
+    if not store.exists(name) or (expected is not None and store.read_meta(name) != expected):
+        (X, y), meta = loader()
+        store.write(X, y, meta)
+    X, y, meta = store.open(name)
+    return X, y, expected or meta
+
+
+def materialize_datasets(store: DatasetStore | None = None) -> List[str]:
+    """
+    Write a snapshot of every registered dataset into the store (default: ML_CORE_DATA_DIR).
+
+    Returns the ids of datasets that were (re)written.
+    """
+    store = store or get_default_store()
+    if store is None:
+        raise ValueError("No dataset store configured. Set ML_CORE_DATA_DIR.")
+
+    written: List[str] = []
+    for name, loader in DATASET_LOADERS.items():
+        if store.exists(name) and store.read_meta(name) == DATASET_META.get(name):
+            continue
+        (X, y), meta = loader()
+        store.write(X, y, meta)
+        written.append(name)
+    return written
+
+
+# Memoized train/test split indices, keyed by
+# (dataset, n_samples, test_size, random_state, stratify).
+SPLIT_CACHE: LRUCache[Tuple[np.ndarray, np.ndarray]] = LRUCache(
+    max_entries=int(os.getenv("ML_CORE_SPLIT_CACHE_ENTRIES", "256")),
+    max_bytes=int(os.getenv("ML_CORE_SPLIT_CACHE_MB", "256")) * 1024 * 1024,
+)
+
+
+def _index_dtype(n_samples: int) -> np.dtype:
+    return np.dtype(np.int32) if n_samples <= np.iinfo(np.int32).max else np.dtype(np.int64)
+
+
+def _split_indices(
+    name: str,
+    y: np.ndarray,
+    test_size: float,
+    random_state: int,
+    stratify: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (train_index, test_index) for a dataset, served from SPLIT_CACHE when possible.
+
+    Splitting an index range gives exactly the same partition as splitting (X, y) directly.
+    """
+    n_samples = y.shape[0]
+    key = (name, n_samples, float(test_size), random_state, stratify)
+
+    def _split() -> Tuple[np.ndarray, np.ndarray]:
+        indices = np.arange(n_samples, dtype=_index_dtype(n_samples))
+        train_index, test_index = train_test_split(
+            indices,
+            test_size=test_size,
+            random_state=random_state,
+            stratify=y if stratify else None,
         )
-    else:
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state, stratify=y
+        return freeze_arrays((train_index, test_index))
+
+    return SPLIT_CACHE.get_or_load(key, _split)
+
+
+ColumnSelector = Union[int, str]
+
+
+def _resolve_columns(meta: DatasetMeta, columns: Sequence[ColumnSelector]) -> List[int]:
+    """
+    Map feature names / positions to column indices, preserving the requested order.
+    """
+    names = meta.feature_names or []
+    resolved: List[int] = []
+    for col in columns:
+        if isinstance(col, str):
+            if col not in names:
+                raise ValueError(
+                    f"Unknown feature column {col!r} for dataset {meta.id!r}."
+                )
+            resolved.append(names.index(col))
+        elif isinstance(col, (int, np.integer)) and 0 <= col < meta.n_features:
+            resolved.append(int(col))
+        else:
+            raise ValueError(
+                f"Feature column index {col!r} is out of range for dataset {meta.id!r} "
+                f"with {meta.n_features} features."
+            )
+    if not resolved:
+        raise ValueError("At least one feature column must be selected.")
+    if len(set(resolved)) != len(resolved):
+        raise ValueError("Feature columns must not repeat.")
+    return resolved
+
+
+def _resolve_rows(meta: DatasetMeta, rows: Tuple[int, int]) -> Tuple[int, int]:
+    start, stop = rows
+    start, stop = max(0, int(start)), min(meta.n_samples, int(stop))
+    if stop <= start:
+        raise ValueError(f"Empty row range {rows!r} for dataset {meta.id!r}.")
+    return start, stop
+
+
+def _project(
+    name: str,
+    columns: Optional[Sequence[ColumnSelector]],
+    rows: Optional[Tuple[int, int]],
+) -> Tuple[np.ndarray, np.ndarray, DatasetMeta]:
+    """
+    Read only the selected feature columns / row range of a dataset.
+
+    With the column-major store layout each selected column is one contiguous run
+    of bytes, so only the projected bytes are read (and decoded) from disk.
+    """
+    X, y, meta = _load_raw(name)
+    col_index = _resolve_columns(meta, columns) if columns is not None else None
+    row_range = _resolve_rows(meta, rows) if rows is not None else None
+
+    key = (name, tuple(col_index) if col_index is not None else None, row_range)
+
+    def _read() -> Tuple[np.ndarray, np.ndarray, DatasetMeta]:
+        row_slice = slice(*row_range) if row_range is not None else slice(None)
+        X_part = np.asarray(X)[row_slice]
+        if col_index is not None:
+            X_part = X_part[:, col_index]
+        X_part = np.ascontiguousarray(X_part)
+        y_part = np.array(np.asarray(y)[row_slice])
+        projected = replace(
+            meta,
+            n_samples=X_part.shape[0],
+            n_features=X_part.shape[1],
+            feature_names=(
+                [meta.feature_names[i] for i in col_index]
+                if col_index is not None and meta.feature_names is not None
+                else meta.feature_names
+            ),
         )
+        if col_index is not None and meta.feature_categories is not None:
+            kept = {
+                name: values for name, values in meta.feature_categories.items()
+                if name in projected.feature_names
+            }
+            projected = replace(projected, feature_categories=kept or None)
+        return freeze_arrays((X_part, y_part, projected))
+
+    return DATASET_CACHE.get_or_load(key, _read)
+
+
+# Feature dtypes `load_data` can convert to.
+FEATURE_DTYPES = ("float32", "float64")
+
+
+def _as_dtype(key, X: np.ndarray, dtype: Optional[str]) -> np.ndarray:
+    """
+    Return X converted to `dtype` as a C-contiguous array, cached next to the original.
+
+    The converted copy is row-major, since every consumer (torch, xgboost, sklearn)
+    reads features row by row; no conversion happens if X already has that dtype.
+    """
+    if dtype is None:
+        return X
+    if dtype not in FEATURE_DTYPES:
+        raise ValueError(f"Unsupported feature dtype: {dtype!r}. Available: {', '.join(FEATURE_DTYPES)}")
+    if X.dtype == np.dtype(dtype):
+        return X
+
+    return DATASET_CACHE.get_or_load(
+        (key, dtype),
+        lambda: freeze_arrays(np.ascontiguousarray(X, dtype=dtype)),
+    )
+
+
+def _select(
+    name: str,
+    columns: Optional[Sequence[ColumnSelector]],
+    rows: Optional[Tuple[int, int]],
+    dtype: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray, DatasetMeta, str]:
+    """
+    Return (X, y, meta, split_key) of a dataset or of its projection.
+    """
+    if columns is None and rows is None:
+        X, y, meta = _load_raw(name)
+        return _as_dtype(name, X, dtype), y, meta, name
+    X, y, meta = _project(name, columns, rows)
+    # Key on the resolved selection: `rows` may be any (start, stop) sequence, e.g. a JSON list.
+    raw_meta = _load_raw(name)[2]
+    col_index = tuple(_resolve_columns(raw_meta, columns)) if columns is not None else None
+    row_range = _resolve_rows(raw_meta, rows) if rows is not None else None
+    key = (name, col_index, row_range)
+    split_key = name if row_range is None else f"{name}[{row_range[0]}:{row_range[1]}]"
+    return _as_dtype(key, X, dtype), y, meta, split_key
+
+
+def load_data(
+    name: str,
+    test_size: float = 0.3,
+    random_state: int = 42,
+    columns: Optional[Sequence[ColumnSelector]] = None,
+    rows: Optional[Tuple[int, int]] = None,
+    dtype: Optional[str] = None,
+) -> Dataset:
+    """
+    Load a dataset and split it into train/test.
+
+    - `columns` optionally selects a subset of feature columns (names or positions),
+    - `rows` optionally restricts the data to the half-open row range [start, stop),
+    - `dtype` optionally converts the features ("float32" or "float64"); the converted
+      copy is cached, so train/test batches are gathered without further conversion.
+
+    The split is computed on the selected rows.
+    """
+    X, y, meta, split_key = _select(name, columns, rows, dtype)
+
+    train_index, test_index = _split_indices(
+        split_key,
+        y,
+        test_size=test_size,
+        random_state=random_state,
+        stratify=meta.task != TaskType.REGRESSION,
+    )
 
     return Dataset(
-        X_train=X_train,
-        X_test=X_test,
-        y_train=y_train,
-        y_test=y_test,
+        X=X,
+        y=y,
+        train_index=train_index,
+        test_index=test_index,
         meta=meta,
     )
 
 
+def _fold_indices(
+    name: str,
+    y: np.ndarray,
+    n_folds: int,
+    random_state: int,
+    stratify: bool,
+) -> Tuple[Tuple[np.ndarray, np.ndarray], ...]:
+    """
+    Return the (train_index, test_index) pair of every k-fold split, served from SPLIT_CACHE.
+    """
+    n_samples = y.shape[0]
+    key = (name, n_samples, "kfold", n_folds, random_state, stratify)
+
+    def _split() -> Tuple[Tuple[np.ndarray, np.ndarray], ...]:
+        splitter = (StratifiedKFold if stratify else KFold)(
+            n_splits=n_folds, shuffle=True, random_state=random_state
+        )
+        dtype = _index_dtype(n_samples)
+        folds = tuple(
+            (train.astype(dtype), test.astype(dtype))
+            for train, test in splitter.split(np.zeros(n_samples), y if stratify else None)
+        )
+        return freeze_arrays(folds)
+
+    return SPLIT_CACHE.get_or_load(key, _split)
+
+
+def load_cv_folds(
+    name: str,
+    n_folds: int,
+    random_state: int = 42,
+    columns: Optional[Sequence[ColumnSelector]] = None,
+    rows: Optional[Tuple[int, int]] = None,
+    dtype: Optional[str] = None,
+) -> List[Dataset]:
+    """
+    Load a dataset and split it into `n_folds` shuffled (stratified for classification) folds.
+
+    Every returned Dataset shares the same read-only X and y; fold k tests on the k-th fold
+    and trains on the rest. `columns`, `rows` and `dtype` behave as in `load_data`.
+    """
+    X, y, meta, split_key = _select(name, columns, rows, dtype)
+    if not 2 <= n_folds <= meta.n_samples:
+        raise ValueError(f"cv_folds must be between 2 and {meta.n_samples}, got {n_folds}.")
+
+    folds = _fold_indices(
+        split_key,
+        y,
+        n_folds=n_folds,
+        random_state=random_state,
+        stratify=meta.task != TaskType.REGRESSION,
+    )
+    return [
+        Dataset(X=X, y=y, train_index=train_index, test_index=test_index, meta=meta)
+        for train_index, test_index in folds
+    ]
+
+
+def get_dataset_meta(name: str) -> DatasetMeta:
+    """
+    Returns metadata of a single dataset without loading its samples.
+    """
+    if name in DATASET_META:
+        return DATASET_META[name]
+    store = get_default_store()
+    if store is not None and _stored_exists(store, name):
+        return store.read_meta(name)
+    available = ", ".join(DATASET_META.keys())
+    raise ValueError(
+        f"Unsupported dataset name: {name!r}. Available: {available}"
+    )
+
+
 def get_all_dataset_meta() -> List[DatasetMeta]:
     """
-    Returns list of metadata for available datasets
+    Returns list of metadata for available datasets.
+
+    Built-ins come from the static DATASET_META declarations, ingested datasets from
+    the store sidecars - no loader is called.
     """
-    metas: List[DatasetMeta] = []
-    for name, loader in DATASET_LOADERS.items():
-        (_, _), meta = loader()
-        metas.append(meta)
-    return metas
\ No newline at end of file
+    metas = list(DATASET_META.values())
+    store = get_default_store()
+    if store is not None:
+        metas.extend(m for m in store.list_meta() if m.id not in DATASET_META)
+    return metas
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, asdict
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from ml_core.common.types import TaskType
 
@@ -20,7 +20,16 @@ class DatasetMeta:
     feature_names: Optional[List[str]] = None
     target_name: Optional[str] = None
 
+    # categorical features of ingested CSVs: feature name -> its values, listed by integer code
+    feature_categories: Optional[Dict[str, List[str]]] = None
+
     def to_dict(self):
         d = asdict(self)
         d["task"] = self.task.value
-        return d
\ No newline at end of file
+        return d
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DatasetMeta":
+        d = dict(data)
+        d["task"] = TaskType(d["task"])
+        return cls(**d)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml_core.data_handlers.metadata import DatasetMeta
+
+
+X_FILE = "X.npy"
+Y_FILE = "y.npy"
+META_FILE = "meta.json"
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_-]*$")
+
+# Copy buffer used when assembling .npy files from raw column files.
+_COPY_BUFFER = 1024 * 1024
+
+
+def write_npy_from_columns(
+    path: str | os.PathLike,
+    column_files: Sequence[str | os.PathLike],
+    n_rows: int,
+    dtype: np.dtype,
+) -> None:
+    """
+    Assemble a 2D column-major (Fortran-order) .npy file from raw per-column files.
+
+    Every column file holds `n_rows` values of `dtype` in native byte order. In Fortran
+    order the columns are laid out back to back, so this is a plain sequential copy and
+    never holds more than a copy buffer in memory.
+    """
+    dtype = np.dtype(dtype)
+    header = {
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": True,
+        "shape": (int(n_rows), len(column_files)),
+    }
+    with open(path, "wb") as out:
+        np.lib.format.write_array_header_2_0(out, header)
+        for column_file in column_files:
+            with open(column_file, "rb") as src:
+                shutil.copyfileobj(src, out, _COPY_BUFFER)
+
+
+class DatasetStore:
+    """
+    On-disk dataset store: one directory per dataset holding
+
+    - X.npy / y.npy  - raw arrays in numpy's .npy format; X is column-major (Fortran order),
+    - meta.json      - the DatasetMeta sidecar.
+
+    Arrays are opened with `np.load(mmap_mode="r")`, so every process reading the same
+    dataset shares its pages through the OS page cache instead of holding a private copy.
+    Because every feature column is contiguous on disk, reading a subset of columns
+    (optionally within a row range) only touches those columns' bytes.
+    Snapshots are written into a temporary directory and renamed into place, so readers
+    never see a half-written dataset.
+    """
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        self.root = Path(root)
+
+    def path_for(self, name: str) -> Path:
+        if not _NAME_RE.match(name or ""):
+            raise ValueError(
+                f"Invalid dataset name for the store: {name!r}. "
+                "Use letters, digits, '_' and '-' only."
+            )
+        return self.root / name
+
+    def exists(self, name: str) -> bool:
+        return (self.path_for(name) / META_FILE).is_file()
+
+    def write(self, X: np.ndarray, y: np.ndarray, meta: DatasetMeta) -> Path:
+        """
+        Atomically write a snapshot of (X, y, meta) under `meta.id`, replacing any previous one.
+        """
+        with self.staging(meta.id) as tmp:
+            np.save(tmp / X_FILE, np.asfortranarray(X), allow_pickle=False)
+            np.save(tmp / Y_FILE, np.asarray(y), allow_pickle=False)
+            write_meta(tmp, meta)
+        return self.path_for(meta.id)
+
+    @contextmanager
+    def staging(self, name: str) -> Iterator[Path]:
+        """
+        Yield a temporary directory to build a snapshot of `name` in.
+
+        On normal exit the directory is published (renamed into place); on error it is discarded.
+        Writers must create X.npy, y.npy and meta.json inside it (see `write_meta`).
+        """
+        self.path_for(name)  # validate early
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix=f".{name}-", dir=self.root))
+        try:
+            yield tmp
+            self._publish(tmp, name)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def open(self, name: str) -> Tuple[np.ndarray, np.ndarray, DatasetMeta]:
+        """
+        Open a stored dataset; X and y are read-only memory maps.
+        """
+        path = self.path_for(name)
+        if not (path / META_FILE).is_file():
+            raise ValueError(f"Dataset {name!r} is not materialized in {self.root}.")
+        X = np.load(path / X_FILE, mmap_mode="r", allow_pickle=False)
+        y = np.load(path / Y_FILE, mmap_mode="r", allow_pickle=False)
+        return X, y, self.read_meta(name)
+
+    def read_meta(self, name: str) -> DatasetMeta:
+        data = json.loads((self.path_for(name) / META_FILE).read_text(encoding="utf-8"))
+        return DatasetMeta.from_dict(data)
+
+    def list_meta(self) -> List[DatasetMeta]:
+        """
+        Metadata of every stored dataset, read from the sidecars only.
+        """
+        if not self.root.is_dir():
+            return []
+        return [
+            self.read_meta(p.name)
+            for p in sorted(self.root.iterdir())
+            if not p.name.startswith(".") and (p / META_FILE).is_file()
+        ]
+
+    def delete(self, name: str) -> None:
+        shutil.rmtree(self.path_for(name), ignore_errors=True)
+
+    def _publish(self, tmp: Path, name: str) -> Path:
+        final = self.path_for(name)
+        if final.exists():
+            # Move the old snapshot aside first; readers that already mapped it
+            # keep their pages until they close the files.
+            old = Path(tempfile.mkdtemp(prefix=f".{name}-old-", dir=self.root))
+            os.replace(final, old / name)
+            shutil.rmtree(old, ignore_errors=True)
+        try:
+            os.replace(tmp, final)
+        except OSError:
+            # Another process published the same dataset concurrently - keep theirs.
+            if not (final / META_FILE).is_file():
+                raise
+        return final
+
+
+def write_meta(directory: Path, meta: DatasetMeta) -> None:
+    (directory / META_FILE).write_text(json.dumps(meta.to_dict()), encoding="utf-8")
+
+
+_default_store: Optional[DatasetStore] = None
+
+
+def get_default_store() -> Optional[DatasetStore]:
+    """
+    Store configured through the ML_CORE_DATA_DIR environment variable, or None if unset.
+    """
+    global _default_store
+    root = os.getenv("ML_CORE_DATA_DIR")
+    if not root:
+        return None
+    if _default_store is None or _default_store.root != Path(root):
+        _default_store = DatasetStore(root)
+    return _default_store
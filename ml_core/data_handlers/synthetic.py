@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml_core.common.types import TaskType
+from ml_core.data_handlers.metadata import DatasetMeta
+from ml_core.data_handlers.store import X_FILE, Y_FILE, DatasetStore, get_default_store, write_meta
+
+
+# Rows per generated block. Every block has its own RNG stream derived from
+# (seed, block index), so the data never depends on how a consumer batches it.
+BLOCK_ROWS = 65_536
+
+Chunk = Tuple[np.ndarray, np.ndarray]
+
+
+def _block_rng(seed: int, block: int) -> np.random.Generator:
+    # Stream 0 is reserved for the model parameters (centroids, coefficients).
+    return np.random.default_rng([seed, block + 1])
+
+
+def _param_rng(seed: int) -> np.random.Generator:
+    return np.random.default_rng([seed, 0])
+
+
+def _blocks(n_samples: int) -> Iterator[Tuple[int, int]]:
+    for block, start in enumerate(range(0, n_samples, BLOCK_ROWS)):
+        yield block, min(BLOCK_ROWS, n_samples - start)
+
+
+def _class_weights(n_classes: int, weights: Optional[Sequence[float]]) -> np.ndarray:
+    if weights is None:
+        return np.full(n_classes, 1.0 / n_classes)
+    w = np.asarray(weights, dtype=np.float64)
+    if w.shape != (n_classes,) or (w < 0).any() or w.sum() <= 0:
+        raise ValueError(f"weights must be {n_classes} non-negative numbers, got {list(weights)!r}.")
+    return w / w.sum()
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """
+    Parameters of a synthetic dataset. Together with `seed` they fully determine the data.
+
+    kind:
+      - "classification" - Gaussian class clusters in `n_informative` dimensions,
+        the remaining features are pure noise; `noise` is the within-class std,
+      - "regression"     - linear target on `n_informative` features plus Gaussian noise,
+      - "sparse"         - high-dimensional rows with a `density` fraction of non-zeros and
+        a linear score; regression, or classification by thresholding the score.
+
+    `weights` sets the class balance (classification and sparse classification).
+    The task is derived from `kind` and `n_classes`; pass task=REGRESSION for a sparse regression.
+    """
+    kind: str
+    n_samples: int
+    n_features: int
+    task: TaskType = TaskType.BINARY
+    n_classes: int = 2
+    n_informative: Optional[int] = None
+    noise: float = 1.0
+    weights: Optional[Tuple[float, ...]] = None
+    density: float = 0.01
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.kind not in ("classification", "regression", "sparse"):
+            raise ValueError(f"Unknown synthetic dataset kind: {self.kind!r}")
+        if self.n_samples < 1 or self.n_features < 1:
+            raise ValueError("n_samples and n_features must be >= 1.")
+        # The task follows from the kind (and n_classes); only "sparse" lets the caller choose.
+        if self.kind == "regression" or (self.kind == "sparse" and self.task == TaskType.REGRESSION):
+            task = TaskType.REGRESSION
+        elif self.n_classes < 2:
+            raise ValueError("Classification needs n_classes >= 2.")
+        else:
+            task = TaskType.BINARY if self.n_classes == 2 else TaskType.MULTICLASS
+        object.__setattr__(self, "task", task)
+        if not 0.0 < self.density <= 1.0:
+            raise ValueError("density must be in (0, 1].")
+
+    @property
+    def informative(self) -> int:
+        return min(self.n_informative or self.n_features, self.n_features)
+
+
+def generate(spec: SyntheticSpec) -> Iterator[Chunk]:
+    """
+    Yield (X_chunk, y_chunk) blocks of at most BLOCK_ROWS rows, deterministically from `spec`.
+
+    Peak memory is one block, whatever `spec.n_samples` is.
+    """
+    if spec.kind == "classification":
+        return _generate_classification(spec)
+    if spec.kind == "regression":
+        return _generate_regression(spec)
+    return _generate_sparse(spec)
+
+
+def _generate_classification(spec: SyntheticSpec) -> Iterator[Chunk]:
+    weights = _class_weights(spec.n_classes, spec.weights)
+    centers = _param_rng(spec.seed).normal(scale=2.0, size=(spec.n_classes, spec.informative))
+
+    for block, rows in _blocks(spec.n_samples):
+        rng = _block_rng(spec.seed, block)
+        y = rng.choice(spec.n_classes, size=rows, p=weights)
+        X = rng.standard_normal((rows, spec.n_features))
+        X[:, : spec.informative] *= spec.noise
+        X[:, : spec.informative] += centers[y]
+        yield X, y.astype(np.int64)
+
+
+def _generate_regression(spec: SyntheticSpec) -> Iterator[Chunk]:
+    coef = _param_rng(spec.seed).normal(size=spec.informative)
+
+    for block, rows in _blocks(spec.n_samples):
+        rng = _block_rng(spec.seed, block)
+        X = rng.standard_normal((rows, spec.n_features))
+        y = X[:, : spec.informative] @ coef + spec.noise * rng.standard_normal(rows)
+        yield X, y
+
+
+def _generate_sparse(spec: SyntheticSpec) -> Iterator[Chunk]:
+    coef = _param_rng(spec.seed).normal(size=spec.n_features)
+    score_std = float(np.sqrt(spec.density * (coef @ coef) + spec.noise ** 2))
+
+    thresholds: List[float] = []
+    if spec.task != TaskType.REGRESSION:
+        # Class k covers the score quantiles between cumulative weights k-1 and k.
+        cumulative = np.cumsum(_class_weights(spec.n_classes, spec.weights))[:-1]
+        thresholds = [score_std * NormalDist().inv_cdf(min(max(c, 1e-12), 1 - 1e-12)) for c in cumulative]
+
+    for block, rows in _blocks(spec.n_samples):
+        rng = _block_rng(spec.seed, block)
+        mask = rng.random((rows, spec.n_features)) < spec.density
+        X = np.zeros((rows, spec.n_features))
+        X[mask] = rng.standard_normal(int(mask.sum()))
+        score = X @ coef + spec.noise * rng.standard_normal(rows)
+        if spec.task == TaskType.REGRESSION:
+            yield X, score
+        else:
+            yield X, np.searchsorted(thresholds, score).astype(np.int64)
+
+
+def synthetic_meta(spec: SyntheticSpec, dataset_id: str, name: str) -> DatasetMeta:
+    is_classification = spec.task != TaskType.REGRESSION
+    return DatasetMeta(
+        id=dataset_id,
+        name=name,
+        task=spec.task,
+        n_samples=spec.n_samples,
+        n_features=spec.n_features,
+        n_classes=spec.n_classes if is_classification else None,
+        class_labels=[str(k) for k in range(spec.n_classes)] if is_classification else None,
+        feature_names=None,
+        target_name="target",
+    )
+
+
+def load_synthetic(spec: SyntheticSpec) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the whole dataset in memory. Meant for the small registered datasets;
+    use `write_synthetic` for large ones.
+    """
+    chunks = list(generate(spec))
+    return np.concatenate([c[0] for c in chunks]), np.concatenate([c[1] for c in chunks])
+
+
+def write_synthetic(
+    spec: SyntheticSpec,
+    dataset_id: str,
+    name: Optional[str] = None,
+    store: Optional[DatasetStore] = None,
+) -> DatasetMeta:
+    """
+    Stream a synthetic dataset into the dataset store block by block.
+
+    X.npy is preallocated column-major and filled through a memory map, so a
+    10M-row dataset never needs a 10M-row temporary. The result is served by
+    `load_data(dataset_id)` like any other stored dataset.
+    """
+    store = store or get_default_store()
+    if store is None:
+        raise ValueError("No dataset store configured. Set ML_CORE_DATA_DIR.")
+
+    meta = synthetic_meta(spec, dataset_id, name or dataset_id)
+    y_dtype = np.float64 if spec.task == TaskType.REGRESSION else np.int64
+
+    with store.staging(dataset_id) as tmp:
+        X_out = np.lib.format.open_memmap(
+            tmp / X_FILE, mode="w+", dtype=np.float64,
+            shape=(spec.n_samples, spec.n_features), fortran_order=True,
+        )
+        y_out = np.lib.format.open_memmap(tmp / Y_FILE, mode="w+", dtype=y_dtype, shape=(spec.n_samples,))
+        start = 0
+        for X, y in generate(spec):
+            X_out[start:start + len(y)] = X
+            y_out[start:start + len(y)] = y
+            start += len(y)
+        X_out.flush()
+        y_out.flush()
+        del X_out, y_out
+        write_meta(tmp, meta)
+
+    return meta
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ml_core.common.cache import LRUCache
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def canonical_hash(payload: Dict[str, Any]) -> str:
+    """
+    Stable hash of a JSON-like payload: key order and numpy scalar types don't matter.
+    """
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of run_experiment results, keyed by `canonical_hash` of the run.
+
+    - memory tier: a per-process LRUCache bounded by entry count,
+    - disk tier (optional): one JSON file per result under `directory`, shared by
+      every process pointing at the same directory; written atomically.
+
+    Disk hits are promoted into the memory tier.
+    """
+
+    def __init__(self, directory: Optional[str | os.PathLike] = None, max_entries: int = 256) -> None:
+        self.directory = Path(directory) if directory else None
+        self.memory: LRUCache[Dict[str, Any]] = LRUCache(max_entries=max_entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        result = self.memory.get(key)
+        if result is not None or self.directory is None:
+            return result
+        try:
+            text = self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            result = json.loads(text)
+        except ValueError:  # truncated / corrupt file: treat as a miss
+            return None
+        self.memory.put(key, result)
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        self.memory.put(key, result)
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{key}-", suffix=".json", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f, default=_json_default)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """
+        Drop the memory tier and every result file of the disk tier.
+        """
+        self.memory.clear()
+        if self.directory is not None and self.directory.is_dir():
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.json"
+
+
+_default_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Process-wide result cache. The disk tier is enabled by the ML_CORE_RESULT_CACHE_DIR
+    environment variable; ML_CORE_RESULT_CACHE_ENTRIES bounds the memory tier.
+    """
+    global _default_cache
+    directory = os.getenv("ML_CORE_RESULT_CACHE_DIR") or None
+    if _default_cache is None or _default_cache.directory != (Path(directory) if directory else None):
+        _default_cache = ResultCache(
+            directory,
+            max_entries=int(os.getenv("ML_CORE_RESULT_CACHE_ENTRIES", "256")),
+        )
+    return _default_cache
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
-from ml_core.data_handlers.load_dataset import load_data, Dataset
+from ml_core.data_handlers.load_dataset import load_cv_folds, load_data, Dataset
+from ml_core.data_handlers import fingerprint as fp
+from ml_core.common.parallel import default_workers, process_pool
+from ml_core.common.cancellation import Deadline, RunTimeout, fit_in_subprocess
+from ml_core.common.encoding import encode_array
+from ml_core.common.profiling import StageTimer
+from ml_core.common.progress import DEFAULT_PROGRESS_INTERVAL, ProgressReporter
+from ml_core.algorithms.classical_algorithms.random_forest import FOREST_TYPES, fit_forest
+from ml_core.algorithms.classical_algorithms.xgboost import IterationCallback
+from ml_core.result_cache import canonical_hash, get_result_cache
+from ml_core.artifacts import MANIFEST_FILE, save_model, schema_from_meta
+from ml_core import warm_start
 from ml_core.common.types import TaskType
 from ml_core.evaluation.metrics import EvaluationReport
 
@@ -31,17 +45,73 @@ class RunConfig:
     test_size: float = 0.3
     random_state: int = 42
 
+    # Optional projection: subset of feature columns (names or positions) and row range [start, stop)
+    feature_columns: Optional[List[Union[str, int]]] = None
+    row_range: Optional[Tuple[int, int]] = None
+
+    # Feature dtype ("float32" or "float64"); None keeps the dataset's own (float64 for built-ins).
+    # float32 halves the data's memory and matches what the MLP and XGBoost compute in.
+    dtype: Optional[str] = None
+
+    # Out-of-core mode: models with `fit_batches` (mlp) train on shuffled train batches of this
+    # size streamed from the dataset, and predictions are made batch by batch as well.
+    stream_batch_size: Optional[int] = None
+
+    # Cross-validation mode: when set, test_size is ignored and the model is fitted on
+    # `cv_folds` folds in parallel (at most `n_jobs` processes; 1 runs them in-process).
+    cv_folds: Optional[int] = None
+    n_jobs: Optional[int] = None
+
+    # Learning-curve mode: fit on growing fractions of the train split (e.g. [0.1, 0.25, 0.5, 1.0]),
+    # in parallel like the CV folds, and report train/test metrics and fit time per fraction.
+    # Smaller fractions are subsets of larger ones. Not combined with cv_folds.
+    learning_curve: Optional[List[float]] = None
+
+    # Per-stage memory accounting: "sampled" (RSS, low overhead), "precise" (+ tracemalloc heap peaks)
+    # or None to disable. See common/profiling.py.
+    memory_profile: Optional[str] = "sampled"
+
+    # Wall-clock budget in seconds for the whole run. The MLP and XGBoost stop cooperatively
+    # (per mini-batch / boosting round); other estimators are fitted in a child process that
+    # is killed when the budget runs out. Exceeding it raises RunTimeout.
+    time_budget: Optional[float] = None
+    # With `hard_timeout` off, no child process is forked: random forests stop between growth
+    # steps and svm / logistic fits are only checked once they finish. That keeps their memory
+    # in this process (see profiling.py) and avoids copying the fitted model back.
+    hard_timeout: bool = True
+
+    # Training progress: called with an event dict (unit "epoch" + loss for the mlp, "round" for
+    # xgboost, "trees" for random forests, "fold" for CV runs, "fraction" for learning curves) at most every `progress_interval`
+    # seconds; see common/progress.py. Raising from it aborts the run. Not forwarded from the
+    # pool workers of `run_experiments`.
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    progress_interval: float = DEFAULT_PROGRESS_INTERVAL
+
+    # Save the fitted model as an artifact under this directory (see artifacts.py);
+    # result["artifact"] then describes it. Not supported with cv_folds or learning_curve.
+    artifact_dir: Optional[str] = None
+
+    # Keep the fitted model in memory (see warm_start.py) and, when a fit of the same config
+    # with a smaller budget hyperparameter (n_estimators, max_epochs) is kept, train that one
+    # further instead of starting over; result["warm_start"] then says from which budget.
+    # Single-split runs only.
+    warm_start: bool = False
+
+    # Serve identical runs (same data content, split and validated config) from the result cache.
+    use_cache: bool = False
+
     # Output config
     include_predictions: bool = True
     include_probabilities: bool = False  # only used for classification tasks
+    # Store prediction arrays compressed (see common/encoding.py) instead of as JSON lists.
+    compact_predictions: bool = False
 
 
-def _build_model(algorithm_name: str, task: TaskType, hyperparams: Dict[str, Any] | None):
+def _resolve_algorithm(algorithm_name: str, task: TaskType, hyperparams: Dict[str, Any] | None):
     """
-    Construct a model instance based on algorithm name and task.
-
-    - All algorithms get their hyperparameters validated based on HyperparameterSpec (validate_params_against_specs)
+    Look up the algorithm and its variant for `task`, and validate the hyperparameters.
 
+    Returns (algorithm, variant, validated_hyperparams).
     """
     hyperparams = hyperparams or {}
 
@@ -51,25 +121,44 @@ def _build_model(algorithm_name: str, task: TaskType, hyperparams: Dict[str, Any
     specs_map = {s.name: s for s in algorithm_variant.hyperparams}
     validated = validate_params_against_specs(specs_map, hyperparams)
 
+    return general_algorithm, algorithm_variant, validated
+
+
+def _build_model(algorithm_name: str, task: TaskType, hyperparams: Dict[str, Any] | None):
+    """
+    Construct a model instance based on algorithm name and task.
+
+    - All algorithms get their hyperparameters validated based on HyperparameterSpec (validate_params_against_specs)
+
+    """
+    general_algorithm, algorithm_variant, validated = _resolve_algorithm(algorithm_name, task, hyperparams)
     return algorithm_variant.factory(validated), general_algorithm.kind
 
 def _predictions_to_dict(
     dataset: Dataset,
     y_pred: np.ndarray,
     y_proba: Optional[np.ndarray] = None,
+    y_true: Optional[np.ndarray] = None,
+    compact: bool = False,
 ) -> Dict[str, Any]:
     """
     Serialize predictions and ground truth for potential plotting / inspection.
-    """
-    y_true = dataset.y_test
 
-    result: Dict[str, Any] = {
-        "y_true": y_true.tolist(),
-        "y_pred": y_pred.tolist(),
-    }
+    `y_true` defaults to the test split of `dataset`. With `compact`, the arrays are
+    stored in the compressed form of common/encoding.py instead of lists
+    (probabilities as float32); `decode_predictions` turns them back into lists.
+    """
+    if y_true is None:
+        y_true = dataset.y_test
 
-    if y_proba is not None:
-        result["y_proba"] = y_proba.tolist()
+    if compact:
+        result: Dict[str, Any] = {"y_true": encode_array(y_true), "y_pred": encode_array(y_pred)}
+        if y_proba is not None:
+            result["y_proba"] = encode_array(y_proba, allow_float32=True)
+    else:
+        result = {"y_true": y_true.tolist(), "y_pred": y_pred.tolist()}
+        if y_proba is not None:
+            result["y_proba"] = y_proba.tolist()
 
     if dataset.meta.task in (TaskType.BINARY, TaskType.MULTICLASS):
         result["class_labels"] = (
@@ -81,7 +170,7 @@ def _predictions_to_dict(
 
 def _predict_proba(
     model: Any,
-    X: np.ndarray,
+    X: Union[np.ndarray, "_BatchedTestSet"],
     task: TaskType,
     include_probabilities: bool,
 ) -> Optional[np.ndarray]:
@@ -98,9 +187,688 @@ def _predict_proba(
     if not hasattr(model, "predict_proba"):
         return None
 
-    proba = model.predict_proba(X)
-    proba = np.asarray(proba)
-    return proba
+    return _apply(model.predict_proba, X)
+
+
+def _install_hooks(
+    model: Any,
+    deadline: Optional[Deadline],
+    reporter: Optional[ProgressReporter],
+    rounds_done: int = 0,
+) -> None:
+    """
+    Attach cooperative cancellation and progress reporting to models that support them (see `_fit`).
+
+    `rounds_done` are boosting rounds of a continued XGBoost fit that were trained before;
+    rounds are reported out of the full budget, counting those.
+    """
+    if hasattr(model, "on_batch_end"):  # mlp
+        if deadline is not None:
+            def check() -> None:
+                deadline.progress["epochs_completed"] = len(model.loss_history_)
+                deadline.check("fit")
+
+            model.on_batch_end = check
+        if reporter is not None:
+            def epoch_done(epoch: int, avg_loss: float) -> None:
+                reporter.emit("epoch", epoch + 1, model.cfg.max_epochs, loss=avg_loss)
+
+            model.on_epoch_end = epoch_done
+    elif hasattr(model, "get_xgb_params"):
+        total = rounds_done + model.get_params().get("n_estimators")
+
+        def after_round(iteration: int) -> bool:
+            # `iteration` restarts at 0 when boosting continues from an existing booster.
+            rounds = rounds_done + iteration + 1
+            if reporter is not None:
+                reporter.emit("round", rounds, total)
+            if deadline is None:
+                return False
+            deadline.progress["boosting_rounds"] = rounds
+            return deadline.expired()
+
+        model.set_params(callbacks=[IterationCallback(after_round)])
+
+
+def _remove_hooks(model: Any) -> None:
+    # Hooks are closures; drop them so the fitted model stays picklable.
+    if hasattr(model, "on_batch_end"):
+        model.on_batch_end = None
+        model.on_epoch_end = None
+    elif hasattr(model, "get_xgb_params"):
+        model.set_params(callbacks=None)
+
+
+def _supports_cancellation(model: Any) -> bool:
+    return hasattr(model, "on_batch_end") or hasattr(model, "get_xgb_params")
+
+
+def _fit_forest(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    deadline: Optional[Deadline],
+    reporter: Optional[ProgressReporter],
+    hard_timeout: bool = True,
+) -> Any:
+    """
+    Grow a random forest in steps, reporting the trees built. Under a deadline it grows
+    in a child process (see `_fit`) that sends its progress back to the parent, or, without
+    `hard_timeout`, in this process, checking the deadline after every step.
+    """
+    total = model.n_estimators
+
+    def trees_built(n: int) -> None:
+        if deadline is not None:
+            deadline.progress["trees_built"] = n
+        if reporter is not None:
+            reporter.emit("trees", n, total)
+
+    if deadline is None:
+        return fit_forest(model, X, y, trees_built)
+    if not hard_timeout:
+        def step_done(n: int) -> None:
+            trees_built(n)
+            deadline.check("fit")
+
+        return fit_forest(model, X, y, step_done)
+    return fit_in_subprocess(
+        model, X, y, deadline,
+        fit=lambda m, X, y, emit: fit_forest(m, X, y, emit),
+        on_event=trees_built,
+    )
+
+
+def _fit(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    deadline: Optional[Deadline],
+    reporter: Optional[ProgressReporter] = None,
+    fit_params: Optional[Dict[str, Any]] = None,
+    hard_timeout: bool = True,
+) -> Any:
+    """
+    Fit `model`, enforcing `deadline` and reporting progress to `reporter` if given.
+    Returns the fitted model, which is a copy when the fit ran in a child process.
+
+    Models without hooks or progress (svm, logistic) report nothing. `fit_params`
+    (continued XGBoost training, see warm_start.py) go to models with hooks only.
+    See RunConfig.hard_timeout for `hard_timeout`.
+    """
+    fit_params = fit_params or {}
+    if isinstance(model, FOREST_TYPES) and (
+        reporter is not None or (deadline is not None and not hard_timeout)
+    ):
+        return _fit_forest(model, X, y, deadline, reporter, hard_timeout)
+    if deadline is None and (reporter is None or not _supports_cancellation(model)):
+        model.fit(X, y, **fit_params)
+        return model
+    if not _supports_cancellation(model):
+        if hard_timeout:
+            return fit_in_subprocess(model, X, y, deadline)
+        model.fit(X, y)
+        deadline.check("fit")
+        return model
+
+    booster = fit_params.get("xgb_model")
+    _install_hooks(model, deadline, reporter, booster.num_boosted_rounds() if booster is not None else 0)
+    try:
+        model.fit(X, y, **fit_params)
+    finally:
+        _remove_hooks(model)
+    if deadline is not None:
+        deadline.check("fit")  # XGBoost stops early without raising
+    return model
+
+
+def _fit_streaming(model: Any, dataset: Dataset, batch_size: int, random_state: int) -> None:
+    """
+    Fit a model with `fit_batches` on the train split, one batch in memory at a time.
+
+    Every epoch reshuffles the batches with its own seed, so runs stay reproducible.
+    """
+    def make_batches(epoch: int):
+        return dataset.iter_train_batches(batch_size, shuffle=True, random_state=random_state + epoch)
+
+    if dataset.meta.task == TaskType.REGRESSION:
+        model.fit_batches(make_batches)
+    else:
+        model.fit_batches(make_batches, n_classes=dataset.meta.n_classes)
+
+
+class _BatchedTestSet:
+    """
+    Stand-in for X_test that applies a model method batch by batch (see `_apply`).
+    """
+
+    def __init__(self, dataset: Dataset, batch_size: int) -> None:
+        self.dataset = dataset
+        self.batch_size = batch_size
+
+    def apply(self, fn) -> np.ndarray:
+        return np.concatenate(
+            [np.asarray(fn(X)) for X, _ in self.dataset.iter_test_batches(self.batch_size)]
+        )
+
+
+def _apply(fn, X: Union[np.ndarray, _BatchedTestSet]) -> np.ndarray:
+    if isinstance(X, _BatchedTestSet):
+        return X.apply(fn)
+    return np.asarray(fn(X))
+
+
+def _fit_predict(
+    model: Any,
+    dataset: Dataset,
+    config: RunConfig,
+    timer: StageTimer,
+    deadline: Optional[Deadline] = None,
+    reporter: Optional[ProgressReporter] = None,
+    fit_params: Optional[Dict[str, Any]] = None,
+) -> Tuple[Any, np.ndarray, Optional[np.ndarray]]:
+    """
+    Fit `model` on the train split and return (fitted_model, y_pred, y_proba) for the test split.
+
+    Gathering the split arrays counts as "load"; see `run_experiment` for the stages.
+    """
+    # Streamed in batches when requested and supported
+    streaming = config.stream_batch_size is not None and hasattr(model, "fit_batches")
+    if streaming:
+        with timer.stage("fit"):
+            _install_hooks(model, deadline, reporter)
+            try:
+                _fit_streaming(model, dataset, config.stream_batch_size, config.random_state)
+            finally:
+                _remove_hooks(model)
+        X_test: Union[np.ndarray, _BatchedTestSet] = _BatchedTestSet(dataset, config.stream_batch_size)
+    else:
+        with timer.stage("load"):
+            X_train, y_train, X_test = dataset.X_train, dataset.y_train, dataset.X_test
+        with timer.stage("fit"):
+            model = _fit(model, X_train, y_train, deadline, reporter, fit_params, config.hard_timeout)
+
+    if deadline is not None:
+        deadline.check("predict")
+    with timer.stage("predict"):
+        y_pred = _apply(model.predict, X_test)
+
+    # Optionally predict probabilities for classification
+    with timer.stage("predict_proba"):
+        y_proba = _predict_proba(
+            model=model,
+            X=X_test,
+            task=dataset.meta.task,
+            include_probabilities=config.include_probabilities,
+        )
+    return model, y_pred, y_proba
+
+
+def _evaluate(dataset: Dataset, y_pred: np.ndarray, y_true: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    # `y_true` defaults to the test split of `dataset`.
+    report = EvaluationReport(
+        y_true=dataset.y_test if y_true is None else y_true,
+        y_pred=y_pred,
+        task=dataset.meta.task,
+        target_names=dataset.meta.class_labels,
+    )
+    return report.summary()
+
+
+def _load_folds(config: RunConfig) -> List[Dataset]:
+    return load_cv_folds(
+        name=config.dataset_name,
+        n_folds=config.cv_folds,
+        random_state=config.random_state,
+        columns=config.feature_columns,
+        rows=config.row_range,
+        dtype=config.dtype,
+    )
+
+
+def _run_fold(config: RunConfig, fold: int, expires_at: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Fit and evaluate one cross-validation fold. Runs inside a pool worker.
+
+    Forked workers find the dataset and fold indices in the inherited caches,
+    so the data is shared with the parent rather than loaded again.
+    """
+    timer = StageTimer(memory=config.memory_profile)
+    deadline = Deadline(config.time_budget, expires_at) if config.time_budget is not None else None
+    try:
+        return _run_fold_stages(config, fold, timer, deadline)
+    except RunTimeout as e:
+        e.partial.update(fold=fold, fold_timings=timer.to_dict())
+        raise
+    finally:
+        timer.close()
+
+
+def _run_fold_stages(
+    config: RunConfig,
+    fold: int,
+    timer: StageTimer,
+    deadline: Optional[Deadline],
+) -> Dict[str, Any]:
+    with timer.stage("load"):
+        dataset = _load_folds(config)[fold]
+    with timer.stage("build"):
+        model, _ = _build_model(
+            algorithm_name=config.algorithm_name,
+            task=dataset.meta.task,
+            hyperparams=config.hyperparams,
+        )
+    _, y_pred, y_proba = _fit_predict(model, dataset, config, timer, deadline)
+    with timer.stage("evaluate"):
+        metrics = _evaluate(dataset, y_pred)
+    return {
+        "fold": fold,
+        "n_train": int(len(dataset.train_index)),
+        "n_test": int(len(dataset.test_index)),
+        "metrics": metrics,
+        "timings": timer.to_dict(),
+        "memory": timer.memory_dict(),
+        "y_pred": y_pred,
+        "y_proba": y_proba,
+    }
+
+
+def _collect_outputs(
+    outputs: Iterable[Dict[str, Any]],
+    total: int,
+    reporter: Optional[ProgressReporter],
+    unit: str,
+) -> List[Dict[str, Any]]:
+    # CV and learning-curve runs report finished fits; their own training progress is not reported.
+    collected = []
+    for output in outputs:
+        collected.append(output)
+        if reporter is not None:
+            reporter.emit(unit, len(collected), total)
+    return collected
+
+
+def _merge_worker_stats(timer: StageTimer, outputs: List[Dict[str, Any]]) -> None:
+    # Sum the workers' stage timings into `timer`; memory peaks are the maximum over all of them.
+    for o in outputs:
+        timer.add(o["timings"])
+        if timer.memory is not None and o["memory"] is not None:
+            timer.memory.merge(o["memory"]["stages"], sum_deltas=False)
+            timer.memory.rss_peak = max(timer.memory.rss_peak, o["memory"]["rss_peak"] or 0)
+
+
+def _aggregate_metrics(fold_metrics: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Mean and (population) std of every numeric leaf shared by all fold metric dicts.
+    """
+    mean: Dict[str, Any] = {}
+    std: Dict[str, Any] = {}
+    for key, first in fold_metrics[0].items():
+        values = [m.get(key) for m in fold_metrics]
+        if isinstance(first, dict):
+            if all(isinstance(v, dict) for v in values):
+                mean[key], std[key] = _aggregate_metrics(values)
+        elif all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in values):
+            mean[key] = float(np.mean(values))
+            std[key] = float(np.std(values))
+    return mean, std
+
+
+def _run_cross_validation(config: RunConfig) -> Dict[str, Any]:
+    """
+    k-fold variant of `run_experiment`: one fit per fold, folds run in a process pool.
+
+    The dataset and fold indices are loaded once in the parent before the pool starts.
+    Predictions (when requested) are out-of-fold: every sample is predicted by the
+    model that did not see it, in the original sample order.
+
+    Stage timings are summed over folds (so they can exceed the wall-clock "total"
+    when folds run in parallel); every fold also reports its own. Memory peaks are the
+    maximum over the parent and all folds.
+    """
+    timer = StageTimer(memory=config.memory_profile)
+    deadline = Deadline(config.time_budget) if config.time_budget is not None else None
+    try:
+        return _run_cross_validation_stages(config, timer, deadline, _make_reporter(config))
+    except RunTimeout as e:
+        e.partial["timings"] = timer.to_dict()
+        raise
+    finally:
+        timer.close()
+
+
+def _run_cross_validation_stages(
+    config: RunConfig,
+    timer: StageTimer,
+    deadline: Optional[Deadline],
+    reporter: Optional[ProgressReporter] = None,
+) -> Dict[str, Any]:
+    with timer.stage("load"):
+        folds = _load_folds(config)
+    meta = folds[0].meta
+
+    # Validate hyperparameters up front instead of failing in every worker.
+    with timer.stage("build"):
+        _, model_kind = _build_model(config.algorithm_name, meta.task, config.hyperparams)
+
+    # The budget covers the whole CV run, so every fold gets the same absolute deadline.
+    expires_at = deadline.expires_at if deadline is not None else None
+    n_jobs = min(config.n_jobs or default_workers(len(folds)), len(folds))
+    if n_jobs <= 1:
+        outputs = _collect_outputs(
+            (_run_fold(config, k, expires_at) for k in range(len(folds))), len(folds), reporter, "fold"
+        )
+    else:
+        with process_pool(n_jobs) as pool:
+            outputs = _collect_outputs(
+                pool.map(_run_fold, [_without_progress(config)] * len(folds), range(len(folds)),
+                         [expires_at] * len(folds)),
+                len(folds),
+                reporter,
+                "fold",
+            )
+
+    _merge_worker_stats(timer, outputs)
+    mean, std = _aggregate_metrics([o["metrics"] for o in outputs])
+
+    result: Dict[str, Any] = {
+        "dataset": {
+            **meta.to_dict(),
+            "fingerprint": folds[0].fingerprint,
+            "split_fingerprint": fp.combine(*(f.split_fingerprint for f in folds)),
+        },
+        "algorithm": {
+            "name": config.algorithm_name,
+            "kind": model_kind,
+            "hyperparams": config.hyperparams or {},
+        },
+        "metrics": mean,
+        "cv": {
+            "n_folds": len(folds),
+            "folds": [
+                {key: o[key] for key in ("fold", "n_train", "n_test", "metrics", "timings", "memory")}
+                for o in outputs
+            ],
+            "mean": mean,
+            "std": std,
+        },
+    }
+
+    if config.include_predictions:
+        y = np.asarray(folds[0].y)
+        y_pred = np.empty(len(y), dtype=outputs[0]["y_pred"].dtype)
+        y_proba = None
+        if outputs[0]["y_proba"] is not None:
+            y_proba = np.empty((len(y),) + outputs[0]["y_proba"].shape[1:])
+        for dataset, out in zip(folds, outputs):
+            y_pred[dataset.test_index] = out["y_pred"]
+            if y_proba is not None:
+                y_proba[dataset.test_index] = out["y_proba"]
+        result["predictions"] = _predictions_to_dict(
+            folds[0], y_pred, y_proba, y_true=y, compact=config.compact_predictions
+        )
+
+    result["timings"] = timer.to_dict()
+    result["memory"] = timer.memory_dict()
+    return result
+
+
+#  Learning curves
+
+
+def _train_sizes(fractions: List[float], n_train: int, min_size: int) -> List[Tuple[float, int]]:
+    """
+    Sorted, de-duplicated (fraction, n_train) pairs; every size is at least `min_size` rows.
+    """
+    if not fractions:
+        raise ValueError("learning_curve needs at least one train fraction.")
+    for f in fractions:
+        if isinstance(f, bool) or not isinstance(f, (int, float)) or not 0 < f <= 1:
+            raise ValueError(f"Learning-curve fractions must be in (0, 1], got {f!r}.")
+    return [
+        (float(f), min(n_train, max(min_size, int(round(f * n_train)))))
+        for f in sorted(set(float(f) for f in fractions))
+    ]
+
+
+def _nested_train_order(dataset: Dataset, random_state: int) -> np.ndarray:
+    """
+    Positions into `dataset.train_index` whose every prefix is a random subsample of the
+    train split, so smaller learning-curve fractions are nested in larger ones.
+
+    For classification the classes are spread evenly over the order (a sample's key is its
+    rank within its class relative to the class size), so every prefix is stratified.
+    """
+    order = np.random.default_rng(random_state).permutation(len(dataset.train_index))
+    if dataset.meta.task == TaskType.REGRESSION:
+        return order
+
+    _, classes, counts = np.unique(dataset.y_train[order], return_inverse=True, return_counts=True)
+    by_class = np.argsort(classes, kind="stable")
+    rank = np.empty(len(order))
+    rank[by_class] = np.arange(len(order)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return order[np.argsort((rank + 0.5) / counts[classes], kind="stable")]
+
+
+def _predict_train(model: Any, dataset: Dataset, config: RunConfig) -> np.ndarray:
+    # Streamed runs never build X_train; predict it batch by batch as well.
+    if config.stream_batch_size is not None and hasattr(model, "fit_batches"):
+        return np.concatenate(
+            [np.asarray(model.predict(X)) for X, _ in dataset.iter_train_batches(config.stream_batch_size)]
+        )
+    return np.asarray(model.predict(dataset.X_train))
+
+
+def _run_fraction(
+    config: RunConfig,
+    fraction: float,
+    n_train: int,
+    expires_at: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Fit and evaluate on the first `n_train` rows of the nested train order. Runs inside
+    a pool worker, which finds the dataset in the inherited caches (see `_run_fold`).
+    """
+    timer = StageTimer(memory=config.memory_profile)
+    deadline = Deadline(config.time_budget, expires_at) if config.time_budget is not None else None
+    try:
+        return _run_fraction_stages(config, fraction, n_train, timer, deadline)
+    except RunTimeout as e:
+        e.partial.update(fraction=fraction, fraction_timings=timer.to_dict())
+        raise
+    finally:
+        timer.close()
+
+
+def _run_fraction_stages(
+    config: RunConfig,
+    fraction: float,
+    n_train: int,
+    timer: StageTimer,
+    deadline: Optional[Deadline],
+) -> Dict[str, Any]:
+    with timer.stage("load"):
+        full = _load_dataset(config)
+        order = _nested_train_order(full, config.random_state)
+        # Keep the subsample in train order, so its rows are gathered sequentially.
+        dataset = replace(full, train_index=full.train_index[np.sort(order[:n_train])])
+    with timer.stage("build"):
+        model, _ = _build_model(
+            algorithm_name=config.algorithm_name,
+            task=dataset.meta.task,
+            hyperparams=config.hyperparams,
+        )
+    model, y_pred, _ = _fit_predict(model, dataset, config, timer, deadline)
+    with timer.stage("predict_train"):
+        y_train_pred = _predict_train(model, dataset, config)
+    with timer.stage("evaluate"):
+        train_metrics = _evaluate(dataset, y_train_pred, y_true=dataset.y_train)
+        test_metrics = _evaluate(dataset, y_pred)
+    timings = timer.to_dict()
+    return {
+        "fraction": fraction,
+        "n_train": n_train,
+        "fit_time": timings["fit"],
+        "train_metrics": train_metrics,
+        "test_metrics": test_metrics,
+        "timings": timings,
+        "memory": timer.memory_dict(),
+    }
+
+
+def _run_learning_curve(config: RunConfig) -> Dict[str, Any]:
+    """
+    Learning-curve variant of `run_experiment`: one fit per train fraction, fits run in a
+    process pool. The dataset is loaded and split once in the parent before the pool starts.
+
+    Every fraction is a stratified (classification) random subsample of the train split,
+    nested in the larger ones, and is evaluated on its own train rows and the full test split.
+    Timings and memory are merged over fits as in `_run_cross_validation`.
+    """
+    timer = StageTimer(memory=config.memory_profile)
+    deadline = Deadline(config.time_budget) if config.time_budget is not None else None
+    try:
+        return _run_learning_curve_stages(config, timer, deadline, _make_reporter(config))
+    except RunTimeout as e:
+        e.partial["timings"] = timer.to_dict()
+        raise
+    finally:
+        timer.close()
+
+
+def _run_learning_curve_stages(
+    config: RunConfig,
+    timer: StageTimer,
+    deadline: Optional[Deadline],
+    reporter: Optional[ProgressReporter] = None,
+) -> Dict[str, Any]:
+    with timer.stage("load"):
+        dataset = _load_dataset(config)
+    meta = dataset.meta
+    min_size = 2 if meta.task == TaskType.REGRESSION else max(2, meta.n_classes or 2)
+    sizes = _train_sizes(config.learning_curve, len(dataset.train_index), min_size)
+
+    with timer.stage("build"):
+        _, model_kind = _build_model(config.algorithm_name, meta.task, config.hyperparams)
+
+    # Only metrics are reported, so skip predict_proba in the fits.
+    fit_config = replace(config, include_probabilities=False)
+    expires_at = deadline.expires_at if deadline is not None else None
+    n_jobs = min(config.n_jobs or default_workers(len(sizes)), len(sizes))
+    if n_jobs <= 1:
+        outputs = _collect_outputs(
+            (_run_fraction(fit_config, f, n, expires_at) for f, n in sizes), len(sizes), reporter, "fraction"
+        )
+    else:
+        # Largest fits first: the longest one starts right away instead of last.
+        largest_first = sizes[::-1]
+        with process_pool(n_jobs) as pool:
+            outputs = _collect_outputs(
+                pool.map(_run_fraction, [_without_progress(fit_config)] * len(sizes),
+                         [f for f, _ in largest_first], [n for _, n in largest_first],
+                         [expires_at] * len(sizes)),
+                len(sizes),
+                reporter,
+                "fraction",
+            )[::-1]
+
+    _merge_worker_stats(timer, outputs)
+    return {
+        "dataset": {
+            **meta.to_dict(),
+            "fingerprint": dataset.fingerprint,
+            "split_fingerprint": dataset.split_fingerprint,
+        },
+        "algorithm": {
+            "name": config.algorithm_name,
+            "kind": model_kind,
+            "hyperparams": config.hyperparams or {},
+        },
+        "metrics": outputs[-1]["test_metrics"],
+        "learning_curve": {
+            "n_train_total": int(len(dataset.train_index)),
+            "points": outputs,
+        },
+        "timings": timer.to_dict(),
+        "memory": timer.memory_dict(),
+    }
+
+
+# Bump when the result format or anything else that changes results for an identical key changes.
+RESULT_CACHE_VERSION = 1
+
+
+def _load_dataset(config: RunConfig) -> Dataset:
+    return load_data(
+        name=config.dataset_name,
+        test_size=config.test_size,
+        random_state=config.random_state,
+        columns=config.feature_columns,
+        rows=config.row_range,
+        dtype=config.dtype,
+    )
+
+
+def _budget_key(config: RunConfig, dataset: Dataset) -> Tuple[Optional[str], Optional[int]]:
+    """
+    (key, budget) of a run for warm starts: the key hashes everything that determines the
+    fitted model except the budget hyperparameter (`AlgorithmVariant.budget_param`).
+    (None, None) for algorithms without a budget hyperparameter.
+    """
+    _, variant, validated = _resolve_algorithm(config.algorithm_name, dataset.meta.task, config.hyperparams)
+    if variant.budget_param is None:
+        return None, None
+    hyperparams = {spec.name: spec.default for spec in variant.hyperparams}
+    hyperparams.update(validated)
+    budget = hyperparams.pop(variant.budget_param)
+
+    return canonical_hash({
+        "version": RESULT_CACHE_VERSION,
+        "split": dataset.split_fingerprint,
+        "algorithm": config.algorithm_name,
+        "variant": variant.code,
+        "hyperparams": hyperparams,
+        "dtype": config.dtype,
+        "stream_batch_size": config.stream_batch_size,
+    }), budget
+
+
+def _result_key(config: RunConfig) -> str:
+    """
+    Canonical hash of everything that determines a run's result.
+
+    The dataset enters through its split fingerprint (data content + exact partition),
+    not its name; hyperparameters are validated and completed with their defaults,
+    so `{}` and the explicit defaults share one entry. `n_jobs` does not affect results.
+    """
+    if config.cv_folds is not None:
+        folds = _load_folds(config)
+        task = folds[0].meta.task
+        split = fp.combine(*(f.split_fingerprint for f in folds))
+    else:
+        dataset = _load_dataset(config)
+        task = dataset.meta.task
+        split = dataset.split_fingerprint
+
+    _, variant, validated = _resolve_algorithm(config.algorithm_name, task, config.hyperparams)
+    hyperparams = {spec.name: spec.default for spec in variant.hyperparams}
+    hyperparams.update(validated)
+
+    return canonical_hash({
+        "version": RESULT_CACHE_VERSION,
+        "split": split,
+        "algorithm": config.algorithm_name,
+        "variant": variant.code,
+        "hyperparams": hyperparams,
+        "dtype": config.dtype,
+        "stream_batch_size": config.stream_batch_size,
+        "cv_folds": config.cv_folds,
+        "learning_curve": sorted(set(float(f) for f in config.learning_curve))
+        if config.learning_curve is not None else None,
+        "include_predictions": config.include_predictions,
+        "include_probabilities": config.include_probabilities,
+        "compact_predictions": config.compact_predictions,
+    })
 
 
 #  Public entrypoint
@@ -119,56 +887,269 @@ def run_experiment(config: RunConfig) -> Dict[str, Any]:
     4. Predict on test (optionally predict_proba).
     5. Compute metrics via EvaluationReport.
     6. Return everything as a JSON-serializable dict.
+    7. Optionally save the fitted model as an artifact (`config.artifact_dir`).
+
+    With `config.cv_folds` set, steps 1-5 run once per fold instead: "metrics" holds
+    the mean over folds and "cv" the per-fold metrics plus mean/std.
+
+    With `config.learning_curve` set, they run once per train fraction instead:
+    "learning_curve" holds one point per fraction (n_train, fit_time, train_metrics,
+    test_metrics, timings) and "metrics" the test metrics of the largest fraction.
+    No predictions are returned.
+
+    `result["timings"]` holds the seconds spent in each stage: load (dataset and split
+    arrays), build, fit, predict, predict_proba, evaluate, save (with an artifact_dir),
+    plus the "total";
+    `result["memory"]` the per-stage RSS deltas / peaks (and traced heap peaks in
+    "precise" mode) unless `config.memory_profile` is None.
+
+    With `config.time_budget` set, a run that exceeds it raises RunTimeout, whose
+    `partial` dict holds the interrupted stage, progress and timings so far.
+
+    With `config.use_cache` set, a result stored for an identical run is returned
+    instead (see `_result_key`); `result["cached"]` tells which happened. With
+    `config.artifact_dir` set, only hits whose model artifact still exists are served; runs
+    resumed from a warm start are never stored. The timings
+    of a cache hit describe the lookup (load, cache_lookup, total), not the original run.
+    Cached results are shared, so callers must not mutate them.
     """
-    # 1. Load dataset
-    dataset = load_data(
-        name=config.dataset_name,
-        test_size=config.test_size,
-        random_state=config.random_state,
-    )
+    if not config.use_cache:
+        return {**_run(config), "cached": False}
 
-    # 2. Build model
-    model, model_kind = _build_model(
-        algorithm_name=config.algorithm_name,
-        task=dataset.meta.task,
-        hyperparams=config.hyperparams,
-    )
+    timer = StageTimer(memory=config.memory_profile)
+    try:
+        cache = get_result_cache()
+        with timer.stage("load"):
+            key = _result_key(config)
+        with timer.stage("cache_lookup"):
+            result = cache.get(key)
+    finally:
+        timer.close()
+    # A hit is only useful if it comes with the model artifact a caller asks for.
+    if result is not None and (config.artifact_dir is None or _artifact_exists(result)):
+        return {**result, "cached": True, "timings": timer.to_dict(), "memory": timer.memory_dict()}
 
-    # 3. Fit
-    model.fit(dataset.X_train, dataset.y_train)
+    result = _run(config)
+    # A resumed fit differs from a fresh one with the same config, so it must not answer later requests.
+    if "warm_start" not in result:
+        cache.put(key, result)
+    return {**result, "cached": False}
 
-    # 4. Predict
-    y_pred = model.predict(dataset.X_test)
-    y_pred = np.asarray(y_pred)
 
-    # 4b. Optionally predict probabilities for classification
-    y_proba = _predict_proba(
-        model=model,
-        X=dataset.X_test,
-        task=dataset.meta.task,
-        include_probabilities=config.include_probabilities,
+def _save_artifact(model: Any, dataset: Dataset, config: RunConfig, result: Dict[str, Any]) -> Dict[str, Any]:
+    return save_model(
+        model,
+        config.artifact_dir,
+        schema=schema_from_meta(dataset.meta, dataset.dtype),
+        info={
+            "algorithm": result["algorithm"],
+            "dataset": {
+                "id": dataset.meta.id,
+                "fingerprint": dataset.fingerprint,
+                "split_fingerprint": dataset.split_fingerprint,
+            },
+            "metrics": result["metrics"],
+        },
     )
 
+
+def _artifact_exists(result: Dict[str, Any]) -> bool:
+    artifact = result.get("artifact")
+    return artifact is not None and (Path(artifact["path"]) / MANIFEST_FILE).is_file()
+
+
+def _make_reporter(config: RunConfig) -> Optional[ProgressReporter]:
+    if config.progress is None:
+        return None
+    return ProgressReporter(config.progress, config.progress_interval)
+
+
+def _without_progress(config: RunConfig) -> RunConfig:
+    # Callbacks are usually closures, which cannot be sent to pool workers.
+    return replace(config, progress=None) if config.progress is not None else config
+
+
+def _run(config: RunConfig) -> Dict[str, Any]:
+    if config.learning_curve is not None:
+        if config.cv_folds is not None:
+            raise ValueError("learning_curve and cv_folds cannot be combined.")
+        if config.artifact_dir is not None:
+            raise ValueError("Saving the fitted model is not supported with learning curves.")
+        return _run_learning_curve(config)
+    if config.cv_folds is not None:
+        if config.artifact_dir is not None:
+            raise ValueError("Saving the fitted model is not supported with cross-validation.")
+        return _run_cross_validation(config)
+
+    timer = StageTimer(memory=config.memory_profile)
+    deadline = Deadline(config.time_budget) if config.time_budget is not None else None
+    try:
+        return _run_stages(config, timer, deadline, _make_reporter(config))
+    except RunTimeout as e:
+        e.partial.update(timings=timer.to_dict(), memory=timer.memory_dict())
+        raise
+    finally:
+        timer.close()
+
+
+def _run_stages(
+    config: RunConfig,
+    timer: StageTimer,
+    deadline: Optional[Deadline],
+    reporter: Optional[ProgressReporter] = None,
+) -> Dict[str, Any]:
+
+    # 1. Load dataset
+    with timer.stage("load"):
+        dataset = _load_dataset(config)
+
+    # 2. Build model, or take a cached fit of this config with a smaller budget to train further
+    with timer.stage("build"):
+        model, model_kind = _build_model(
+            algorithm_name=config.algorithm_name,
+            task=dataset.meta.task,
+            hyperparams=config.hyperparams,
+        )
+        fit_params: Dict[str, Any] = {}
+        budget_key, budget = _budget_key(config, dataset) if config.warm_start else (None, None)
+        resumed = warm_start.take(budget_key, budget)
+        if resumed is not None:
+            model, fit_params = warm_start.resume(resumed[1], budget)
+
+    # 3-4. Fit, predict (and optionally predict_proba)
+    if deadline is not None:
+        deadline.check("load")
+    model, y_pred, y_proba = _fit_predict(model, dataset, config, timer, deadline, reporter, fit_params)
+    if resumed is not None:
+        warm_start.finish(model, budget)
+
     # 5. Evaluation
-    report = EvaluationReport(
-        y_true=dataset.y_test,
-        y_pred=y_pred,
-        task=dataset.meta.task,
-        target_names=dataset.meta.class_labels,
-    )
+    with timer.stage("evaluate"):
+        metrics = _evaluate(dataset, y_pred)
 
     # 6. Assemble result
     result: Dict[str, Any] = {
-        "dataset": dataset.meta.to_dict(),
+        "dataset": {
+            **dataset.meta.to_dict(),
+            "fingerprint": dataset.fingerprint,
+            "split_fingerprint": dataset.split_fingerprint,
+        },
         "algorithm": {
             "name": config.algorithm_name,
             "kind": model_kind,
             "hyperparams": config.hyperparams or {},
         },
-        "metrics": report.summary() # _evaluation_to_dict(report),
+        "metrics": metrics,
     }
 
     if config.include_predictions:
-        result["predictions"] = _predictions_to_dict(dataset, y_pred, y_proba)
+        result["predictions"] = _predictions_to_dict(
+            dataset, y_pred, y_proba, compact=config.compact_predictions
+        )
+
+    if resumed is not None:
+        result["warm_start"] = {"from_budget": resumed[0], "budget": budget}
+
+    # 7. Optionally keep the fitted model
+    if config.artifact_dir is not None:
+        with timer.stage("save"):
+            result["artifact"] = _save_artifact(model, dataset, config, result)
+
+    # Offer the model for warm starts only now: a run that takes it trains it further in place.
+    if budget_key is not None and warm_start.can_resume(model):
+        warm_start.WARM_START_CACHE.put(budget_key, (budget, model))
 
+    result["timings"] = timer.to_dict()
+    result["memory"] = timer.memory_dict()
     return result
+
+
+#  Batch entrypoint
+
+
+@dataclass
+class BatchOutcome:
+    """
+    Outcome of one config of a `run_experiments` batch: either `result` or `error` is set.
+    """
+
+    index: int              # position of the config in the submitted batch
+    config: RunConfig
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    timed_out: bool = False  # the run hit its time budget (or the batch deadline) and was stopped
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_batch_item(index: int, config: RunConfig, expires_at: Optional[float] = None) -> BatchOutcome:
+    run_config = config
+    if expires_at is not None:
+        # A config starts with what is left of the batch deadline as its time budget.
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return BatchOutcome(index=index, config=config, error="RunTimeout: batch deadline passed.", timed_out=True)
+        run_config = replace(config, time_budget=min(config.time_budget or remaining, remaining))
+    try:
+        return BatchOutcome(index=index, config=config, result=run_experiment(run_config))
+    except RunTimeout as e:
+        return BatchOutcome(index=index, config=config, error=f"RunTimeout: {e}", timed_out=True)
+    except Exception as e:  # one bad config must not abort the batch
+        return BatchOutcome(index=index, config=config, error=f"{type(e).__name__}: {e}")
+
+
+def _preload(configs: List[RunConfig]) -> None:
+    # Warm the dataset and split caches once in the parent, so forked workers inherit them.
+    for config in configs:
+        try:
+            if config.cv_folds is not None:
+                _load_folds(config)
+            else:
+                _load_dataset(config)
+        except Exception:
+            pass  # reported by the worker that runs the config
+
+
+def run_experiments(
+    configs: Iterable[RunConfig],
+    max_workers: Optional[int] = None,
+    expires_at: Optional[float] = None,
+) -> Iterator[BatchOutcome]:
+    """
+    Run many configs in a process pool, yielding a BatchOutcome per config as it finishes.
+
+    - configs are grouped by dataset and their data is loaded once, in the parent, before
+      the pool forks; each worker then reads the shared copy (see common/parallel.py),
+    - a config that fails yields an outcome with `error` set; the others keep running,
+    - outcomes arrive in completion order; use `outcome.index` to match them to configs,
+    - closing the generator early cancels every config that has not started yet.
+    - `config.progress` callbacks are dropped for pooled runs; they only fire with `max_workers=1`,
+    - with `expires_at` (a time.time() value) every config runs with the time left until then
+      as its time budget, so the whole batch ends by that time; configs that run out yield an
+      outcome with `timed_out` set.
+
+    `max_workers=1` runs everything in-process, in submission order.
+    """
+    configs = list(configs)
+    order = sorted(range(len(configs)), key=lambda i: configs[i].dataset_name)  # stable: grouped by dataset
+    n_workers = min(max_workers or default_workers(len(configs)), max(len(configs), 1))
+
+    if n_workers <= 1:
+        for i in range(len(configs)):
+            yield _run_batch_item(i, configs[i], expires_at)
+        return
+
+    _preload([configs[i] for i in order])
+    pool = process_pool(n_workers)
+    try:
+        futures = {pool.submit(_run_batch_item, i, _without_progress(configs[i]), expires_at): i for i in order}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:  # the worker itself died (e.g. out of memory)
+                i = futures[future]
+                yield BatchOutcome(index=i, config=configs[i], error=f"{type(e).__name__}: {e}")
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
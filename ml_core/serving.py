@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ml_core.artifacts import load_model
+from ml_core.common.cache import LRUCache
+from ml_core.common.types import TaskType
+from ml_core.data_handlers.ingest import iter_csv_chunks
+
+
+# Feature rows: lists of values in feature order, or mappings keyed by feature name.
+Row = Union[Sequence[Any], Mapping[str, Any]]
+
+
+def _category_codes(features: Dict[str, Any]) -> List[Optional[Dict[str, int]]]:
+    """
+    Per feature position: value -> integer code for categorical features (as encoded at
+    ingestion, see DatasetMeta.feature_categories), None for numeric ones.
+    """
+    categories = features.get("categories") or {}  # absent from older manifests
+    names = features["names"] or [None] * features["n_features"]
+    return [
+        {value: code for code, value in enumerate(categories[name])} if name in categories else None
+        for name in names
+    ]
+
+
+def _encode_category(value: Any, codes: Dict[str, int], feature: str) -> float:
+    if value is None:
+        return np.nan
+    code = codes.get(value if isinstance(value, str) else str(value))
+    if code is None:
+        raise ValueError(f"Unknown value {value!r} for categorical feature {feature!r}.")
+    return float(code)
+
+
+@dataclass
+class LoadedModel:
+    """
+    A deserialized model artifact, ready for inference.
+
+    `nbytes` estimates its memory by the size of the model file, which is close for
+    pickled ensembles, state_dicts and XGBoost's binary format alike.
+    """
+
+    model: Any
+    manifest: Dict[str, Any]
+    nbytes: int
+
+    @property
+    def features(self) -> Dict[str, Any]:
+        return self.manifest["schema"]["features"]
+
+    @property
+    def target(self) -> Dict[str, Any]:
+        return self.manifest["schema"]["target"]
+
+    @cached_property
+    def category_codes(self) -> List[Optional[Dict[str, int]]]:
+        return _category_codes(self.features)
+
+    def to_matrix(self, rows: List[Row]) -> np.ndarray:
+        """
+        Convert feature rows into a 2D array matching the training schema. Raises ValueError.
+
+        Values of categorical features are given as their text and encoded like at ingestion.
+        """
+        if not rows:
+            raise ValueError("At least one feature row is required.")
+        names = self.features["names"]
+        if all(isinstance(row, Mapping) for row in rows):
+            if names is None:
+                raise ValueError("This model has no feature names; pass rows as lists of values.")
+            try:
+                rows = [[row[name] for name in names] for row in rows]
+            except KeyError as e:
+                raise ValueError(f"Missing feature {e.args[0]!r} in a row.") from None
+        codes = self.category_codes
+        if any(c is not None for c in codes):
+            names = self.features["names"]
+            rows = [
+                [
+                    _encode_category(v, codes[j], names[j]) if j < len(codes) and codes[j] is not None else v
+                    for j, v in enumerate(row)
+                ]
+                for row in rows
+            ]
+        try:
+            X = np.asarray(
+                [[np.nan if v is None else v for v in row] for row in rows],
+                dtype=self.features["dtype"],
+            )
+        except (TypeError, ValueError):
+            raise ValueError("Feature rows must be equally long lists of numbers.") from None
+        if X.ndim != 2 or X.shape[1] != self.features["n_features"]:
+            raise ValueError(
+                f"Expected rows of {self.features['n_features']} features, got shape {list(X.shape)}."
+            )
+        return X
+
+    def predict(self, rows: List[Row], include_probabilities: bool = True) -> Dict[str, Any]:
+        """
+        Predict `rows`. Classification results also carry the predicted class labels
+        and, if requested and supported, per-class probabilities.
+        """
+        return self.predict_matrix(self.to_matrix(rows), include_probabilities)
+
+    def predict_matrix(self, X: np.ndarray, include_probabilities: bool = True) -> Dict[str, Any]:
+        """
+        `predict` for a feature matrix already in schema order and dtype.
+        """
+        y_pred = np.asarray(self.model.predict(X))
+        result: Dict[str, Any] = {"predictions": y_pred.tolist()}
+
+        if TaskType(self.target["task"]) == TaskType.REGRESSION:
+            return result
+        labels = self.target["class_labels"]
+        if labels is not None:
+            result["labels"] = [labels[int(k)] for k in y_pred]
+        if include_probabilities and hasattr(self.model, "predict_proba"):
+            result["probabilities"] = np.asarray(self.model.predict_proba(X)).tolist()
+        result["class_labels"] = labels
+        return result
+
+
+def _load(path: str) -> LoadedModel:
+    model, manifest = load_model(path)
+    return LoadedModel(model=model, manifest=manifest, nbytes=int(manifest["size"]))
+
+
+# Deserialized models of this process, bounded by their estimated memory. Artifacts are
+# immutable (every save gets a new directory), so entries never go stale.
+MODEL_CACHE: LRUCache[LoadedModel] = LRUCache(
+    max_entries=None,
+    max_bytes=int(os.getenv("ML_CORE_MODEL_CACHE_BYTES", str(512 * 1024 * 1024))),
+    sizeof=lambda loaded: loaded.nbytes,
+)
+
+
+def get_model(path: str | os.PathLike) -> LoadedModel:
+    """
+    The model artifact at `path`, from MODEL_CACHE or loaded (and checksum-verified) on a miss.
+    """
+    key = str(Path(path).resolve())
+    return MODEL_CACHE.get_or_load(key, lambda: _load(key))
+
+
+def predict(path: str | os.PathLike, rows: List[Row], include_probabilities: bool = True) -> Dict[str, Any]:
+    """
+    Score feature rows with the model artifact at `path`; see `LoadedModel.predict`.
+    """
+    return get_model(path).predict(rows, include_probabilities)
+
+
+#  Batch scoring of large inputs
+
+INPUT_FORMATS = ("csv", "npy")
+OUTPUT_FORMATS = ("ndjson", "csv")
+
+# Rows scored per chunk; with the output of one chunk, this bounds the memory of a scoring run.
+DEFAULT_SCORE_CHUNK = 10_000
+
+_MISSING = {"", "na", "nan", "null", "none"}
+
+# Scored chunks: (index of the chunk's first row, LoadedModel.predict_matrix output).
+ScoredChunk = Tuple[int, Dict[str, Any]]
+
+
+def _feature_positions(header: List[str], features: Dict[str, Any]) -> List[int]:
+    names = features["names"]
+    if names is not None and all(name in header for name in names):
+        return [header.index(name) for name in names]
+    if len(header) == features["n_features"]:
+        return list(range(len(header)))
+    raise ValueError(
+        f"CSV header must contain the model's {features['n_features']} feature columns"
+        + (f" ({', '.join(names)})." if names is not None else ".")
+    )
+
+
+def _parse_number(value: str, line: int) -> float:
+    if value.strip().lower() in _MISSING:
+        return np.nan
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Line {line} has non-numeric value {value!r}.") from None
+
+
+def _parse_cell(value: str, codes: Optional[Dict[str, int]], names: List[str], j: int, line: int) -> float:
+    if codes is None:
+        return _parse_number(value, line)
+    try:
+        return _encode_category(value, codes, names[j])
+    except ValueError as e:
+        raise ValueError(f"Line {line}: {e}") from None
+
+
+def _csv_matrices(stream: BinaryIO, features: Dict[str, Any], chunk_size: int) -> Iterator[np.ndarray]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    codes = _category_codes(features)
+    try:
+        rows_read, positions = 0, None
+        for chunk in iter_csv_chunks(text, chunk_size):
+            if positions is None:
+                positions = _feature_positions([h.strip() for h in chunk[0]], features)
+                width, chunk = len(chunk[0]), chunk[1:]
+            line = rows_read + 2  # the header is line 1
+            rows = []
+            for offset, row in enumerate(chunk):
+                if not row:
+                    continue
+                if len(row) != width:
+                    raise ValueError(f"Line {line + offset} has {len(row)} fields, expected {width}.")
+                rows.append([
+                    _parse_cell(row[p], codes[j], features["names"], j, line + offset)
+                    for j, p in enumerate(positions)
+                ])
+            rows_read += len(chunk)
+            if rows:
+                yield np.asarray(rows, dtype=features["dtype"])
+        if positions is None:
+            raise ValueError("CSV input is empty.")
+    finally:
+        text.detach()  # leave the caller's stream open
+
+
+def _read_exact(stream: BinaryIO, n_bytes: int) -> bytes:
+    data = stream.read(n_bytes)
+    if len(data) != n_bytes:
+        raise ValueError("The .npy input is truncated.")
+    return data
+
+
+def _npy_matrices(stream: BinaryIO, features: Dict[str, Any], chunk_size: int) -> Iterator[np.ndarray]:
+    """
+    Read a 2D .npy stream chunk by chunk without loading it. Column-major (Fortran-order)
+    arrays, as the dataset store writes them, need a seekable stream.
+    """
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    else:
+        raise ValueError(f"Unsupported .npy format version {version}.")
+    if len(shape) != 2 or shape[1] != features["n_features"]:
+        raise ValueError(f"Expected a 2D array with {features['n_features']} columns, got shape {list(shape)}.")
+    if dtype.kind not in "biuf":
+        raise ValueError(f"Expected a numeric array, got dtype {dtype}.")
+
+    n_rows, n_cols = shape
+    data_start = stream.tell() if fortran_order else None
+    for start in range(0, n_rows, chunk_size):
+        rows = min(chunk_size, n_rows - start)
+        if fortran_order:
+            columns = []
+            for j in range(n_cols):
+                stream.seek(data_start + (j * n_rows + start) * dtype.itemsize)
+                columns.append(np.frombuffer(_read_exact(stream, rows * dtype.itemsize), dtype=dtype))
+            X = np.stack(columns, axis=1)
+        else:
+            X = np.frombuffer(_read_exact(stream, rows * n_cols * dtype.itemsize), dtype=dtype).reshape(rows, n_cols)
+        yield X.astype(features["dtype"])
+
+
+def score_stream(
+    path: str | os.PathLike,
+    stream: BinaryIO,
+    input_format: str = "csv",
+    chunk_size: int = DEFAULT_SCORE_CHUNK,
+    include_probabilities: bool = True,
+) -> Iterator[ScoredChunk]:
+    """
+    Score a large input against the model artifact at `path`, `chunk_size` rows at a time.
+
+    - "csv": a header row, then feature rows; columns are matched to the model's features
+      by name (extra columns such as the target are ignored) or else by position;
+      categorical features hold their text values,
+    - "npy": a 2D numeric array in numpy's .npy format, read without loading it.
+
+    Only one chunk (and its predictions) is in memory at a time, so memory use does not
+    depend on the input size. Input errors raise ValueError when the offending chunk is read.
+    """
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(f"Unknown input format {input_format!r}; use one of {', '.join(INPUT_FORMATS)}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1.")
+    loaded = get_model(path)
+    read = _csv_matrices if input_format == "csv" else _npy_matrices
+
+    start = 0
+    for X in read(stream, loaded.features, chunk_size):
+        yield start, loaded.predict_matrix(X, include_probabilities)
+        start += len(X)
+
+
+def format_ndjson(scored: Iterable[ScoredChunk]) -> Iterator[str]:
+    """
+    One JSON object per row: row, prediction and (classification) label / probabilities.
+    Yields one string per chunk.
+    """
+    for start, out in scored:
+        labels, probabilities = out.get("labels"), out.get("probabilities")
+        lines = []
+        for i, prediction in enumerate(out["predictions"]):
+            record: Dict[str, Any] = {"row": start + i, "prediction": prediction}
+            if labels is not None:
+                record["label"] = labels[i]
+            if probabilities is not None:
+                record["probabilities"] = probabilities[i]
+            lines.append(json.dumps(record))
+        yield "\n".join(lines) + "\n"
+
+
+def format_csv(scored: Iterable[ScoredChunk]) -> Iterator[str]:
+    """
+    CSV with a header: row, prediction, label and one probability column per class
+    (the last two for classification only). Yields one string per chunk.
+    """
+    header_written = False
+    for start, out in scored:
+        labels, probabilities = out.get("labels"), out.get("probabilities")
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if not header_written:
+            header = ["row", "prediction"]
+            if labels is not None:
+                header.append("label")
+            if probabilities is not None:
+                class_labels = out["class_labels"] or range(len(probabilities[0]))
+                header.extend(f"proba_{label}" for label in class_labels)
+            writer.writerow(header)
+            header_written = True
+        for i, prediction in enumerate(out["predictions"]):
+            row = [start + i, prediction]
+            if labels is not None:
+                row.append(labels[i])
+            if probabilities is not None:
+                row.extend(probabilities[i])
+            writer.writerow(row)
+        yield buffer.getvalue()
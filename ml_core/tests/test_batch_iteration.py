@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, load_data
+from ml_core.runner import RunConfig, run_experiment
+
+
+def test_batches_cover_the_split_in_order(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    DATASET_CACHE.clear()
+    dataset = load_data("wine")
+
+    batches = list(dataset.iter_train_batches(32))
+    assert all(len(X) <= 32 for X, _ in batches)
+    assert type(batches[0][0]) is np.ndarray  # gathered copy, not a memmap view
+    np.testing.assert_array_equal(np.concatenate([X for X, _ in batches]), dataset.X_train)
+    np.testing.assert_array_equal(np.concatenate([y for _, y in batches]), dataset.y_train)
+
+    X_test = np.concatenate([X for X, _ in dataset.iter_test_batches(50)])
+    np.testing.assert_array_equal(X_test, dataset.X_test)
+
+    DATASET_CACHE.clear()
+
+
+def test_shuffled_batches_are_a_reproducible_permutation():
+    dataset = load_data("iris")
+
+    first = np.concatenate([y for _, y in dataset.iter_train_batches(16, shuffle=True, random_state=1)])
+    again = np.concatenate([y for _, y in dataset.iter_train_batches(16, shuffle=True, random_state=1)])
+
+    np.testing.assert_array_equal(first, again)
+    np.testing.assert_array_equal(np.sort(first), np.sort(dataset.y_train))
+
+
+def test_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        next(load_data("iris").iter_test_batches(0))
+
+
+@pytest.mark.parametrize("dataset_name", ["iris", "diabetes"])
+def test_streamed_mlp_run(dataset_name):
+    result = run_experiment(RunConfig(
+        dataset_name=dataset_name,
+        algorithm_name="mlp",
+        hyperparams={"max_epochs": 3},
+        stream_batch_size=40,
+        include_probabilities=True,
+    ))
+
+    n_test = len(result["predictions"]["y_true"])
+    assert len(result["predictions"]["y_pred"]) == n_test
+    if dataset_name == "iris":
+        assert np.asarray(result["predictions"]["y_proba"]).shape == (n_test, 3)
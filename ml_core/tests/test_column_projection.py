@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, DATASET_LOADERS, load_data
+from ml_core.runner import RunConfig, run_experiment
+
+
+def test_store_keeps_features_column_major(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    DATASET_CACHE.clear()
+
+    dataset = load_data("wine")
+    assert dataset.X.flags.f_contiguous
+
+    DATASET_CACHE.clear()
+
+
+def test_load_data_projects_columns_and_rows(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    DATASET_CACHE.clear()
+    (X, y), meta = DATASET_LOADERS["wine"]()
+
+    dataset = load_data("wine", columns=["hue", 0], rows=(10, 110), test_size=0.2)
+
+    assert dataset.meta.n_features == 2
+    assert dataset.meta.n_samples == 100
+    assert dataset.meta.feature_names == ["hue", "alcohol"]
+    assert dataset.X.flags.c_contiguous
+    hue = meta.feature_names.index("hue")
+    np.testing.assert_array_equal(dataset.X, X[10:110][:, [hue, 0]])
+    np.testing.assert_array_equal(dataset.y, y[10:110])
+    assert len(dataset.train_index) + len(dataset.test_index) == 100
+
+    # Unprojected metadata is untouched
+    assert load_data("wine").meta.n_features == 13
+
+    DATASET_CACHE.clear()
+
+
+def test_load_data_accepts_list_row_range_with_dtype():
+    # JSON request bodies give ranges as lists; they must hash like the equivalent tuple.
+    as_list = load_data("wine", rows=[0, 100], dtype="float32")
+    as_tuple = load_data("wine", rows=(0, 100), dtype="float32")
+
+    assert as_list.dtype == np.float32
+    assert as_list.X is as_tuple.X
+    np.testing.assert_array_equal(as_list.test_index, as_tuple.test_index)
+
+
+def test_load_data_rejects_unknown_columns():
+    with pytest.raises(ValueError, match="Unknown feature column"):
+        load_data("iris", columns=["nope"])
+    with pytest.raises(ValueError, match="out of range"):
+        load_data("iris", columns=[7])
+
+
+def test_runner_feature_subset_smoke():
+    result = run_experiment(
+        RunConfig(
+            dataset_name="breast_cancer",
+            algorithm_name="regression",
+            feature_columns=["mean radius", "mean texture", "worst area"],
+            include_predictions=False,
+        )
+    )
+    assert result["dataset"]["n_features"] == 3
+    assert "accuracy" in result["metrics"]
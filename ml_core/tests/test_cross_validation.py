@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from ml_core.data_handlers.load_dataset import load_cv_folds
+from ml_core.runner import RunConfig, run_experiment
+
+
+def test_folds_partition_the_dataset_and_share_arrays():
+    folds = load_cv_folds("wine", n_folds=5, random_state=0)
+
+    assert len(folds) == 5
+    tested = np.sort(np.concatenate([f.test_index for f in folds]))
+    np.testing.assert_array_equal(tested, np.arange(178))
+    for f in folds:
+        assert f.X is folds[0].X
+        assert not np.intersect1d(f.train_index, f.test_index).size
+
+    # Fold indices are memoized
+    assert load_cv_folds("wine", n_folds=5, random_state=0)[2].test_index is folds[2].test_index
+
+
+def test_cv_folds_out_of_range():
+    with pytest.raises(ValueError):
+        load_cv_folds("iris", n_folds=1)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_cross_validation_run(n_jobs):
+    result = run_experiment(RunConfig(
+        dataset_name="iris",
+        algorithm_name="random_forest",
+        hyperparams={"n_estimators": 20},
+        cv_folds=3,
+        n_jobs=n_jobs,
+    ))
+
+    cv = result["cv"]
+    assert cv["n_folds"] == 3
+    assert [f["fold"] for f in cv["folds"]] == [0, 1, 2]
+    accuracies = [f["metrics"]["accuracy"] for f in cv["folds"]]
+    assert result["metrics"]["accuracy"] == pytest.approx(np.mean(accuracies))
+    assert cv["std"]["accuracy"] == pytest.approx(np.std(accuracies))
+    assert "precision" in cv["mean"]["macro avg"]
+
+    # Out-of-fold predictions cover every sample
+    assert len(result["predictions"]["y_pred"]) == 150
+
+
+def test_parallel_cross_validation_matches_sequential():
+    config = dict(dataset_name="diabetes", algorithm_name="svm", cv_folds=3)
+
+    sequential = run_experiment(RunConfig(**config, n_jobs=1))
+    parallel = run_experiment(RunConfig(**config, n_jobs=3))
+
+    assert [f["metrics"] for f in parallel["cv"]["folds"]] == [f["metrics"] for f in sequential["cv"]["folds"]]
+    assert parallel["cv"]["std"] == sequential["cv"]["std"]
+
+
+def test_parallel_cross_validation_with_torch_model():
+    result = run_experiment(RunConfig(
+        dataset_name="wine", algorithm_name="mlp", hyperparams={"max_epochs": 3}, cv_folds=3, n_jobs=3,
+    ))
+    assert len(result["cv"]["folds"]) == 3
@@ -0,0 +1,81 @@
+import io
+
+import numpy as np
+import pytest
+
+from ml_core.common.types import TaskType
+from ml_core.data_handlers.ingest import ingest_csv
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, get_all_dataset_meta, load_data
+from ml_core.data_handlers.store import DatasetStore
+from ml_core.runner import RunConfig, run_experiment
+
+
+CSV = """sepal,petal,color,label
+5.1,1.4,red,setosa
+4.9,1.3,blue,setosa
+6.3,4.9,red,virginica
+5.8,,green,versicolor
+6.7,5.7,blue,virginica
+5.0,3.5,red,versicolor
+"""
+
+
+def test_ingest_csv_streams_chunks_into_store(tmp_path):
+    store = DatasetStore(tmp_path)
+
+    meta = ingest_csv(io.StringIO(CSV), "flowers", name="Flowers", chunk_size=2, store=store)
+
+    assert meta.task == TaskType.MULTICLASS
+    assert meta.n_samples == 6
+    assert meta.n_features == 3
+    assert meta.feature_names == ["sepal", "petal", "color"]
+    assert meta.class_labels == ["setosa", "versicolor", "virginica"]
+    assert meta.target_name == "label"
+    assert meta.feature_categories == {"color": ["red", "blue", "green"]}  # values by code
+
+    X, y, stored_meta = store.open("flowers")
+    assert stored_meta == meta
+    assert X.shape == (6, 3)
+    assert X.flags.f_contiguous  # columnar layout
+    np.testing.assert_array_equal(X[:, 0], [5.1, 4.9, 6.3, 5.8, 6.7, 5.0])
+    assert np.isnan(X[3, 1])
+    np.testing.assert_array_equal(X[:, 2], [0, 1, 0, 2, 1, 0])  # category codes
+    np.testing.assert_array_equal(y, [0, 0, 2, 1, 2, 1])
+
+
+def test_ingest_csv_infers_regression_and_rejects_bad_values(tmp_path):
+    store = DatasetStore(tmp_path)
+    csv_text = "x,y\n" + "".join(f"{i},{i * 0.5 + 0.25}\n" for i in range(20))
+
+    meta = ingest_csv(io.StringIO(csv_text), "line", store=store, chunk_size=7)
+    assert meta.task == TaskType.REGRESSION
+    assert meta.n_classes is None
+
+    with pytest.raises(ValueError, match="looked numeric"):
+        ingest_csv(io.StringIO("a,b\n1,0\n2,1\nx,0\n"), "broken", store=store, chunk_size=2)
+    assert not store.exists("broken")
+
+    with pytest.raises(ValueError, match="already exists"):
+        ingest_csv(io.StringIO(csv_text), "line", store=store)
+
+
+def test_ingested_dataset_is_served_by_load_data(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    rng = np.random.default_rng(0)
+    rows = "\n".join(
+        f"{a:.3f},{b:.3f},{int(a + b > 0)}" for a, b in rng.normal(size=(60, 2))
+    )
+    ingest_csv(io.StringIO("a,b,target\n" + rows + "\n"), "uploaded_demo")
+
+    assert "uploaded_demo" in {m.id for m in get_all_dataset_meta()}
+
+    dataset = load_data("uploaded_demo", test_size=0.25)
+    assert dataset.meta.task == TaskType.BINARY
+    assert dataset.X_train.shape == (45, 2)
+
+    result = run_experiment(
+        RunConfig(dataset_name="uploaded_demo", algorithm_name="regression", include_predictions=False)
+    )
+    assert "accuracy" in result["metrics"]
+
+    DATASET_CACHE.clear()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from ml_core.common.cache import LRUCache
+from ml_core.data_handlers import load_dataset
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, load_data
+
+
+def test_lru_cache_evicts_by_entries_and_bytes():
+    cache = LRUCache(max_entries=2, max_bytes=100)
+
+    cache.put("a", np.zeros(5, dtype=np.int8))
+    cache.put("b", np.zeros(5, dtype=np.int8))
+    assert cache.get("a") is not None  # "a" is now most recently used
+    cache.put("c", np.zeros(5, dtype=np.int8))
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+
+    cache.put("big", np.zeros(80, dtype=np.int8))
+    assert "big" in cache
+    assert cache.stats().bytes <= 100
+
+    # Values larger than the whole budget are never stored
+    cache.put("huge", np.zeros(200, dtype=np.int8))
+    assert "huge" not in cache
+
+
+def test_load_data_hits_cache_and_returns_read_only_arrays(monkeypatch):
+    DATASET_CACHE.clear()
+    calls = []
+    original = load_dataset.DATASET_LOADERS["iris"]
+
+    def counting_loader():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setitem(load_dataset.DATASET_LOADERS, "iris", counting_loader)
+
+    load_data("iris")
+    load_data("iris", random_state=1)
+
+    assert len(calls) == 1
+    stats = DATASET_CACHE.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+    X, _, _ = DATASET_CACHE.get("iris")
+    with pytest.raises(ValueError):
+        X[0, 0] = 123.0
+
+    DATASET_CACHE.clear()
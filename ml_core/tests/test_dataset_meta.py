@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from sklearn.datasets import load_breast_cancer, load_diabetes, load_iris, load_wine
+
+from ml_core.data_handlers import load_dataset
+from ml_core.data_handlers.load_dataset import DATASET_LOADERS, DATASET_META, get_all_dataset_meta
+
+
+@pytest.mark.parametrize("name", sorted(DATASET_LOADERS.keys()))
+def test_static_meta_matches_loaded_data(name):
+    """
+    Static DatasetMeta declarations must describe the data the loader returns.
+    """
+    (X, y), meta = DATASET_LOADERS[name]()
+
+    assert meta is DATASET_META[name]
+    assert meta.id == name
+    assert X.shape == (meta.n_samples, meta.n_features)
+    assert y.shape == (meta.n_samples,)
+
+    if meta.n_classes is not None:
+        assert len(np.unique(y)) == meta.n_classes
+        assert len(meta.class_labels) == meta.n_classes
+    if meta.feature_names is not None:
+        assert len(meta.feature_names) == meta.n_features
+
+
+@pytest.mark.parametrize(
+    "name, sklearn_loader",
+    [
+        ("iris", load_iris),
+        ("wine", load_wine),
+        ("breast_cancer", load_breast_cancer),
+        ("diabetes", load_diabetes),
+    ],
+)
+def test_static_meta_names_match_sklearn(name, sklearn_loader):
+    bunch = sklearn_loader()
+    meta = DATASET_META[name]
+
+    assert meta.feature_names == [str(n) for n in bunch.feature_names]
+    if "target_names" in bunch:
+        assert meta.class_labels == [str(n) for n in bunch.target_names]
+
+
+def test_get_all_dataset_meta_does_not_call_loaders(monkeypatch):
+    def _fail():
+        raise AssertionError("loader must not be called to list metadata")
+
+    for name in list(DATASET_LOADERS):
+        monkeypatch.setitem(load_dataset.DATASET_LOADERS, name, _fail)
+
+    metas = get_all_dataset_meta()
+    assert {m.id for m in metas} == set(DATASET_META)
@@ -0,0 +1,49 @@
+import numpy as np
+
+from ml_core.data_handlers import load_dataset
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, DATASET_META, load_data, materialize_datasets
+from ml_core.data_handlers.store import DatasetStore
+
+
+def test_store_roundtrip_is_memory_mapped(tmp_path):
+    store = DatasetStore(tmp_path)
+    (X, y), meta = load_dataset.DATASET_LOADERS["iris"]()
+
+    store.write(X, y, meta)
+    X2, y2, meta2 = store.open("iris")
+
+    assert isinstance(X2, np.memmap)
+    assert not X2.flags.writeable
+    np.testing.assert_array_equal(X2, X)
+    np.testing.assert_array_equal(y2, y)
+    assert meta2 == meta
+    assert [m.id for m in store.list_meta()] == ["iris"]
+
+    # Re-writing replaces the snapshot atomically
+    store.write(X[:10], y[:10], meta)
+    assert store.open("iris")[0].shape[0] == 10
+
+
+def test_load_data_materializes_into_store_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    DATASET_CACHE.clear()
+
+    dataset = load_data("wine")
+    assert isinstance(dataset.X, np.memmap)
+    assert (tmp_path / "wine" / "X.npy").is_file()
+
+    # Second cold start must not call the sklearn loader again
+    DATASET_CACHE.clear()
+    monkeypatch.setitem(load_dataset.DATASET_LOADERS, "wine", lambda: 1 / 0)
+    again = load_data("wine")
+    assert again.meta is DATASET_META["wine"]
+    np.testing.assert_array_equal(again.X_train, dataset.X_train)
+
+    DATASET_CACHE.clear()
+
+
+def test_materialize_datasets_skips_up_to_date_snapshots(tmp_path):
+    store = DatasetStore(tmp_path)
+
+    assert set(materialize_datasets(store)) == set(DATASET_META)
+    assert materialize_datasets(store) == []
@@ -0,0 +1,48 @@
+import numpy as np
+
+from ml_core.data_handlers.fingerprint import array_fingerprint
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, load_data
+from ml_core.runner import RunConfig, run_experiment
+
+
+def test_array_fingerprint_depends_on_content_not_layout():
+    a = np.arange(12, dtype=np.float64).reshape(3, 4)
+
+    assert array_fingerprint(a) == array_fingerprint(np.asfortranarray(a))
+    assert array_fingerprint(a) != array_fingerprint(a.astype(np.float32))
+    assert array_fingerprint(a) != array_fingerprint(a.reshape(4, 3))
+    b = a.copy()
+    b[2, 3] += 1
+    assert array_fingerprint(a) != array_fingerprint(b)
+
+
+def test_store_and_memory_fingerprints_match(tmp_path, monkeypatch):
+    DATASET_CACHE.clear()
+    in_memory = load_data("wine")
+
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    DATASET_CACHE.clear()
+    stored = load_data("wine")
+
+    assert stored.X.flags.f_contiguous
+    assert stored.fingerprint == in_memory.fingerprint
+    assert stored.split_fingerprint == in_memory.split_fingerprint
+
+    DATASET_CACHE.clear()
+
+
+def test_split_fingerprint_tracks_split_parameters():
+    base = load_data("iris", test_size=0.3, random_state=0)
+
+    assert load_data("iris", test_size=0.3, random_state=1).fingerprint == base.fingerprint
+    assert load_data("iris", test_size=0.3, random_state=1).split_fingerprint != base.split_fingerprint
+    assert load_data("iris", test_size=0.2, random_state=0).split_fingerprint != base.split_fingerprint
+    assert load_data("iris", columns=[0, 1]).fingerprint != base.fingerprint
+
+
+def test_result_carries_fingerprints():
+    result = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm"))
+    dataset = load_data("iris")
+
+    assert result["dataset"]["fingerprint"] == dataset.fingerprint
+    assert result["dataset"]["split_fingerprint"] == dataset.split_fingerprint
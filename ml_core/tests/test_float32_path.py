@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, load_data
+from ml_core.runner import RunConfig, run_experiment
+
+
+def test_load_data_converts_features_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    DATASET_CACHE.clear()
+
+    dataset = load_data("wine", dtype="float32")
+    assert dataset.dtype == np.float32
+    assert dataset.X.flags.c_contiguous and not dataset.X.flags.writeable
+    assert dataset.X_train.dtype == np.float32
+    np.testing.assert_allclose(dataset.X, load_data("wine").X, rtol=1e-6)
+
+    # The converted copy is cached; the float64 default is untouched
+    assert load_data("wine", dtype="float32").X is dataset.X
+    assert load_data("wine").dtype == np.float64
+    assert load_data("wine", columns=[0, 1], dtype="float32").X.shape == (178, 2)
+
+    DATASET_CACHE.clear()
+
+
+def test_unsupported_dtype():
+    with pytest.raises(ValueError):
+        load_data("iris", dtype="int8")
+
+
+@pytest.mark.parametrize("algorithm_name", ["mlp", "xgboost", "random_forest"])
+def test_float32_runs(algorithm_name):
+    hyperparams = {"max_epochs": 3} if algorithm_name == "mlp" else {"n_estimators": 20}
+    result = run_experiment(RunConfig(
+        dataset_name="breast_cancer",
+        algorithm_name=algorithm_name,
+        hyperparams=hyperparams,
+        dtype="float32",
+    ))
+    assert 0.0 <= result["metrics"]["accuracy"] <= 1.0
@@ -0,0 +1,56 @@
+import pytest
+
+from ml_core.algorithms.catalog import get_algorithm
+from ml_core.common.types import TaskType
+from ml_core.runner import RunConfig
+from ml_core.tuning.halving import hyperband, successive_halving
+
+
+def test_budget_params_are_declared():
+    assert get_algorithm("mlp").get_variant(TaskType.REGRESSION).budget_param == "max_epochs"
+    assert get_algorithm("xgboost").get_variant(TaskType.BINARY).budget_param == "n_estimators"
+    assert get_algorithm("random_forest").get_variant(TaskType.BINARY).budget_param == "n_estimators"
+    assert get_algorithm("svm").get_variant(TaskType.BINARY).budget_param is None
+
+
+def test_successive_halving_promotes_the_best_configs():
+    result = successive_halving(
+        RunConfig(dataset_name="iris", algorithm_name="random_forest"),
+        n_configs=9,
+        eta=3,
+        min_budget=10,
+        max_budget=90,
+        params=["max_depth", "min_samples_leaf"],
+        max_workers=3,
+    )
+
+    rungs = {}
+    for t in result.trials:
+        rungs.setdefault(t.rung, []).append(t)
+    assert [len(rungs[r]) for r in sorted(rungs)] == [9, 3, 1]
+    assert [rungs[r][0].budget for r in sorted(rungs)] == [10, 30, 90]
+
+    # Survivors are the best of the previous rung
+    best_rung0 = sorted(rungs[0], key=lambda t: t.score, reverse=True)[:3]
+    assert {t.trial_id for t in rungs[1]} == {t.trial_id for t in best_rung0}
+    assert result.best.budget == 90
+    assert "n_estimators" not in result.best.params
+
+
+def test_hyperband_runs_every_bracket():
+    result = hyperband(
+        RunConfig(dataset_name="iris", algorithm_name="xgboost"),
+        eta=3,
+        min_budget=10,
+        max_budget=30,
+        params=["max_depth"],
+        max_workers=2,
+    )
+    # s_max = 1: brackets of 3 configs (budgets 10 -> 30) and 2 configs at 30
+    assert len({t.trial_id for t in result.trials}) == 5
+    assert result.best.budget == 30
+
+
+def test_variants_without_budget_are_rejected():
+    with pytest.raises(ValueError):
+        successive_halving(RunConfig(dataset_name="iris", algorithm_name="svm"))
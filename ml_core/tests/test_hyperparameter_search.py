@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from ml_core.algorithms.catalog import get_algorithm
+from ml_core.common.types import TaskType
+from ml_core.runner import RunConfig, run_experiment
+from ml_core.tuning.search import search
+from ml_core.tuning.space import SearchSpace, dimension_from_spec
+
+
+def _specs(algorithm, task=TaskType.MULTICLASS):
+    return {s.name: s for s in get_algorithm(algorithm).get_variant(task).hyperparams}
+
+
+def test_dimensions_follow_the_specs():
+    svm = _specs("svm")
+    C = dimension_from_spec(svm["C"])
+    assert C.log and C.grid(5) == pytest.approx([1e-4, 1e-2, 1.0, 1e2, 1e4])
+    assert dimension_from_spec(svm["gamma"]).values == ["scale", "auto"]
+
+    rf = _specs("random_forest")
+    depth = dimension_from_spec(rf["max_depth"])
+    assert depth.values == [None] and depth.integer and not depth.log
+    assert all(isinstance(v, int) for v in depth.grid(4)[1:])
+
+    # Int lists have no range to derive
+    assert dimension_from_spec(_specs("mlp")["hidden_dims"]) is None
+
+
+def test_random_samples_stay_within_bounds():
+    space = SearchSpace(_specs("xgboost").values(), params=["n_estimators", "learning_rate"])
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        sample = space.sample(rng)
+        assert 10 <= sample["n_estimators"] <= 3000 and isinstance(sample["n_estimators"], int)
+        assert 1e-4 <= sample["learning_rate"] <= 1.0
+
+
+def test_space_rejects_unknown_params():
+    with pytest.raises(ValueError):
+        SearchSpace(_specs("svm").values(), params=["nope"])
+
+
+def test_grid_search_ranks_trials():
+    result = search(
+        RunConfig(dataset_name="iris", algorithm_name="svm"),
+        method="grid",
+        space={"C": [0.001, 1.0, 100.0], "kernel": ["linear", "rbf"]},
+        params=[],
+        max_workers=2,
+    )
+
+    assert len(result.trials) == 6
+    scores = [t.score for t in result.leaderboard]
+    assert scores == sorted(scores, reverse=True)
+    assert result.best.params["C"] != 0.001
+    assert result.to_dict(top=3)["n_trials"] == 6
+
+
+def test_random_search_budget_and_failures():
+    result = search(
+        RunConfig(dataset_name="diabetes", algorithm_name="random_forest", hyperparams={"n_estimators": 10}),
+        method="random",
+        params=["max_depth", "min_samples_leaf"],
+        n_trials=4,
+        metric="rmse",
+        max_workers=1,
+    )
+
+    assert len(result.trials) == 4 and not result.greater_is_better
+    assert all(t.params.keys() == {"max_depth", "min_samples_leaf"} for t in result.trials)
+    board = result.leaderboard
+    assert board[0].score <= board[-1].score
+
+
+def test_time_budget_stops_the_search():
+    result = search(
+        RunConfig(dataset_name="iris", algorithm_name="svm"),
+        method="random",
+        n_trials=12,
+        time_budget=0.0,
+        max_workers=2,
+    )
+    assert result.trials == [] and result.stopped_early
+
+
+def test_time_budget_bounds_running_trials_and_keeps_finished_ones():
+    # Initialize torch once in the parent, so the forked trials do not each pay for it.
+    run_experiment(RunConfig(dataset_name="iris", algorithm_name="mlp", hyperparams={"max_epochs": 1}))
+    result = search(
+        RunConfig(dataset_name="iris", algorithm_name="mlp"),
+        method="grid",
+        params=["max_epochs"],
+        space={"max_epochs": [1, 10000]},
+        time_budget=2.0,
+        max_workers=2,
+    )
+    # The long trial is stopped at the budget; the short one that finished is kept.
+    assert result.elapsed < 15 and result.stopped_early
+    assert [t.params for t in result.trials] == [{"max_epochs": 1}]
+    assert result.trials[0].score is not None
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from ml_core.data_handlers.load_dataset import load_data
+from ml_core.runner import RunConfig, _nested_train_order, run_experiment
+
+
+def test_nested_order_is_a_stratified_permutation():
+    dataset = load_data("iris", test_size=0.3, random_state=0)
+    order = _nested_train_order(dataset, random_state=0)
+
+    np.testing.assert_array_equal(np.sort(order), np.arange(len(dataset.train_index)))
+    np.testing.assert_array_equal(order, _nested_train_order(dataset, random_state=0))
+
+    # Every prefix holds the classes in (about) their train proportions
+    y = dataset.y_train[order]
+    _, counts = np.unique(dataset.y_train, return_counts=True)
+    for n in (15, 30, 60):
+        _, prefix_counts = np.unique(y[:n], return_counts=True)
+        np.testing.assert_allclose(prefix_counts, counts * n / len(y), atol=1)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_learning_curve_run(n_jobs):
+    events = []
+    result = run_experiment(RunConfig(
+        dataset_name="wine",
+        algorithm_name="random_forest",
+        hyperparams={"n_estimators": 20},
+        learning_curve=[1.0, 0.25, 0.5, 0.1],
+        n_jobs=n_jobs,
+        progress=events.append if n_jobs == 1 else None,
+        progress_interval=0,
+    ))
+
+    curve = result["learning_curve"]
+    n_total = curve["n_train_total"]
+    assert [p["fraction"] for p in curve["points"]] == [0.1, 0.25, 0.5, 1.0]
+    assert [p["n_train"] for p in curve["points"]] == [round(f * n_total) for f in (0.1, 0.25, 0.5, 1.0)]
+    for point in curve["points"]:
+        assert point["fit_time"] == point["timings"]["fit"] > 0
+        assert 0 <= point["test_metrics"]["accuracy"] <= 1
+        assert "accuracy" in point["train_metrics"]
+    assert result["metrics"] == curve["points"][-1]["test_metrics"]
+    assert "predictions" not in result
+    if n_jobs == 1:
+        assert [(e["unit"], e["step"], e["total"]) for e in events] == [("fraction", k, 4) for k in range(1, 5)]
+
+
+def test_full_fraction_matches_single_run():
+    config = dict(dataset_name="diabetes", algorithm_name="svm")
+
+    single = run_experiment(RunConfig(**config))
+    curve = run_experiment(RunConfig(**config, learning_curve=[0.5, 1.0], n_jobs=2))
+
+    assert curve["metrics"] == single["metrics"]
+    assert curve["dataset"]["split_fingerprint"] == single["dataset"]["split_fingerprint"]
+
+
+@pytest.mark.parametrize("fractions", [[], [0.0, 0.5], [1.5], ["half"]])
+def test_invalid_fractions(fractions):
+    with pytest.raises(ValueError):
+        run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", learning_curve=fractions))
+
+
+def test_learning_curve_rejects_cv_and_artifacts(tmp_path):
+    with pytest.raises(ValueError):
+        run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", learning_curve=[0.5], cv_folds=3))
+    with pytest.raises(ValueError):
+        run_experiment(RunConfig(
+            dataset_name="iris", algorithm_name="svm", learning_curve=[0.5], artifact_dir=str(tmp_path),
+        ))
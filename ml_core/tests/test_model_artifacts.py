@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ml_core.artifacts import MANIFEST_FILE, load_model, read_manifest
+from ml_core.data_handlers.load_dataset import load_data
+from ml_core.result_cache import get_result_cache
+from ml_core.runner import RunConfig, run_experiment
+
+
+def _run(tmp_path, **config):
+    return run_experiment(RunConfig(artifact_dir=str(tmp_path), include_probabilities=True, **config))
+
+
+@pytest.mark.parametrize(
+    "algorithm, hyperparams, fmt",
+    [
+        ("mlp", {"max_epochs": 5}, "torch"),
+        ("xgboost", {"n_estimators": 10}, "xgboost"),
+        ("random_forest", {"n_estimators": 10}, "joblib"),
+    ],
+)
+def test_saved_model_reproduces_the_run_predictions(tmp_path, algorithm, hyperparams, fmt):
+    result = _run(tmp_path, dataset_name="iris", algorithm_name=algorithm, hyperparams=hyperparams)
+    artifact = result["artifact"]
+    assert artifact["format"] == fmt and "save" in result["timings"]
+
+    model, manifest = load_model(artifact["path"])
+    assert manifest["sha256"] == artifact["sha256"]
+    assert manifest["schema"]["features"]["n_features"] == 4
+    assert manifest["schema"]["target"]["class_labels"] == result["predictions"]["class_labels"]
+
+    X_test = load_data("iris").X_test
+    assert model.predict(X_test).tolist() == result["predictions"]["y_pred"]
+    np.testing.assert_allclose(model.predict_proba(X_test), result["predictions"]["y_proba"], atol=1e-6)
+
+
+def test_regression_mlp_round_trips(tmp_path):
+    result = _run(tmp_path, dataset_name="diabetes", algorithm_name="mlp", hyperparams={"max_epochs": 3})
+    model, _ = load_model(result["artifact"]["path"])
+    np.testing.assert_allclose(model.predict(load_data("diabetes").X_test), result["predictions"]["y_pred"], rtol=1e-5)
+
+
+def test_corrupted_artifact_is_rejected(tmp_path):
+    path = Path(_run(tmp_path, dataset_name="iris", algorithm_name="svm")["artifact"]["path"])
+    manifest = read_manifest(path)
+    (path / manifest["file"]).write_bytes(b"garbage")
+    with pytest.raises(ValueError, match="Checksum"):
+        load_model(path)
+
+
+def test_only_complete_artifacts_are_visible(tmp_path):
+    _run(tmp_path, dataset_name="iris", algorithm_name="svm")
+    entries = list(tmp_path.iterdir())
+    assert len(entries) == 1 and (entries[0] / MANIFEST_FILE).is_file()
+    assert json.loads((entries[0] / MANIFEST_FILE).read_text())["algorithm"]["name"] == "svm"
+
+
+def test_cache_hit_without_artifact_retrains(tmp_path, monkeypatch):
+    monkeypatch.delenv("ML_CORE_RESULT_CACHE_DIR", raising=False)
+    get_result_cache().clear()
+    config = dict(dataset_name="wine", algorithm_name="svm", use_cache=True)
+    run_experiment(RunConfig(**config))
+    first = run_experiment(RunConfig(artifact_dir=str(tmp_path), **config))
+    again = run_experiment(RunConfig(artifact_dir=str(tmp_path), **config))
+    assert not first["cached"] and again["cached"]
+    assert again["artifact"] == first["artifact"]
+
+
+def test_cross_validation_cannot_save_a_model(tmp_path):
+    with pytest.raises(ValueError, match="cross-validation"):
+        _run(tmp_path, dataset_name="iris", algorithm_name="svm", cv_folds=3)
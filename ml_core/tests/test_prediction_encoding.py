@@ -0,0 +1,61 @@
+import json
+
+import numpy as np
+import pytest
+
+from ml_core.common.encoding import decode_array, decode_predictions, encode_array, smallest_dtype
+from ml_core.runner import RunConfig, run_experiment
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        (np.array([0, 1, 2]), "|i1"),
+        (np.array([0, 200]), "|u1"),
+        (np.array([-1, 40_000]), "<i4"),
+        (np.array([True, False]), "|u1"),
+        (np.array([1.0, 3.0]), "<f4"),
+        (np.array([1e20, 3.0]), "<f8"),
+        (np.array([2**63 + 1], dtype=np.uint64), "<u8"),
+        (np.array([0.5, 0.25], dtype=np.float64), "<f4"),
+        (np.array([0.1, np.nan]), "<f8"),
+    ],
+)
+def test_smallest_lossless_dtype(values, dtype):
+    assert smallest_dtype(values).str == dtype
+    np.testing.assert_array_equal(decode_array(encode_array(values)), values)
+
+
+def test_whole_floats_decode_as_floats():
+    decoded = decode_array(encode_array(np.array([151.0, 75.0])))
+    assert decoded.dtype.kind == "f" and decoded.tolist() == [151.0, 75.0]
+
+
+def test_float32_only_when_allowed():
+    values = np.random.default_rng(0).random((10, 3))
+    assert encode_array(values)["dtype"] == "<f8"
+    encoded = encode_array(values, allow_float32=True)
+    assert encoded["dtype"] == "<f4" and encoded["shape"] == [10, 3]
+    np.testing.assert_allclose(decode_array(encoded), values, rtol=1e-6)
+
+
+def test_compact_predictions_decode_to_the_plain_lists():
+    config = dict(
+        dataset_name="breast_cancer", algorithm_name="xgboost", hyperparams={"n_estimators": 20},
+        include_probabilities=True,
+    )
+    plain = run_experiment(RunConfig(**config))["predictions"]
+    compact = run_experiment(RunConfig(compact_predictions=True, **config))["predictions"]
+
+    assert len(json.dumps(compact)) < len(json.dumps(plain)) / 2
+    decoded = decode_predictions(compact)
+    assert decoded["y_true"] == plain["y_true"] and decoded["y_pred"] == plain["y_pred"]
+    assert decoded["class_labels"] == plain["class_labels"]
+    np.testing.assert_allclose(decoded["y_proba"], plain["y_proba"], atol=1e-6)
+
+
+def test_decoding_leaves_plain_predictions_alone():
+    plain = {"y_true": [1, 2], "y_pred": [1, 1]}
+    assert decode_predictions(plain) == plain and decode_predictions(None) is None
+    with pytest.raises(ValueError):
+        decode_array({"y": 1})
@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_wine
+from sklearn.ensemble import RandomForestClassifier
+
+from ml_core.algorithms.classical_algorithms.random_forest import fit_forest
+from ml_core.common.progress import ProgressReporter
+from ml_core.runner import RunConfig, run_experiment
+
+
+def _collect(**config):
+    events = []
+    result = run_experiment(RunConfig(progress=events.append, progress_interval=0.0, **config))
+    return events, result
+
+
+def test_mlp_reports_epochs_with_loss():
+    events, _ = _collect(dataset_name="iris", algorithm_name="mlp", hyperparams={"max_epochs": 5})
+    assert [e["step"] for e in events] == [1, 2, 3, 4, 5]
+    assert all(e["unit"] == "epoch" and e["total"] == 5 and e["loss"] > 0 for e in events)
+
+
+def test_xgboost_reports_boosting_rounds():
+    events, _ = _collect(dataset_name="iris", algorithm_name="xgboost", hyperparams={"n_estimators": 12})
+    assert [e["step"] for e in events] == list(range(1, 13))
+    assert events[-1] == {**events[-1], "unit": "round", "total": 12}
+
+
+def test_random_forest_reports_trees():
+    events, _ = _collect(dataset_name="wine", algorithm_name="random_forest", hyperparams={"n_estimators": 30})
+    assert [e["step"] for e in events] == [3 * k for k in range(1, 11)]
+    assert events[-1]["unit"] == "trees"
+
+
+def test_growing_a_forest_in_steps_matches_a_single_fit():
+    X, y = load_wine(return_X_y=True)
+    stepped = fit_forest(RandomForestClassifier(n_estimators=25, random_state=0), X, y, on_trees=lambda n: None)
+    plain = RandomForestClassifier(n_estimators=25, random_state=0).fit(X, y)
+    assert stepped.n_estimators == 25 and not stepped.warm_start
+    np.testing.assert_array_equal(stepped.predict_proba(X), plain.predict_proba(X))
+
+
+def test_random_forest_progress_is_forwarded_from_the_killable_child():
+    events, _ = _collect(
+        dataset_name="iris", algorithm_name="random_forest", hyperparams={"n_estimators": 20}, time_budget=60,
+    )
+    assert events[-1]["step"] == 20
+
+
+def test_cross_validation_reports_folds():
+    events, _ = _collect(dataset_name="iris", algorithm_name="svm", cv_folds=3, n_jobs=2)
+    assert [(e["unit"], e["step"], e["total"]) for e in events] == [("fold", k, 3) for k in (1, 2, 3)]
+
+
+def test_raising_from_the_callback_aborts_the_run():
+    def stop(event):
+        if event["step"] >= 2:
+            raise RuntimeError("diverging")
+
+    with pytest.raises(RuntimeError, match="diverging"):
+        run_experiment(RunConfig(
+            dataset_name="iris", algorithm_name="mlp", hyperparams={"max_epochs": 50},
+            progress=stop, progress_interval=0.0,
+        ))
+
+
+def test_reporter_throttles_but_keeps_last_step_and_non_finite_values():
+    events = []
+    reporter = ProgressReporter(events.append, min_interval=3600)
+    for step in range(1, 11):
+        reporter.emit("epoch", step, 10, loss=1.0)
+    reporter.emit("epoch", 5, None, loss=math.nan)
+    assert [e["step"] for e in events] == [1, 10, 5]
+
+    with pytest.raises(ValueError):
+        ProgressReporter(events.append, min_interval=-1)
@@ -0,0 +1,69 @@
+import numpy as np
+
+from ml_core import runner
+from ml_core.result_cache import ResultCache, canonical_hash, get_result_cache
+from ml_core.runner import RunConfig, run_experiment
+
+
+def _counting_run(monkeypatch):
+    calls = []
+    original = runner._run
+
+    def counted(config):
+        calls.append(config)
+        return original(config)
+
+    monkeypatch.setattr(runner, "_run", counted)
+    return calls
+
+
+def test_canonical_hash_ignores_key_order_and_numpy_scalars():
+    assert canonical_hash({"a": 1, "b": [1.5]}) == canonical_hash({"b": [np.float64(1.5)], "a": np.int64(1)})
+    assert canonical_hash({"a": 1}) != canonical_hash({"a": 2})
+
+
+def test_identical_runs_are_served_from_cache(monkeypatch):
+    monkeypatch.delenv("ML_CORE_RESULT_CACHE_DIR", raising=False)
+    get_result_cache().clear()
+    calls = _counting_run(monkeypatch)
+
+    first = run_experiment(RunConfig(dataset_name="iris", algorithm_name="random_forest", use_cache=True))
+    # Explicit defaults validate to the same configuration
+    again = run_experiment(RunConfig(
+        dataset_name="iris", algorithm_name="random_forest", hyperparams={"n_estimators": 100}, use_cache=True,
+    ))
+
+    assert len(calls) == 1
+    assert first["cached"] is False and again["cached"] is True
+    assert again["metrics"] == first["metrics"]
+
+    # A different split or an uncached run trains again
+    assert run_experiment(RunConfig(
+        dataset_name="iris", algorithm_name="random_forest", random_state=1, use_cache=True,
+    ))["cached"] is False
+    assert run_experiment(RunConfig(dataset_name="iris", algorithm_name="random_forest"))["cached"] is False
+    assert len(calls) == 3
+
+    get_result_cache().clear()
+
+
+def test_disk_tier_survives_a_new_process_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_RESULT_CACHE_DIR", str(tmp_path))
+    config = RunConfig(dataset_name="diabetes", algorithm_name="svm", use_cache=True)
+    first = run_experiment(config)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    get_result_cache().memory.clear()  # as in a freshly started worker
+    calls = _counting_run(monkeypatch)
+    again = run_experiment(config)
+
+    assert calls == [] and again["cached"] is True
+    assert again["predictions"]["y_pred"] == first["predictions"]["y_pred"]
+
+    get_result_cache().clear()
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path)
+    (tmp_path / "abc.json").write_text("{not json", encoding="utf-8")
+    assert cache.get("abc") is None
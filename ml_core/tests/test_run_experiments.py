@@ -0,0 +1,36 @@
+from ml_core.runner import RunConfig, run_experiments
+
+
+def _configs():
+    return [
+        RunConfig(dataset_name="iris", algorithm_name="svm", include_predictions=False),
+        RunConfig(dataset_name="diabetes", algorithm_name="svm", include_predictions=False),
+        RunConfig(dataset_name="iris", algorithm_name="svm", hyperparams={"bogus": 1}),
+        RunConfig(dataset_name="no_such_dataset", algorithm_name="svm"),
+        RunConfig(dataset_name="iris", algorithm_name="random_forest", include_predictions=False),
+    ]
+
+
+def test_run_experiments_reports_every_config():
+    outcomes = sorted(run_experiments(_configs(), max_workers=3), key=lambda o: o.index)
+
+    assert [o.index for o in outcomes] == [0, 1, 2, 3, 4]
+    assert [o.ok for o in outcomes] == [True, True, False, False, True]
+    assert "bogus" in outcomes[2].error
+    assert outcomes[3].error.startswith("ValueError")
+    assert outcomes[1].result["dataset"]["id"] == "diabetes"
+    assert "accuracy" in outcomes[4].result["metrics"]
+
+
+def test_run_experiments_in_process_keeps_order():
+    outcomes = list(run_experiments(_configs()[:2], max_workers=1))
+    assert [o.index for o in outcomes] == [0, 1]
+    assert all(o.ok for o in outcomes)
+
+
+def test_closing_the_stream_early():
+    configs = [RunConfig(dataset_name="iris", algorithm_name="svm") for _ in range(8)]
+    stream = run_experiments(configs, max_workers=2)
+    first = next(stream)
+    stream.close()
+    assert first.ok
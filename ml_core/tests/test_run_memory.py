@@ -0,0 +1,102 @@
+import multiprocessing as mp
+import threading
+
+import numpy as np
+import pytest
+
+from ml_core.common import profiling
+from ml_core.common.cancellation import Deadline, fit_in_subprocess
+from ml_core.common.profiling import StageTimer, current_rss
+from ml_core.runner import RunConfig, run_experiment
+
+
+pytestmark = pytest.mark.skipif(current_rss() is None, reason="RSS is read from /proc")
+
+
+def test_precise_mode_sees_numpy_allocations():
+    timer = StageTimer(memory="precise")
+    try:
+        with timer.stage("alloc"):
+            a = np.ones(4_000_000)  # 32 MB
+            del a
+    finally:
+        timer.close()
+
+    stats = timer.memory_dict()["stages"]["alloc"]
+    assert stats["heap_peak"] >= 32_000_000
+    assert stats["rss_peak_delta"] >= 0
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        StageTimer(memory="exact")
+
+
+def test_run_reports_memory_per_stage():
+    result = run_experiment(RunConfig(dataset_name="wine", algorithm_name="random_forest"))
+
+    memory = result["memory"]
+    assert memory["mode"] == "sampled"
+    assert {"load", "fit", "predict"} <= set(memory["stages"])
+    assert "heap_peak" not in memory["stages"]["fit"]
+    assert memory["rss_peak"] > 0
+
+
+def test_memory_profile_can_be_disabled_or_precise():
+    off = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", memory_profile=None))
+    assert off["memory"] is None
+
+    precise = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", memory_profile="precise"))
+    assert "heap_peak" in precise["memory"]["stages"]["fit"]
+
+
+def test_cross_validation_memory():
+    result = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", cv_folds=3, n_jobs=3))
+    assert all(f["memory"]["stages"]["fit"] for f in result["cv"]["folds"])
+    assert "fit" in result["memory"]["stages"]
+
+
+def _sampler_threads():
+    return [t for t in threading.enumerate() if t.name == "rss-sampler"]
+
+
+def test_samplers_pause_around_forks():
+    timer = StageTimer(memory="sampled")
+    try:
+        with timer.stage("fork"):
+            assert len(_sampler_threads()) == 1
+            profiling._pause_samplers()
+            try:
+                assert _sampler_threads() == []
+            finally:
+                profiling._resume_samplers()
+            assert len(_sampler_threads()) == 1
+
+            child = mp.get_context("fork").Process(target=np.ones, args=(10,))
+            child.start()
+            child.join()
+            assert child.exitcode == 0 and len(_sampler_threads()) == 1
+    finally:
+        timer.close()
+    assert _sampler_threads() == []
+
+
+def _allocating_fit(model, X, y, emit):
+    block = np.ones(25_000_000)  # 200 MB, freed before the fit returns
+    del block
+    return model
+
+
+@pytest.mark.parametrize("mode", ["sampled", "precise"])
+def test_forked_fit_memory_counts_in_the_parent_stage(mode):
+    timer = StageTimer(memory=mode)
+    try:
+        with timer.stage("fit"):
+            fit_in_subprocess(object(), None, None, Deadline(60), fit=_allocating_fit)
+    finally:
+        timer.close()
+
+    stats = timer.memory_dict()["stages"]["fit"]
+    assert stats["rss_peak_delta"] >= 150_000_000
+    if mode == "precise":
+        assert stats["heap_peak"] >= 150_000_000
@@ -0,0 +1,53 @@
+import pytest
+
+from ml_core.common.profiling import StageTimer
+from ml_core.result_cache import get_result_cache
+from ml_core.runner import RunConfig, run_experiment
+
+
+STAGES = {"load", "build", "fit", "predict", "predict_proba", "evaluate", "total"}
+
+
+def test_stage_timer_accumulates():
+    timer = StageTimer()
+    for _ in range(2):
+        with timer.stage("fit"):
+            pass
+    timer.add({"fit": 1.0, "total": 99.0})
+
+    timings = timer.to_dict()
+    assert 1.0 <= timings["fit"] < 2.0
+    assert timings["total"] < 99.0
+
+
+def test_run_reports_every_stage():
+    result = run_experiment(RunConfig(
+        dataset_name="breast_cancer", algorithm_name="random_forest", include_probabilities=True,
+    ))
+    timings = result["timings"]
+
+    assert set(timings) == STAGES
+    assert all(v >= 0 for v in timings.values())
+    assert timings["fit"] > 0
+    assert sum(v for k, v in timings.items() if k != "total") <= timings["total"]
+
+
+def test_cross_validation_timings_per_fold():
+    result = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", cv_folds=3, n_jobs=1))
+
+    assert set(result["timings"]) == STAGES
+    assert all(set(f["timings"]) == STAGES for f in result["cv"]["folds"])
+    assert result["timings"]["fit"] == pytest.approx(sum(f["timings"]["fit"] for f in result["cv"]["folds"]))
+
+
+def test_cache_hits_report_the_lookup(monkeypatch):
+    monkeypatch.delenv("ML_CORE_RESULT_CACHE_DIR", raising=False)
+    get_result_cache().clear()
+    config = RunConfig(dataset_name="iris", algorithm_name="svm", use_cache=True)
+
+    run_experiment(config)
+    hit = run_experiment(config)
+
+    assert hit["cached"] is True
+    assert set(hit["timings"]) == {"load", "cache_lookup", "total"}
+    get_result_cache().clear()
@@ -0,0 +1,159 @@
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+
+from ml_core import serving
+from ml_core.data_handlers.ingest import ingest_csv
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, load_data
+from ml_core.runner import RunConfig, run_experiment
+from ml_core.serving import MODEL_CACHE, format_csv, format_ndjson, get_model, predict, score_stream
+
+
+@pytest.fixture
+def iris_model(tmp_path):
+    result = run_experiment(RunConfig(
+        dataset_name="iris", algorithm_name="xgboost", hyperparams={"n_estimators": 10},
+        artifact_dir=str(tmp_path), include_probabilities=True,
+    ))
+    MODEL_CACHE.clear()
+    return result
+
+
+def test_predictions_match_the_run(iris_model):
+    X_test = load_data("iris").X_test
+    out = predict(iris_model["artifact"]["path"], X_test.tolist())
+    assert out["predictions"] == iris_model["predictions"]["y_pred"]
+    assert out["class_labels"] == iris_model["predictions"]["class_labels"]
+    assert out["labels"][0] == out["class_labels"][out["predictions"][0]]
+    assert len(out["probabilities"][0]) == 3
+
+
+def test_rows_can_be_keyed_by_feature_name(iris_model):
+    path = iris_model["artifact"]["path"]
+    names = get_model(path).features["names"]
+    row = load_data("iris").X_test[0].tolist()
+    assert predict(path, [dict(zip(names, row))]) == predict(path, [row])
+
+
+def test_models_are_loaded_once(iris_model, monkeypatch):
+    calls = []
+    original = serving.load_model
+    monkeypatch.setattr(serving, "load_model", lambda path: calls.append(path) or original(path))
+    path = iris_model["artifact"]["path"]
+    for _ in range(3):
+        predict(path, [[5.0, 3.0, 1.5, 0.2]], include_probabilities=False)
+    assert len(calls) == 1
+    assert MODEL_CACHE.stats().bytes == iris_model["artifact"]["size"]
+
+
+def test_cache_evicts_by_model_size(iris_model, monkeypatch):
+    monkeypatch.setattr(MODEL_CACHE, "max_bytes", iris_model["artifact"]["size"] - 1)
+    get_model(iris_model["artifact"]["path"])
+    assert len(MODEL_CACHE) == 0
+
+
+@pytest.mark.parametrize(
+    "rows, message",
+    [([], "At least one"), ([[1.0, 2.0]], "4 features"), ([["a", 1, 2, 3]], "numbers"), ([{"x": 1}], "Missing")],
+)
+def test_bad_rows_are_rejected(iris_model, rows, message):
+    with pytest.raises(ValueError, match=message):
+        predict(iris_model["artifact"]["path"], rows)
+
+
+def test_regression_returns_plain_predictions(tmp_path):
+    result = run_experiment(RunConfig(dataset_name="diabetes", algorithm_name="svm", artifact_dir=str(tmp_path)))
+    out = predict(result["artifact"]["path"], load_data("diabetes").X_test[:5].tolist())
+    assert list(out) == ["predictions"]
+    assert out["predictions"] == pytest.approx(result["predictions"]["y_pred"][:5])
+
+
+def _scored_rows(path, data, input_format, **kwargs):
+    return [
+        (start + i, p)
+        for start, out in score_stream(path, io.BytesIO(data), input_format, **kwargs)
+        for i, p in enumerate(out["predictions"])
+    ]
+
+
+def test_csv_is_scored_in_chunks_by_column_name(iris_model):
+    path = iris_model["artifact"]["path"]
+    X_test = load_data("iris").X_test
+    names = get_model(path).features["names"]
+    # Columns shuffled, plus an extra target column that must be ignored.
+    lines = [",".join(["target"] + names[::-1])]
+    lines += [",".join(["0"] + [repr(v) for v in row[::-1]]) for row in X_test.tolist()]
+    data = "\n".join(lines).encode()
+
+    chunks = list(score_stream(path, io.BytesIO(data), "csv", chunk_size=8))
+    assert len(chunks) == -(-(len(X_test) + 1) // 8)
+    scored = _scored_rows(path, data, "csv", chunk_size=8)
+    assert [p for _, p in scored] == iris_model["predictions"]["y_pred"]
+    assert [i for i, _ in scored] == list(range(len(X_test)))
+
+
+@pytest.mark.parametrize("fortran", [False, True])
+def test_npy_is_scored_without_loading_it(iris_model, fortran):
+    X_test = load_data("iris").X_test
+    buffer = io.BytesIO()
+    np.save(buffer, np.asfortranarray(X_test) if fortran else np.ascontiguousarray(X_test))
+    scored = _scored_rows(iris_model["artifact"]["path"], buffer.getvalue(), "npy", chunk_size=7)
+    assert [p for _, p in scored] == iris_model["predictions"]["y_pred"]
+
+
+def test_bad_batch_inputs_are_rejected(iris_model):
+    path = iris_model["artifact"]["path"]
+    with pytest.raises(ValueError, match="feature columns"):
+        list(score_stream(path, io.BytesIO(b"a,b\n1,2\n"), "csv"))
+    with pytest.raises(ValueError, match="Line 3"):
+        list(score_stream(path, io.BytesIO(b"a,b,c,d\n1,2,3,4\n1,2,x,4\n"), "csv"))
+    buffer = io.BytesIO()
+    np.save(buffer, np.zeros((3, 2)))
+    with pytest.raises(ValueError, match="4 columns"):
+        list(score_stream(path, io.BytesIO(buffer.getvalue()), "npy"))
+    with pytest.raises(ValueError, match="Unknown input format"):
+        list(score_stream(path, io.BytesIO(b""), "parquet"))
+
+
+def test_categorical_features_are_encoded_like_at_ingestion(tmp_path, monkeypatch):
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path / "data"))
+    colors = ["red", "blue", "green"]
+    rng = np.random.default_rng(0)
+    lines = ["size,color,label"] + [
+        f"{size:.2f},{colors[c]},{int(c == 2)}" for size, c in zip(rng.normal(size=90), np.arange(90) % 3)
+    ]
+    ingest_csv(io.StringIO("\n".join(lines) + "\n"), "painted")
+    result = run_experiment(RunConfig(
+        dataset_name="painted", algorithm_name="random_forest", hyperparams={"n_estimators": 10},
+        artifact_dir=str(tmp_path / "models"),
+    ))
+    path = result["artifact"]["path"]
+    assert get_model(path).features["categories"] == {"color": colors}
+
+    out = predict(path, [[0.1, "green"], [0.1, "red"]])
+    assert out["labels"] == ["1", "0"]
+    assert predict(path, [{"color": "green", "size": 0.1}])["labels"] == ["1"]
+    scored = _scored_rows(path, "color,size\ngreen,0.1\nred,0.1\n".encode(), "csv")
+    assert [p for _, p in scored] == out["predictions"]
+
+    with pytest.raises(ValueError, match="Unknown value 'purple'"):
+        predict(path, [[0.1, "purple"]])
+    with pytest.raises(ValueError, match="Line 2: Unknown value"):
+        _scored_rows(path, b"size,color\n0.1,purple\n", "csv")
+    DATASET_CACHE.clear()
+
+
+def test_output_formats(iris_model):
+    path = iris_model["artifact"]["path"]
+    data = b"a,b,c,d\n5.1,3.5,1.4,0.2\n6.7,3.0,5.2,2.3\n"
+
+    records = [json.loads(line) for line in "".join(format_ndjson(score_stream(path, io.BytesIO(data)))).splitlines()]
+    assert [r["row"] for r in records] == [0, 1]
+    assert records[0]["label"] == "setosa" and len(records[0]["probabilities"]) == 3
+
+    table = list(csv.reader("".join(format_csv(score_stream(path, io.BytesIO(data), chunk_size=1))).splitlines()))
+    assert table[0] == ["row", "prediction", "label", "proba_setosa", "proba_versicolor", "proba_virginica"]
+    assert [r[0] for r in table[1:]] == ["0", "1"]
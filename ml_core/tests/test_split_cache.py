@@ -0,0 +1,40 @@
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+from ml_core.data_handlers.load_dataset import DATASET_LOADERS, SPLIT_CACHE, load_data
+
+
+def test_split_matches_direct_train_test_split():
+    """
+    Index-based splitting must reproduce the exact partition of
+    train_test_split(X, y, ...) so stored experiments stay comparable.
+    """
+    (X, y), _ = DATASET_LOADERS["wine"]()
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.25, random_state=7, stratify=y
+    )
+
+    dataset = load_data("wine", test_size=0.25, random_state=7)
+
+    np.testing.assert_array_equal(dataset.X_train, X_train)
+    np.testing.assert_array_equal(dataset.X_test, X_test)
+    np.testing.assert_array_equal(dataset.y_train, y_train)
+    np.testing.assert_array_equal(dataset.y_test, y_test)
+
+
+def test_split_indices_are_memoized_and_compact():
+    SPLIT_CACHE.clear()
+
+    first = load_data("diabetes", test_size=0.2, random_state=3)
+    second = load_data("diabetes", test_size=0.2, random_state=3)
+    other = load_data("diabetes", test_size=0.2, random_state=4)
+
+    assert first.train_index is second.train_index
+    assert first.test_index is second.test_index
+    assert other.train_index is not first.train_index
+    assert first.train_index.dtype == np.int32
+    assert not first.train_index.flags.writeable
+
+    stats = SPLIT_CACHE.stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
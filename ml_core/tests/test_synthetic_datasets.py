@@ -0,0 +1,70 @@
+import numpy as np
+
+from ml_core.common.types import TaskType
+from ml_core.data_handlers import synthetic
+from ml_core.data_handlers.load_dataset import DATASET_CACHE, load_data
+from ml_core.data_handlers.store import DatasetStore
+from ml_core.data_handlers.synthetic import SyntheticSpec, generate, load_synthetic, write_synthetic
+from ml_core.runner import RunConfig, run_experiment
+
+
+def test_generation_is_deterministic_and_chunked(monkeypatch):
+    monkeypatch.setattr(synthetic, "BLOCK_ROWS", 100)
+    spec = SyntheticSpec(kind="classification", n_samples=250, n_features=5, n_classes=3, seed=7)
+
+    chunks = list(generate(spec))
+    assert [len(y) for _, y in chunks] == [100, 100, 50]
+
+    X1, y1 = load_synthetic(spec)
+    X2, y2 = load_synthetic(spec)
+    np.testing.assert_array_equal(X1, X2)
+    np.testing.assert_array_equal(y1, y2)
+
+    other_X, _ = load_synthetic(SyntheticSpec(kind="classification", n_samples=250, n_features=5, n_classes=3, seed=8))
+    assert not np.array_equal(X1, other_X)
+
+
+def test_class_balance_follows_weights():
+    for kind in ("classification", "sparse"):
+        spec = SyntheticSpec(kind=kind, n_samples=20_000, n_features=50, n_classes=2, weights=(0.9, 0.1), density=0.2)
+        _, y = load_synthetic(spec)
+        assert spec.task == TaskType.BINARY
+        assert abs(np.mean(y == 1) - 0.1) < 0.02
+
+
+def test_sparse_rows_have_requested_density():
+    spec = SyntheticSpec(kind="sparse", n_samples=2_000, n_features=400, density=0.05, task=TaskType.REGRESSION)
+    X, y = load_synthetic(spec)
+    assert spec.task == TaskType.REGRESSION
+    assert abs(np.count_nonzero(X) / X.size - 0.05) < 0.005
+    assert y.dtype == np.float64
+
+
+def test_write_synthetic_streams_into_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(synthetic, "BLOCK_ROWS", 64)
+    monkeypatch.setenv("ML_CORE_DATA_DIR", str(tmp_path))
+    spec = SyntheticSpec(kind="regression", n_samples=300, n_features=4, seed=3)
+
+    meta = write_synthetic(spec, "synthetic_big")
+
+    X, y, stored_meta = DatasetStore(tmp_path).open("synthetic_big")
+    assert stored_meta == meta
+    assert X.flags.f_contiguous
+    X_mem, y_mem = load_synthetic(spec)
+    np.testing.assert_array_equal(X, X_mem)
+    np.testing.assert_array_equal(y, y_mem)
+
+    assert load_data("synthetic_big").meta.task == TaskType.REGRESSION
+    DATASET_CACHE.clear()
+
+
+def test_runner_on_registered_synthetic_dataset():
+    result = run_experiment(
+        RunConfig(
+            dataset_name="synthetic_classification",
+            algorithm_name="xgboost",
+            hyperparams={"n_estimators": 10},
+            include_predictions=False,
+        )
+    )
+    assert result["metrics"]["accuracy"] > 0.5
@@ -0,0 +1,91 @@
+import pickle
+
+import pytest
+
+from ml_core.common.cancellation import RunTimeout
+from ml_core.runner import RunConfig, run_experiment
+
+
+def _expect_timeout(**config):
+    with pytest.raises(RunTimeout) as info:
+        run_experiment(RunConfig(**config))
+    return info.value.partial
+
+
+def test_mlp_is_cancelled_between_batches():
+    partial = _expect_timeout(
+        dataset_name="synthetic_regression",
+        algorithm_name="mlp",
+        hyperparams={"max_epochs": 10000, "batch_size": 32},
+        time_budget=1.0,
+    )
+    assert partial["stage"] == "fit"
+    assert partial["progress"]["epochs_completed"] < 10000
+    assert partial["elapsed"] >= 1.0
+    assert "fit" in partial["timings"]
+
+
+def test_xgboost_stops_after_a_boosting_round():
+    partial = _expect_timeout(
+        dataset_name="synthetic_classification",
+        algorithm_name="xgboost",
+        hyperparams={"n_estimators": 3000, "max_depth": 12},
+        time_budget=1.0,
+    )
+    assert partial["stage"] == "fit"
+    assert 0 < partial["progress"]["boosting_rounds"] < 3000
+
+
+def test_sklearn_fit_is_killed():
+    partial = _expect_timeout(
+        dataset_name="synthetic_classification",
+        algorithm_name="random_forest",
+        hyperparams={"n_estimators": 2000},
+        time_budget=1.0,
+    )
+    assert partial["killed"] is True
+    assert partial["elapsed"] < 10
+
+
+def test_soft_timeout_stops_forests_between_steps_in_process():
+    partial = _expect_timeout(
+        dataset_name="synthetic_classification",
+        algorithm_name="random_forest",
+        hyperparams={"n_estimators": 2000},
+        time_budget=1.0,
+        hard_timeout=False,
+    )
+    assert "killed" not in partial
+    assert 0 < partial["progress"]["trees_built"] < 2000
+
+
+def test_soft_timeout_checks_other_fits_when_they_finish():
+    result = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", time_budget=60, hard_timeout=False))
+    assert result["metrics"]["accuracy"] > 0.5
+
+
+def test_runs_within_budget_finish_normally():
+    result = run_experiment(RunConfig(dataset_name="iris", algorithm_name="svm", time_budget=60))
+    assert result["metrics"]["accuracy"] > 0.5
+
+    result = run_experiment(RunConfig(
+        dataset_name="iris", algorithm_name="xgboost", hyperparams={"n_estimators": 10}, time_budget=60,
+    ))
+    assert "accuracy" in result["metrics"]
+
+
+def test_timeout_survives_pickling():
+    error = pickle.loads(pickle.dumps(RunTimeout("too slow", {"stage": "fit"})))
+    assert error.partial == {"stage": "fit"} and str(error) == "too slow"
+
+
+def test_cross_validation_budget_covers_all_folds():
+    partial = _expect_timeout(
+        dataset_name="synthetic_classification",
+        algorithm_name="mlp",
+        hyperparams={"max_epochs": 10000},
+        cv_folds=3,
+        n_jobs=3,
+        time_budget=1.0,
+    )
+    assert partial["stage"] == "fit" and "fold" in partial
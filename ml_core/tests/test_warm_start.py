@@ -0,0 +1,128 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from ml_core import runner
+from ml_core.result_cache import get_result_cache
+from ml_core.runner import RunConfig, run_experiment
+from ml_core.warm_start import WARM_START_CACHE, model_nbytes
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    WARM_START_CACHE.clear()
+    yield
+    WARM_START_CACHE.clear()
+
+
+def _config(algorithm, **hyperparams):
+    return RunConfig(
+        dataset_name="wine", algorithm_name=algorithm, hyperparams=hyperparams,
+        warm_start=True, include_probabilities=True,
+    )
+
+
+def _run(algorithm, **hyperparams):
+    return run_experiment(_config(algorithm, **hyperparams))
+
+
+def _cached_model(algorithm, **hyperparams):
+    config = _config(algorithm, **hyperparams)
+    key, budget = runner._budget_key(config, runner._load_dataset(config))
+    cached_budget, model = WARM_START_CACHE.get(key)
+    return model
+
+
+def test_random_forest_grows_the_cached_forest():
+    assert "warm_start" not in _run("random_forest", n_estimators=20, max_depth=4)
+    first_trees = list(_cached_model("random_forest", max_depth=4).estimators_)
+
+    result = _run("random_forest", n_estimators=50, max_depth=4)
+    model = _cached_model("random_forest", max_depth=4)
+    assert result["warm_start"] == {"from_budget": 20, "budget": 50}
+    assert len(model.estimators_) == 50 and model.estimators_[:20] == first_trees
+    assert not model.warm_start
+
+
+def test_xgboost_continues_boosting():
+    _run("xgboost", n_estimators=10)
+    result = _run("xgboost", n_estimators=25)
+    model = _cached_model("xgboost")
+    assert result["warm_start"]["from_budget"] == 10
+    assert model.get_booster().num_boosted_rounds() == 25 and model.n_estimators == 25
+
+    # Same trees as boosting 25 rounds at once.
+    WARM_START_CACHE.clear()
+    fresh = _run("xgboost", n_estimators=25)
+    np.testing.assert_allclose(result["predictions"]["y_proba"], fresh["predictions"]["y_proba"], rtol=1e-5)
+
+
+def test_mlp_resumes_epochs_and_optimizer_state():
+    _run("mlp", max_epochs=3)
+    optimizer = _cached_model("mlp")._optimizer
+    result = _run("mlp", max_epochs=7)
+    model = _cached_model("mlp")
+    assert result["warm_start"] == {"from_budget": 3, "budget": 7}
+    assert len(model.loss_history_) == 7 and model._optimizer is optimizer
+
+
+def test_only_a_larger_budget_of_the_same_config_resumes():
+    _run("random_forest", n_estimators=30, max_depth=4)
+    assert "warm_start" not in _run("random_forest", n_estimators=20, max_depth=4)
+    assert "warm_start" not in _run("random_forest", n_estimators=40, max_depth=5)
+    assert "warm_start" not in run_experiment(RunConfig(
+        dataset_name="wine", algorithm_name="random_forest", hyperparams={"n_estimators": 60, "max_depth": 4},
+    ))
+
+
+def test_resumed_runs_are_not_stored_in_the_result_cache():
+    get_result_cache().clear()
+    config = replace(_config("mlp", max_epochs=5), use_cache=True)
+    run_experiment(replace(config, hyperparams={"max_epochs": 2}))
+    resumed = run_experiment(config)
+    assert resumed["warm_start"]["from_budget"] == 2
+
+    # A later request with the same config gets a fresh fit, not the resumed result.
+    WARM_START_CACHE.clear()
+    again = run_experiment(config)
+    assert not again["cached"] and "warm_start" not in again
+    assert run_experiment(config)["cached"]
+    get_result_cache().clear()
+
+
+def test_model_is_offered_only_after_its_artifact_is_saved(tmp_path, monkeypatch):
+    save = runner._save_artifact
+    cached_while_saving = []
+
+    def checked_save(*args, **kwargs):
+        cached_while_saving.append(len(WARM_START_CACHE))
+        return save(*args, **kwargs)
+
+    monkeypatch.setattr(runner, "_save_artifact", checked_save)
+    run_experiment(replace(_config("random_forest", n_estimators=20), artifact_dir=str(tmp_path)))
+    assert cached_while_saving == [0] and len(WARM_START_CACHE) == 1
+
+
+@pytest.mark.parametrize("algorithm", ["random_forest", "xgboost", "mlp"])
+def test_cached_models_count_their_memory(algorithm):
+    _run(algorithm)
+    assert WARM_START_CACHE.stats().bytes == model_nbytes(_cached_model(algorithm)) > 0
+
+
+def test_models_over_the_byte_limit_are_not_kept(monkeypatch):
+    monkeypatch.setattr(WARM_START_CACHE, "max_bytes", 1000)
+    _run("random_forest", n_estimators=50)
+    assert len(WARM_START_CACHE) == 0
+
+
+def test_models_without_a_budget_are_not_kept():
+    _run("svm")
+    assert len(WARM_START_CACHE) == 0
+
+
+def test_continued_boosting_reports_rounds_of_the_full_budget():
+    _run("xgboost", n_estimators=20)
+    events = []
+    run_experiment(replace(_config("xgboost", n_estimators=50), progress=events.append, progress_interval=0))
+    assert [(e["step"], e["total"]) for e in events] == [(n, 50) for n in range(21, 51)]
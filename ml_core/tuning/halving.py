@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml_core.algorithms.algorithm_registry import AlgorithmVariant
+from ml_core.algorithms.catalog import get_algorithm
+from ml_core.data_handlers.load_dataset import get_dataset_meta
+from ml_core.runner import RunConfig
+from ml_core.tuning.search import LOWER_IS_BETTER, SearchResult, default_metric, run_trials
+from ml_core.tuning.space import SearchSpace
+
+
+DEFAULT_ETA = 3
+
+
+def _budget_spec(variant: AlgorithmVariant):
+    if variant.budget_param is None:
+        raise ValueError(
+            f"Variant {variant.code!r} has no budget hyperparameter; use tuning.search instead."
+        )
+    return next(s for s in variant.hyperparams if s.name == variant.budget_param)
+
+
+def _budget_bounds(
+    variant: AlgorithmVariant,
+    base: RunConfig,
+    min_budget: Optional[int],
+    max_budget: Optional[int],
+    eta: int,
+) -> Tuple[int, int]:
+    """
+    Default max budget: the value in `base.hyperparams`, else the spec default.
+    Default min budget: max budget / eta**3, so four rungs, but never below the spec minimum.
+    """
+    spec = _budget_spec(variant)
+    max_budget = int(max_budget or (base.hyperparams or {}).get(spec.name) or spec.default)
+    floor = int(spec.min or 1)
+    min_budget = int(min_budget or max(floor, round(max_budget / eta ** 3)))
+    if not floor <= min_budget <= max_budget:
+        raise ValueError(
+            f"Budget range for {spec.name!r} must satisfy {floor} <= min_budget <= max_budget, "
+            f"got {min_budget}..{max_budget}."
+        )
+    return min_budget, max_budget
+
+
+def _halving(
+    base: RunConfig,
+    budget_param: str,
+    candidates: List[Dict[str, Any]],
+    trial_ids: List[int],
+    min_budget: int,
+    max_budget: int,
+    eta: int,
+    result: SearchResult,
+    max_workers: Optional[int],
+    deadline: Optional[float],
+) -> None:
+    """
+    One successive-halving bracket: train every candidate at `min_budget`, keep the best
+    1/eta, multiply the budget by eta, and repeat until the max budget is reached.
+    Trials of every rung are appended to `result`.
+    """
+    sign = 1.0 if result.greater_is_better else -1.0
+    budget, rung = min_budget, 0
+    alive = list(range(len(candidates)))
+
+    while alive:
+        configs = [{**candidates[i], budget_param: budget} for i in alive]
+        trials, stopped = run_trials(
+            base, configs, result.metric, [trial_ids[i] for i in alive], max_workers, deadline
+        )
+        for trial in trials:
+            trial.params = candidates[trial_ids.index(trial.trial_id)]
+            trial.budget, trial.rung = budget, rung
+        result.trials.extend(trials)
+        if stopped:
+            result.stopped_early = True
+            return
+        if budget >= max_budget or len(alive) == 1:
+            return
+
+        scored = sorted(
+            (t for t in trials if t.score is not None), key=lambda t: sign * t.score, reverse=True
+        )
+        keep = max(1, len(alive) // eta)
+        alive = [trial_ids.index(t.trial_id) for t in scored[:keep]]
+        budget, rung = min(max_budget, budget * eta), rung + 1
+
+
+def _setup(base: RunConfig, metric: Optional[str]):
+    task = get_dataset_meta(base.dataset_name).task
+    variant = get_algorithm(base.algorithm_name).get_variant(task)
+    metric = metric or default_metric(task)
+    result = SearchResult(metric=metric, greater_is_better=metric.split(".")[-1] not in LOWER_IS_BETTER)
+    return variant, result
+
+
+def _space(variant: AlgorithmVariant, params, space) -> SearchSpace:
+    # The budget is set by the tuner, never sampled.
+    if params is None:
+        params = [s.name for s in variant.hyperparams if s.name != variant.budget_param]
+    return SearchSpace(variant.hyperparams, params=params, overrides=space)
+
+
+def successive_halving(
+    base: RunConfig,
+    n_configs: int = 27,
+    eta: int = DEFAULT_ETA,
+    min_budget: Optional[int] = None,
+    max_budget: Optional[int] = None,
+    params: Optional[Sequence[str]] = None,
+    space: Optional[Dict[str, Sequence[Any]]] = None,
+    metric: Optional[str] = None,
+    time_budget: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    seed: int = 0,
+) -> SearchResult:
+    """
+    Successive halving over `n_configs` random configs of the variant's search space.
+
+    The variant's `budget_param` (max_epochs, n_estimators) is the fidelity: all configs
+    start at `min_budget`, each rung keeps the top 1/`eta` and multiplies the budget
+    by `eta`, up to `max_budget`. Trials carry their `budget` and `rung`; the leaderboard
+    ranks the highest-budget trials first. `params`, `space`, `metric` and `time_budget`
+    work as in `tuning.search.search`.
+    """
+    if eta < 2:
+        raise ValueError("eta must be >= 2.")
+    variant, result = _setup(base, metric)
+    low, high = _budget_bounds(variant, base, min_budget, max_budget, eta)
+    search_space = _space(variant, params, space)
+
+    rng = np.random.default_rng(seed)
+    candidates = [search_space.sample(rng) for _ in range(n_configs)]
+
+    start = time.monotonic()
+    deadline = start + time_budget if time_budget is not None else None
+    _halving(base, variant.budget_param, candidates, list(range(n_configs)), low, high, eta,
+             result, max_workers, deadline)
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def hyperband(
+    base: RunConfig,
+    eta: int = DEFAULT_ETA,
+    min_budget: Optional[int] = None,
+    max_budget: Optional[int] = None,
+    params: Optional[Sequence[str]] = None,
+    space: Optional[Dict[str, Sequence[Any]]] = None,
+    metric: Optional[str] = None,
+    time_budget: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    seed: int = 0,
+) -> SearchResult:
+    """
+    Hyperband: several successive-halving brackets trading the number of configs
+    against their starting budget, from many configs at `min_budget` down to a few
+    configs trained at `max_budget` straight away. Hedges against the low-budget
+    ranking being misleading. Arguments as in `successive_halving`.
+    """
+    if eta < 2:
+        raise ValueError("eta must be >= 2.")
+    variant, result = _setup(base, metric)
+    low, high = _budget_bounds(variant, base, min_budget, max_budget, eta)
+    search_space = _space(variant, params, space)
+    rng = np.random.default_rng(seed)
+
+    s_max = int(math.floor(math.log(high / low, eta) + 1e-9))
+    start = time.monotonic()
+    deadline = start + time_budget if time_budget is not None else None
+    next_id = 0
+    for s in range(s_max, -1, -1):
+        n = int(math.ceil((s_max + 1) / (s + 1) * eta ** s))
+        bracket_min = max(low, int(round(high / eta ** s)))
+        candidates = [search_space.sample(rng) for _ in range(n)]
+        ids = list(range(next_id, next_id + n))
+        next_id += n
+        _halving(base, variant.budget_param, candidates, ids, bracket_min, high, eta,
+                 result, max_workers, deadline)
+        if result.stopped_early:
+            break
+
+    result.elapsed = time.monotonic() - start
+    return result
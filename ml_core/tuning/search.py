@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml_core.algorithms.catalog import get_algorithm
+from ml_core.common.types import TaskType
+from ml_core.data_handlers.load_dataset import get_dataset_meta
+from ml_core.runner import RunConfig, run_experiments
+from ml_core.tuning.space import SearchSpace
+
+
+# Metrics where smaller is better; everything else is maximized.
+LOWER_IS_BETTER = {"mae", "mse", "rmse"}
+
+DEFAULT_GRID_POINTS = 5
+DEFAULT_RANDOM_TRIALS = 20
+
+
+def default_metric(task: TaskType) -> str:
+    return "r2" if task == TaskType.REGRESSION else "accuracy"
+
+
+def metric_value(metrics: Dict[str, Any], metric: str) -> float:
+    """
+    Read a metric from a run's metrics dict; nested keys are joined with dots,
+    e.g. "macro avg.f1-score".
+    """
+    value: Any = metrics
+    for part in metric.split("."):
+        if not isinstance(value, dict) or part not in value:
+            raise ValueError(f"Metric {metric!r} is not in the run metrics.")
+        value = value[part]
+    return float(value)
+
+
+@dataclass
+class Trial:
+    """
+    One evaluated point of the search space.
+    """
+
+    trial_id: int
+    params: Dict[str, Any]
+    score: Optional[float] = None
+    metrics: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cached: bool = False
+    # Multi-fidelity tuners (tuning/halving.py): budget the trial was trained with, and its rung
+    budget: Optional[int] = None
+    rung: Optional[int] = None
+
+
+@dataclass
+class SearchResult:
+    """
+    Outcome of a search: every finished trial plus a leaderboard ranked by score.
+
+    `stopped_early` is True when the wall-clock budget ran out before all trials finished.
+    """
+
+    metric: str
+    greater_is_better: bool
+    trials: List[Trial] = field(default_factory=list)
+    elapsed: float = 0.0
+    stopped_early: bool = False
+
+    @property
+    def leaderboard(self) -> List[Trial]:
+        """
+        Scored trials, best first. Trials trained with a larger budget rank above
+        cheaper ones, since low-budget scores are only a proxy.
+        """
+        sign = -1.0 if self.greater_is_better else 1.0
+        scored = [t for t in self.trials if t.score is not None]
+        return sorted(scored, key=lambda t: (-(t.budget or 0), sign * t.score))
+
+    @property
+    def best(self) -> Optional[Trial]:
+        board = self.leaderboard
+        return board[0] if board else None
+
+    def to_dict(self, top: Optional[int] = None) -> Dict[str, Any]:
+        board = self.leaderboard
+        return {
+            "metric": self.metric,
+            "greater_is_better": self.greater_is_better,
+            "best": asdict(board[0]) if board else None,
+            "leaderboard": [asdict(t) for t in board[:top]],
+            "n_trials": len(self.trials),
+            "n_failed": sum(1 for t in self.trials if t.error is not None),
+            "elapsed": self.elapsed,
+            "stopped_early": self.stopped_early,
+        }
+
+
+def _candidates(
+    space: SearchSpace,
+    method: str,
+    n_trials: Optional[int],
+    grid_points: int,
+    seed: int,
+) -> List[Dict[str, Any]]:
+    if method == "grid":
+        grid = list(space.iter_grid(grid_points))
+        if n_trials is not None and n_trials < len(grid):
+            # Spread a truncated grid over the whole space instead of its first corner.
+            grid = random.Random(seed).sample(grid, n_trials)
+        return grid
+    if method == "random":
+        rng = np.random.default_rng(seed)
+        return [space.sample(rng) for _ in range(n_trials or DEFAULT_RANDOM_TRIALS)]
+    raise ValueError(f"Unknown search method: {method!r}. Use 'grid' or 'random'.")
+
+
+def search(
+    base: RunConfig,
+    method: str = "random",
+    params: Optional[Sequence[str]] = None,
+    space: Optional[Dict[str, Sequence[Any]]] = None,
+    n_trials: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    grid_points: int = DEFAULT_GRID_POINTS,
+    metric: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    seed: int = 0,
+) -> SearchResult:
+    """
+    Grid or random hyperparameter search for `base.algorithm_name` on `base.dataset_name`.
+
+    - the space is built from the variant's HyperparameterSpecs (see tuning/space.py):
+      all searchable params by default, or only `params`; `space` gives explicit values,
+    - `base.hyperparams` are kept fixed unless a searched param overrides them,
+    - trials run in parallel through `run_experiments` (set `base.cv_folds` to score by CV),
+    - at most `n_trials` trials (random search defaults to 20; grid search to the full grid),
+    - every trial runs with the time left of `time_budget` as its own budget, so the search
+      ends once it has passed; trials that did not finish by then are dropped,
+    - `metric` defaults to accuracy (classification) / r2 (regression); nested metrics
+      use dotted keys.
+    """
+    task = get_dataset_meta(base.dataset_name).task
+    variant = get_algorithm(base.algorithm_name).get_variant(task)
+    search_space = SearchSpace(variant.hyperparams, params=params, overrides=space)
+
+    metric = metric or default_metric(task)
+    greater_is_better = metric.split(".")[-1] not in LOWER_IS_BETTER
+    result = SearchResult(metric=metric, greater_is_better=greater_is_better)
+
+    candidates = _candidates(search_space, method, n_trials, grid_points, seed)
+
+    start = time.monotonic()
+    deadline = start + time_budget if time_budget is not None else None
+    result.trials, result.stopped_early = run_trials(
+        base, candidates, metric, list(range(len(candidates))), max_workers, deadline
+    )
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def run_trials(
+    base: RunConfig,
+    candidates: List[Dict[str, Any]],
+    metric: str,
+    trial_ids: List[int],
+    max_workers: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[List[Trial], bool]:
+    """
+    Evaluate hyperparameter candidates on top of `base` in parallel.
+
+    Returns (trials sorted by id, stopped_early). With `deadline` (a time.monotonic()
+    value) every run gets the time left until then as its time budget; runs stopped or
+    not started by then are left out, and stopped_early tells whether there were any.
+    """
+    configs = [
+        replace(
+            base,
+            hyperparams={**(base.hyperparams or {}), **candidate},
+            include_predictions=False,
+            include_probabilities=False,
+        )
+        for candidate in candidates
+    ]
+
+    # Worker processes compare against the wall clock.
+    expires_at = time.time() + (deadline - time.monotonic()) if deadline is not None else None
+
+    trials: List[Trial] = []
+    stopped_early = False
+    outcomes = run_experiments(configs, max_workers=max_workers, expires_at=expires_at)
+    try:
+        for outcome in outcomes:
+            if outcome.timed_out:
+                stopped_early = True
+                continue
+            trials.append(_to_trial(trial_ids[outcome.index], candidates[outcome.index], outcome, metric))
+    finally:
+        outcomes.close()
+
+    trials.sort(key=lambda t: t.trial_id)
+    return trials, stopped_early
+
+
+def _to_trial(trial_id: int, params: Dict[str, Any], outcome, metric: str) -> Trial:
+    trial = Trial(trial_id=trial_id, params=params, error=outcome.error)
+    if outcome.ok:
+        trial.metrics = outcome.result["metrics"]
+        trial.cached = bool(outcome.result.get("cached"))
+        try:
+            trial.score = metric_value(trial.metrics, metric)
+        except ValueError as e:
+            trial.error = str(e)
+    return trial
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from ml_core.common.hyperparameters import HyperparameterSpec
+from ml_core.common.types import ParamType
+
+
+# A numeric range spanning at least this ratio (max / min) is searched on a log scale.
+LOG_SCALE_RATIO = 100.0
+
+
+@dataclass
+class Dimension:
+    """
+    Search range of one hyperparameter, derived from its HyperparameterSpec.
+
+    A dimension is a set of discrete `values` (choices, booleans, None for nullable
+    params) plus an optional numeric range [low, high]. Random sampling first picks
+    one of these branches uniformly, so e.g. gamma draws "scale", "auto" or a number
+    with equal probability.
+    """
+
+    name: str
+    values: List[Any] = field(default_factory=list)
+    low: Optional[float] = None
+    high: Optional[float] = None
+    integer: bool = False
+    log: bool = False
+
+    @property
+    def has_range(self) -> bool:
+        return self.low is not None and self.high is not None
+
+    def grid(self, n_points: int) -> List[Any]:
+        """
+        Discrete values plus `n_points` evenly (or log-evenly) spaced range values.
+        """
+        points: List[Any] = list(self.values)
+        if self.has_range:
+            if self.log:
+                numbers = np.geomspace(self.low, self.high, n_points)
+            else:
+                numbers = np.linspace(self.low, self.high, n_points)
+            for x in numbers:
+                x = int(round(x)) if self.integer else float(x)
+                if x not in points:
+                    points.append(x)
+        return points
+
+    def sample(self, rng: np.random.Generator) -> Any:
+        branch = int(rng.integers(len(self.values) + (1 if self.has_range else 0)))
+        if branch < len(self.values):
+            return self.values[branch]
+        if self.log:
+            x = math.exp(rng.uniform(math.log(self.low), math.log(self.high)))
+        else:
+            x = rng.uniform(self.low, self.high)
+        if self.integer:
+            return int(min(max(round(x), self.low), self.high))
+        return float(x)
+
+
+def dimension_from_spec(spec: HyperparameterSpec) -> Optional[Dimension]:
+    """
+    Build the search dimension of a spec, or None if the spec cannot be searched
+    automatically (free-form strings, int lists, numbers without bounds).
+    """
+    dim = Dimension(name=spec.name)
+    t = spec.type
+
+    if t is ParamType.BOOL:
+        dim.values = [False, True]
+    elif t in (ParamType.CHOICE, ParamType.STRING):
+        if not spec.choices:
+            return None
+        dim.values = list(spec.choices)
+    elif t in (ParamType.INT, ParamType.FLOAT, ParamType.NUMBER_OR_STRING):
+        if t is ParamType.NUMBER_OR_STRING:
+            dim.values = list(spec.choices or [])
+        if spec.min is not None and spec.max is not None:
+            dim.low, dim.high = float(spec.min), float(spec.max)
+            dim.integer = t is ParamType.INT
+            dim.log = dim.low > 0 and dim.high / dim.low >= LOG_SCALE_RATIO
+        elif t is ParamType.NUMBER_OR_STRING and dim.values and isinstance(spec.default, (int, float)):
+            # e.g. max_features: "sqrt" / "log2" or the numeric default
+            dim.values.append(spec.default)
+        elif not dim.values:
+            return None
+    else:
+        return None
+
+    if spec.nullable:
+        dim.values.insert(0, None)
+    return dim
+
+
+class SearchSpace:
+    """
+    Search space over a variant's hyperparameters.
+
+    - `specs`     - the variant's HyperparameterSpecs,
+    - `params`    - names to search (default: every spec that can be searched),
+    - `overrides` - explicit candidate values for some names, e.g. {"hidden_dims": [[32], [64, 64]]};
+                    overridden names are always searched.
+    """
+
+    def __init__(
+        self,
+        specs: Sequence[HyperparameterSpec],
+        params: Optional[Sequence[str]] = None,
+        overrides: Optional[Dict[str, Sequence[Any]]] = None,
+    ) -> None:
+        by_name = {s.name: s for s in specs}
+        overrides = dict(overrides or {})
+        for name in list(params or []) + list(overrides):
+            if name not in by_name:
+                available = ", ".join(sorted(by_name))
+                raise ValueError(f"Unknown hyperparameter {name!r}. Available: {available}")
+
+        names = list(params) if params is not None else list(by_name)
+        names += [n for n in overrides if n not in names]
+
+        self.dimensions: List[Dimension] = []
+        for name in names:
+            if name in overrides:
+                if not overrides[name]:
+                    raise ValueError(f"No candidate values given for {name!r}.")
+                self.dimensions.append(Dimension(name=name, values=list(overrides[name])))
+                continue
+            dim = dimension_from_spec(by_name[name])
+            if dim is None:
+                if params is not None:
+                    raise ValueError(
+                        f"Hyperparameter {name!r} has no searchable range; pass its values explicitly."
+                    )
+                continue
+            self.dimensions.append(dim)
+
+        if not self.dimensions:
+            raise ValueError("The search space is empty.")
+
+    @property
+    def names(self) -> List[str]:
+        return [d.name for d in self.dimensions]
+
+    def grid_size(self, n_points: int) -> int:
+        return math.prod(len(d.grid(n_points)) for d in self.dimensions)
+
+    def iter_grid(self, n_points: int) -> Iterator[Dict[str, Any]]:
+        grids = [d.grid(n_points) for d in self.dimensions]
+        for values in itertools.product(*grids):
+            yield dict(zip(self.names, values))
+
+    def sample(self, rng: np.random.Generator) -> Dict[str, Any]:
+        return {d.name: d.sample(rng) for d in self.dimensions}
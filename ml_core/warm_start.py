@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import torch
+from xgboost import XGBClassifier, XGBRegressor
+
+from ml_core.algorithms.classical_algorithms.random_forest import FOREST_TYPES
+from ml_core.algorithms.deep.mlp import MLPClassifier, MLPRegressor
+from ml_core.common.cache import LRUCache
+
+
+def model_nbytes(model: Any) -> int:
+    """
+    Estimated memory of a fitted model: the node and value arrays of a forest's trees,
+    XGBoost's serialized booster, or the MLP's weights plus its optimizer state.
+    """
+    if isinstance(model, FOREST_TYPES):
+        return sum(
+            tree.tree_.__getstate__()["nodes"].nbytes + tree.tree_.value.nbytes
+            for tree in model.estimators_
+        )
+    if isinstance(model, (XGBClassifier, XGBRegressor)):
+        return len(model.get_booster().save_raw(raw_format="ubj"))
+    if isinstance(model, (MLPClassifier, MLPRegressor)):
+        tensors = list(model.get_state()[1].values())
+        if model._optimizer is not None:
+            tensors += [t for state in model._optimizer.state.values() for t in state.values() if torch.is_tensor(t)]
+        return sum(t.numel() * t.element_size() for t in tensors)
+    return 0
+
+
+# Fitted models of this process, keyed by everything that determines a run except its budget
+# hyperparameter (see runner._budget_key); values are (budget, model). Models are taken out
+# while they are trained further, so concurrent runs never share one. Bounded by count and
+# by estimated memory, so a few large forests cannot exhaust a backend worker.
+WARM_START_CACHE: LRUCache[Tuple[int, Any]] = LRUCache(
+    max_entries=int(os.getenv("ML_CORE_WARM_START_ENTRIES", "8")),
+    max_bytes=int(os.getenv("ML_CORE_WARM_START_BYTES", str(256 * 1024 * 1024))),
+    sizeof=lambda entry: model_nbytes(entry[1]),
+)
+
+
+def can_resume(model: Any) -> bool:
+    return isinstance(model, FOREST_TYPES + (XGBClassifier, XGBRegressor, MLPClassifier, MLPRegressor))
+
+
+def resume(model: Any, budget: int) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Prepare a fitted `model` to be trained further up to `budget` (trees, boosting rounds
+    or epochs in total). Returns (model, fit_params) for `model.fit(X, y, **fit_params)`;
+    call `finish` after the fit.
+
+    - random forest: warm_start adds the missing trees,
+    - xgboost: boosting continues from the existing booster for the missing rounds,
+    - mlp: warm_start continues from the current weights and Adam state.
+    """
+    if isinstance(model, FOREST_TYPES):
+        model.set_params(warm_start=True, n_estimators=budget)
+        return model, {}
+    if isinstance(model, (XGBClassifier, XGBRegressor)):
+        booster = model.get_booster()
+        model.set_params(n_estimators=budget - booster.num_boosted_rounds())
+        return model, {"xgb_model": booster}
+    if isinstance(model, (MLPClassifier, MLPRegressor)):
+        model.warm_start = True
+        model.cfg.max_epochs = budget
+        return model, {}
+    raise ValueError(f"Cannot continue training a {type(model).__name__}.")
+
+
+def finish(model: Any, budget: int) -> None:
+    """
+    Restore the parameters `resume` changed, so the model describes a plain fit of `budget`.
+    """
+    if isinstance(model, FOREST_TYPES):
+        model.set_params(warm_start=False)
+    elif isinstance(model, (XGBClassifier, XGBRegressor)):
+        model.set_params(n_estimators=budget)
+    elif isinstance(model, (MLPClassifier, MLPRegressor)):
+        model.warm_start = False
+
+
+def take(key: Optional[str], budget: Optional[int]) -> Optional[Tuple[int, Any]]:
+    """
+    Remove and return the cached (budget, model) under `key` if it can be trained further
+    up to `budget`; otherwise leave the cache alone and return None.
+    """
+    if key is None or budget is None:
+        return None
+    entry = WARM_START_CACHE.get(key)
+    if entry is None or entry[0] >= budget or not can_resume(entry[1]):
+        return None
+    return WARM_START_CACHE.pop(key)